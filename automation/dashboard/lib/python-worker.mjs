@@ -0,0 +1,175 @@
+/**
+ * Persistent Python worker pool
+ *
+ * Runs scripts/worker.py as long-lived child processes so openpyxl / msoffcrypto /
+ * Pillow stay imported, and calls them asynchronously instead of blocking the event
+ * loop with spawnSync per request.
+ *
+ * Jobs are written to the worker's stdin as JSON lines; results come back on stdout
+ * as length-prefixed frames (see scripts/worker.py for the protocol). Each worker runs
+ * one job at a time; extra jobs wait in a FIFO queue. A worker that dies is dropped
+ * (its job is rejected) and a fresh one is spawned for the next job.
+ */
+
+import { spawn } from 'node:child_process';
+
+// ---------------------------------------------------------------------------
+// Single worker process
+// ---------------------------------------------------------------------------
+
+class PythonWorker {
+  constructor(python, script, { onIdle, onExit }) {
+    this.job = null;
+    this.dead = false;
+    this.buf = Buffer.alloc(0);
+    this.stderr = '';
+    this.onIdle = onIdle;
+    this.onExit = onExit;
+    // Backpressure for onChunk consumers: pausing stdout stops reading frames, the
+    // pipe fills up and the worker blocks on write until resume().
+    this.flow = {
+      pause: () => this.child.stdout.pause(),
+      resume: () => this.child.stdout.resume(),
+    };
+
+    this.child = spawn(python, [script], { stdio: ['pipe', 'pipe', 'pipe'] });
+    this.child.stdout.on('data', (chunk) => this.onData(chunk));
+    this.child.stderr.setEncoding('utf8');
+    this.child.stderr.on('data', (chunk) => {
+      this.stderr = (this.stderr + chunk).slice(-4000);
+    });
+    this.child.stdin.on('error', () => {}); // EPIPE surfaces through 'exit'
+    this.child.on('error', (e) => this.exit(e));
+    this.child.on('exit', (code, signal) => {
+      this.exit(new Error(`python worker exited (${signal || code}): ${this.stderr.slice(-2000)}`));
+    });
+  }
+
+  start(job) {
+    this.job = job;
+    if (job.timeoutMs > 0) {
+      job.timer = setTimeout(() => this.abort(new Error(`python job timed out after ${job.timeoutMs}ms (${job.op})`)), job.timeoutMs);
+    }
+    this.child.stdin.write(`${JSON.stringify({ id: job.id, op: job.op, args: job.args })}\n`);
+  }
+
+  /** Kill the process; the current job is rejected with `error`. */
+  abort(error) {
+    if (this.job && !this.job.error) this.job.error = error;
+    this.child.kill();
+  }
+
+  onData(chunk) {
+    this.buf = this.buf.length ? Buffer.concat([this.buf, chunk]) : chunk;
+    let off = 0;
+    while (this.buf.length - off >= 8) {
+      const headerLen = this.buf.readUInt32BE(off);
+      const bodyLen = this.buf.readUInt32BE(off + 4);
+      const end = off + 8 + headerLen + bodyLen;
+      if (this.buf.length < end) break;
+      const header = JSON.parse(this.buf.toString('utf8', off + 8, off + 8 + headerLen));
+      const body = this.buf.subarray(off + 8 + headerLen, end);
+      off = end;
+      this.onFrame(header, body);
+    }
+    if (off) this.buf = this.buf.subarray(off);
+  }
+
+  onFrame(header, body) {
+    const job = this.job;
+    if (!job || header.id !== job.id || job.error) return;
+    try {
+      if (header.event === 'record') job.onRecord?.(header.record);
+      else if (header.event === 'chunk') job.onChunk?.(body, this.flow);
+      else if (header.event === 'done') this.finish(null, header);
+      else if (header.event === 'error') {
+        const err = new Error(header.message || 'python_job_failed');
+        err.pythonTraceback = header.traceback || '';
+        this.finish(err);
+      }
+    } catch (e) {
+      // A callback refused the output: stop the job rather than reading the rest of it.
+      this.abort(e);
+    }
+  }
+
+  finish(error, result) {
+    const job = this.job;
+    this.job = null;
+    this.flow.resume();
+    clearTimeout(job.timer);
+    if (error) job.reject(error);
+    else job.resolve(result);
+    if (!this.dead) this.onIdle(this);
+  }
+
+  exit(error) {
+    if (this.dead) return;
+    this.dead = true;
+    if (this.job) this.finish(this.job.error || error);
+    this.onExit(this);
+  }
+}
+
+// ---------------------------------------------------------------------------
+// Pool
+// ---------------------------------------------------------------------------
+
+export class PythonWorkerPool {
+  /**
+   * @param {object} opts
+   * @param {string} opts.script   path to scripts/worker.py
+   * @param {number} [opts.size]   max worker processes (spawned lazily)
+   * @param {string} [opts.python] python executable
+   */
+  constructor({ script, size = 2, python = 'python3' }) {
+    this.script = script;
+    this.size = Math.max(1, size);
+    this.python = python;
+    this.workers = [];
+    this.queue = [];
+    this.nextId = 1;
+  }
+
+  /**
+   * Run a job. Resolves with the worker's "done" header (e.g. { count } / { bytes }).
+   *
+   * @param {string} op
+   * @param {object} args
+   * @param {object} [handlers]
+   * @param {(record: object) => void} [handlers.onRecord] per "record" frame; throwing aborts the job
+   * @param {(chunk: Buffer, flow: {pause, resume}) => void} [handlers.onChunk] per "chunk" frame
+   * @param {number} [handlers.timeoutMs] kill the worker if the job runs longer (0 = no limit)
+   */
+  run(op, args = {}, { onRecord, onChunk, timeoutMs = 0 } = {}) {
+    return new Promise((resolve, reject) => {
+      this.queue.push({ id: this.nextId++, op, args, onRecord, onChunk, timeoutMs, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  dispatch() {
+    while (this.queue.length) {
+      let worker = this.workers.find((w) => !w.job && !w.dead);
+      if (!worker && this.workers.length < this.size) {
+        worker = new PythonWorker(this.python, this.script, {
+          onIdle: () => this.dispatch(),
+          onExit: (w) => this.onWorkerExit(w),
+        });
+        this.workers.push(worker);
+      }
+      if (!worker) return;
+      worker.start(this.queue.shift());
+    }
+  }
+
+  onWorkerExit(worker) {
+    this.workers = this.workers.filter((w) => w !== worker);
+    this.dispatch();
+  }
+
+  /** Close stdin of every worker; they exit once their current job is done. */
+  close() {
+    for (const w of this.workers) w.child.stdin.end();
+  }
+}
@@ -168,10 +168,10 @@ $('saveMapping').addEventListener('click', async ()=>{
   }
 });
 
-async function uploadMultipart(url, { file, password }){
+async function uploadMultipart(url, { files, password }){
   const fd = new FormData();
   fd.append('password', password || '');
-  fd.append('file', file);
+  for(const file of files) fd.append('file', file);
   const res = await fetch(url, { method: 'POST', body: fd });
   if(!res.ok) throw new Error(await res.text());
   return res.json();
@@ -179,14 +179,15 @@ async function uploadMultipart(url, { file, password }){
 
 $('importOrders').addEventListener('click', async ()=>{
   $('importMsg').textContent='';
-  const f = $('orderXlsx').files?.[0];
+  const files = Array.from($('orderXlsx').files || []);
   const pw = $('orderPw').value;
-  if(!f){ $('importMsg').textContent='xlsx를 선택해줘'; return; }
+  if(!files.length){ $('importMsg').textContent='xlsx를 선택해줘'; return; }
   if(!pw){ $('importMsg').textContent='암호를 입력해줘'; return; }
   $('importMsg').textContent='업로드/파싱 중…';
   try{
-    const r = await uploadMultipart('/api/admin/orders_xlsx_import', { file: f, password: pw });
-    $('importMsg').textContent = `OK: ${r.imported}건 (총 ${r.totalAfter}건) · 자동배정 ${r.assigned} · 미분류 ${r.unassigned}`;
+    const r = await uploadMultipart('/api/admin/orders_xlsx_import', { files, password: pw });
+    const merged = r.files > 1 ? ` · 파일 ${r.files}개 (중복 ${r.duplicates})` : '';
+    $('importMsg').textContent = `OK: ${r.imported}건 (신규 ${r.new} · 변경 ${r.changed} · 변경없음 ${r.unchanged}) (총 ${r.totalAfter}건) · 자동배정 ${r.assigned} · 미분류 ${r.unassigned}${merged}`;
   }catch(e){
     $('importMsg').textContent = String(e);
   }
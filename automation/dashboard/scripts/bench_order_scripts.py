@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Benchmark the SmartStore order scripts on synthetic fixtures (gen_order_fixtures.py).
+
+Stages, each run in a fresh interpreter so peak RSS is per stage:
+  decrypt        msoffcrypto decrypt of smartstore.xlsx into the spooled temp file
+  parse          parse_smartstore_orders.parse_orders (decrypt + read + extract + fingerprint)
+  export         export_vendor_orders_xlsx.export_xlsx for the largest vendor, via the offset index
+  export_scan    the same export without the index (full orders.json scan)
+  export_all     export_all_vendor_orders.export_all, every vendor (xlsx)
+
+Reports seconds, rows/sec and peak RSS per stage and size. --json writes the results;
+--baseline compares against an earlier --json file and exits 1 when throughput drops or
+peak RSS grows by more than --tolerance.
+
+Usage:
+    python scripts/bench_order_scripts.py --sizes 1k,10k,100k
+    python scripts/bench_order_scripts.py --sizes 100k --json bench.json
+    python scripts/bench_order_scripts.py --sizes 100k --baseline bench.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from gen_order_fixtures import DEFAULT_OUT_DIR, DEFAULT_PASSWORD, generate, parse_size, size_label
+
+STAGES = ("decrypt", "parse", "export", "export_scan", "export_all")
+
+
+class CountingSink:
+    """Write-only binary sink that only counts bytes (keeps disk out of export timings)."""
+
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def largest_vendor(fixture_dir):
+    from order_index import INDEX_DIR_NAME
+
+    index_dir = os.path.join(fixture_dir, INDEX_DIR_NAME)
+    best, best_rows = None, -1
+    for name in os.listdir(index_dir):
+        if name == "_manifest.json":
+            continue
+        with open(os.path.join(index_dir, name), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if len(entry["spans"]) > best_rows:
+            best, best_rows = entry["vendorId"], len(entry["spans"])
+    return best
+
+
+def run_stage(stage, fixture_dir, password):
+    """Run one stage in this process -> {"seconds", "rows", ...}."""
+    xlsx_path = os.path.join(fixture_dir, "smartstore.xlsx")
+    orders_path = os.path.join(fixture_dir, "orders.json")
+
+    if stage == "decrypt":
+        import msoffcrypto
+        from parse_smartstore_orders import DECRYPT_SPOOL_BYTES
+
+        t0 = time.perf_counter()
+        with open(xlsx_path, "rb") as f, tempfile.SpooledTemporaryFile(max_size=DECRYPT_SPOOL_BYTES) as out:
+            off = msoffcrypto.OfficeFile(f)
+            off.load_key(password=password)
+            off.decrypt(out)
+            size = out.tell()
+        with open(os.path.join(fixture_dir, "fixture.json"), "r", encoding="utf-8") as f:
+            rows = json.load(f)["rows"]
+        return {"seconds": time.perf_counter() - t0, "rows": rows, "bytes": size}
+
+    if stage == "parse":
+        from parse_smartstore_orders import parse_orders
+
+        end = {}
+
+        def emit(record):
+            if record["type"] == "end":
+                end.update(record)
+
+        t0 = time.perf_counter()
+        parse_orders(xlsx_path, password, emit, None, None)
+        return {"seconds": time.perf_counter() - t0, "rows": end["rows"]}
+
+    if stage in ("export", "export_scan"):
+        from export_vendor_orders_xlsx import export_xlsx
+
+        vendor_id = largest_vendor(fixture_dir)
+        index_dir = None if stage == "export" else os.path.join(fixture_dir, "no_index")
+        sink = CountingSink()
+        t0 = time.perf_counter()
+        rows = export_xlsx(orders_path, vendor_id, sink, index_dir)
+        return {"seconds": time.perf_counter() - t0, "rows": rows, "bytes": sink.bytes}
+
+    if stage == "export_all":
+        from export_all_vendor_orders import export_all
+
+        out_dir = tempfile.mkdtemp(prefix="bench_export_all.")
+        try:
+            t0 = time.perf_counter()
+            files = export_all(orders_path, out_dir)
+            seconds = time.perf_counter() - t0
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+        return {"seconds": seconds, "rows": sum(f["rows"] for f in files), "files": len(files)}
+
+    raise SystemExit(f"unknown stage: {stage}")
+
+
+def peak_rss_mb():
+    # Linux carries ru_maxrss across exec (it would report the bench parent's peak), so prefer
+    # VmHWM, which starts fresh with the new image. Values are KiB; forked writers count as children.
+    self_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    self_kb = int(line.split()[1])
+    except OSError:
+        pass
+    child_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return round(max(self_kb, child_kb) / 1024, 1)
+
+
+def measure(stage, fixture_dir, password):
+    """Run a stage in a child interpreter and return its result with peak RSS."""
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--stage", stage, "--fixture", fixture_dir, "--password", password],
+        stdout=subprocess.PIPE, check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def compare(results, baseline, tolerance):
+    """Lines describing regressions against `baseline` (same shape as --json output)."""
+    before = {(r["size"], r["stage"]): r for r in baseline.get("results", [])}
+    problems = []
+    for r in results:
+        b = before.get((r["size"], r["stage"]))
+        if not b:
+            continue
+        if r["rows_per_sec"] < b["rows_per_sec"] * (1 - tolerance):
+            problems.append(f"{r['size']} {r['stage']}: {r['rows_per_sec']:,.0f} rows/s (was {b['rows_per_sec']:,.0f})")
+        if r["peak_rss_mb"] > b["peak_rss_mb"] * (1 + tolerance):
+            problems.append(f"{r['size']} {r['stage']}: peak RSS {r['peak_rss_mb']} MB (was {b['peak_rss_mb']} MB)")
+    return problems
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="1k,10k,100k", help="comma-separated row counts (1k, 10k, 100k, 1m, ...)")
+    ap.add_argument("--stages", default=",".join(STAGES))
+    ap.add_argument("--out-dir", default=DEFAULT_OUT_DIR, help="fixture directory (generated on first use)")
+    ap.add_argument("--password", default=DEFAULT_PASSWORD)
+    ap.add_argument("--repeat", type=int, default=1, help="runs per stage; the fastest is reported")
+    ap.add_argument("--json", help="write results to this file")
+    ap.add_argument("--baseline", help="compare against results written earlier with --json")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    # internal: run a single stage in this process and print its result
+    ap.add_argument("--stage", help=argparse.SUPPRESS)
+    ap.add_argument("--fixture", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.stage:
+        result = run_stage(args.stage, args.fixture, args.password)
+        result["peak_rss_mb"] = peak_rss_mb()
+        sys.stdout.write(json.dumps(result))
+        return
+
+    stages = [s for s in args.stages.split(",") if s]
+    for s in stages:
+        if s not in STAGES:
+            raise SystemExit(f"unknown stage: {s} (choose from {', '.join(STAGES)})")
+
+    results = []
+    print(f"{'size':>6}  {'stage':<12} {'rows':>9} {'seconds':>9} {'rows/s':>11} {'peak RSS MB':>12}")
+    for n in [parse_size(s) for s in args.sizes.split(",") if s.strip()]:
+        fixture_dir = generate(n, args.out_dir, args.password)
+        for stage in stages:
+            runs = [measure(stage, fixture_dir, args.password) for _ in range(max(1, args.repeat))]
+            best = min(runs, key=lambda r: r["seconds"])
+            r = {
+                "size": size_label(n),
+                "stage": stage,
+                "rows": best["rows"],
+                "seconds": round(best["seconds"], 4),
+                "rows_per_sec": round(best["rows"] / best["seconds"], 1) if best["seconds"] > 0 else 0.0,
+                "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+            }
+            results.append(r)
+            print(f"{r['size']:>6}  {stage:<12} {r['rows']:>9,} {r['seconds']:>9.3f} "
+                  f"{r['rows_per_sec']:>11,.0f} {r['peak_rss_mb']:>12.1f}", flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            problems = compare(results, json.load(f), args.tolerance)
+        for line in problems:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Export every vendor's orders in one pass.
+
+Input JSON path via ORDERS_JSON_PATH
+Output directory via EXPORT_OUT_DIR (one file per vendor: orders-<username>.xlsx / .csv)
+Vendor accounts via VENDORS_JSON_PATH (optional; files of vendors without a username there,
+  or whose username another vendor already took, are named <vendorId>.xlsx / .csv)
+Format via EXPORT_FORMAT ("xlsx" default, or "csv" = UTF-8 with BOM)
+Parallel writers via EXPORT_JOBS (default: CPU count)
+
+orders.json is read and partitioned by vendorId once; the workbooks are then written
+in parallel by a forkserver (spawn where unavailable) pool, each task receiving its
+vendor's rows instead of re-reading the store (export_vendor_orders_xlsx.py would scan
+it once per vendor). The caller may be the long-lived worker, so the pool never forks it.
+Prints a JSON list of {"vendorId", "file", "rows"} to stdout.
+"""
+
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from export_vendor_orders_xlsx import write_csv, write_xlsx
+
+WRITERS = {'xlsx': write_xlsx, 'csv': write_csv}
+
+
+def partition_orders(orders_path):
+    """Read orders.json once and group its orders by vendorId (unassigned orders are skipped)."""
+    with open(orders_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    parts = {}
+    for o in data.get('orders') or []:
+        vendor_id = o.get('vendorId') if isinstance(o, dict) else None
+        if vendor_id:
+            parts.setdefault(str(vendor_id), []).append(o)
+    return parts
+
+
+def safe_file_name(vendor_id):
+    return re.sub(r'[^\w.-]', '_', vendor_id, flags=re.ASCII).lstrip('.') or '_'
+
+
+def username_file_name(username):
+    """orders-<username> with only the characters file systems reject replaced (Korean names stay)."""
+    return 'orders-' + re.sub(r'[\\/:*?"<>|\x00-\x1f]', '_', username)
+
+
+def load_usernames(vendors_path):
+    """vendors.json -> {vendorId: username}; no path or unreadable file -> {}."""
+    if not vendors_path:
+        return {}
+    try:
+        with open(vendors_path, 'r', encoding='utf-8') as f:
+            vendors = json.load(f).get('vendors') or []
+    except (OSError, ValueError, AttributeError):
+        return {}
+    return {str(v['id']): str(v['username']) for v in vendors
+            if isinstance(v, dict) and v.get('id') and v.get('username')}
+
+
+def _write_one(orders, path, fmt):
+    try:
+        with open(path, 'wb') as f:
+            return WRITERS[fmt](orders, f)
+    except BaseException:
+        # Don't leave a truncated workbook behind for the zip step to pick up.
+        if os.path.exists(path):
+            os.unlink(path)
+        raise
+
+
+def export_all(orders_path, out_dir, fmt='xlsx', jobs=None, usernames=None):
+    """Write one file per vendor into `out_dir`. Returns [{"vendorId", "file", "rows"}].
+
+    Files are named orders-<username>.<fmt> from `usernames` ({vendorId: username}); a vendor
+    without one, or whose name is already taken, gets <vendorId>.<fmt>.
+    """
+    if fmt not in WRITERS:
+        raise SystemExit(f'unsupported format: {fmt}')
+    os.makedirs(out_dir, exist_ok=True)
+    parts = partition_orders(orders_path)
+    # Largest vendors first so one big workbook doesn't start last.
+    vendor_ids = sorted(parts, key=lambda v: len(parts[v]), reverse=True)
+    files = {}
+    used = set()  # casefolded: 'Alpha' and 'alpha' are one file on macOS/Windows
+    usernames = usernames or {}
+    for vendor_id in sorted(vendor_ids, key=lambda v: v not in usernames):
+        name = username_file_name(usernames[vendor_id]) if vendor_id in usernames else None
+        if name is None or name.casefold() in used:
+            name = safe_file_name(vendor_id)
+        while name.casefold() in used:
+            name += '_'
+        used.add(name.casefold())
+        files[vendor_id] = f'{name}.{fmt}'
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(vendor_ids)))
+    if jobs == 1:
+        rows = {v: _write_one(parts[v], os.path.join(out_dir, files[v]), fmt) for v in vendor_ids}
+    else:
+        # Imported here: the writer processes import this module and don't need the xlsx parser's deps.
+        from parse_smartstore_orders import _pool_context
+
+        with ProcessPoolExecutor(jobs, mp_context=_pool_context()) as pool:
+            futures = {v: pool.submit(_write_one, parts[v], os.path.join(out_dir, files[v]), fmt)
+                       for v in vendor_ids}
+            rows = {v: fut.result() for v, fut in futures.items()}
+
+    return [{'vendorId': v, 'file': files[v], 'rows': rows[v]} for v in vendor_ids]
+
+
+def main():
+    orders_path = os.environ.get('ORDERS_JSON_PATH')
+    out_dir = os.environ.get('EXPORT_OUT_DIR')
+    if not orders_path or not out_dir:
+        raise SystemExit('ORDERS_JSON_PATH and EXPORT_OUT_DIR required')
+
+    result = export_all(orders_path, out_dir,
+                        fmt=os.environ.get('EXPORT_FORMAT') or 'xlsx',
+                        jobs=int(os.environ.get('EXPORT_JOBS') or 0) or None,
+                        usernames=load_usernames(os.environ.get('VENDORS_JSON_PATH')))
+    sys.stdout.write(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,13 +3,72 @@
 
 Input JSON path via ORDERS_JSON_PATH
 Filter vendorId via VENDOR_ID
-Output xlsx bytes to stdout.
+Output xlsx bytes to stdout, streamed as rows are written (see xlsx_stream.py).
+
+Only the vendor's rows are read from orders.json, through the per-vendor offset
+index (see order_index.py); without a valid index the whole file is scanned.
 """
 
+import csv
 import io
-import json
 import os
-from openpyxl import Workbook
+import sys
+
+from order_index import iter_vendor_orders
+from xlsx_stream import XlsxStreamWriter
+
+
+HEADER = [
+    '상품주문번호', '주문번호', '상품번호', '상품명', '옵션정보', '수량',
+    '수취인명', '수취인 연락처', '주소',
+    '택배사', '송장번호'
+]
+
+
+def order_row(o):
+    return [
+        o.get('productOrderNo') or '',
+        o.get('orderNo') or '',
+        o.get('productNo') or '',
+        o.get('productName') or '',
+        o.get('optionInfo') or '',
+        o.get('qty') or 0,
+        o.get('recipientName') or '',
+        o.get('recipientPhone') or '',
+        o.get('recipientAddress') or '',
+        o.get('carrier') or '',
+        o.get('trackingNumber') or '',
+    ]
+
+
+def write_xlsx(orders, out):
+    """Write `orders` (any iterable) to `out` as xlsx. Returns the row count."""
+    count = 0
+    with XlsxStreamWriter(out, 'orders') as xw:
+        xw.append(HEADER)
+        for o in orders:
+            xw.append(order_row(o))
+            count += 1
+    return count
+
+
+def write_csv(orders, out):
+    """Write `orders` to `out` (binary) as UTF-8 CSV with a BOM so Excel detects the encoding."""
+    text = io.TextIOWrapper(out, encoding='utf-8-sig', newline='', write_through=True)
+    w = csv.writer(text)
+    w.writerow(HEADER)
+    count = 0
+    for o in orders:
+        w.writerow(order_row(o))
+        count += 1
+    text.flush()
+    text.detach()
+    return count
+
+
+def export_xlsx(orders_path, vendor_id, out, index_dir=None):
+    """Write the vendor's orders from orders.json to `out` as xlsx. Returns the row count."""
+    return write_xlsx(iter_vendor_orders(orders_path, vendor_id, index_dir), out)
 
 
 def main():
@@ -18,41 +77,8 @@ def main():
     if not orders_path or not vendor_id:
         raise SystemExit('ORDERS_JSON_PATH and VENDOR_ID required')
 
-    with open(orders_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    rows = [o for o in (data.get('orders') or []) if o.get('vendorId') == vendor_id]
-
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'orders'
-
-    header = [
-        '상품주문번호', '주문번호', '상품번호', '상품명', '옵션정보', '수량',
-        '수취인명', '수취인 연락처', '주소',
-        '택배사', '송장번호'
-    ]
-    ws.append(header)
-
-    for o in rows:
-        ws.append([
-            o.get('productOrderNo') or '',
-            o.get('orderNo') or '',
-            o.get('productNo') or '',
-            o.get('productName') or '',
-            o.get('optionInfo') or '',
-            o.get('qty') or 0,
-            o.get('recipientName') or '',
-            o.get('recipientPhone') or '',
-            o.get('recipientAddress') or '',
-            o.get('carrier') or '',
-            o.get('trackingNumber') or '',
-        ])
-
-    out = io.BytesIO()
-    wb.save(out)
-    out.seek(0)
-    os.write(1, out.read())
+    export_xlsx(orders_path, vendor_id, sys.stdout.buffer)
+    sys.stdout.buffer.flush()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Generate synthetic SmartStore exports and orders.json fixtures for benchmarks.
+
+For every requested size N this writes <out-dir>/<label>/ with
+  smartstore.xlsx   password-encrypted SmartStore shipping export, N order rows
+                    (shared strings + string dates, like a real download)
+  orders.json       the same orders in the server's store format (JSON.stringify(data, null, 2))
+  orders_index/     per-vendor offset index for orders.json (see order_index.py)
+
+Data is deterministic for a given --seed and contains no real customer data.
+
+Usage:
+    python scripts/gen_order_fixtures.py --sizes 1k,10k,100k,1m --out-dir data/bench
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+from msoffcrypto.format.ooxml import OOXMLFile
+
+from order_index import INDEX_DIR_NAME, index_key
+from xlsx_stream import XlsxStreamWriter
+
+DEFAULT_OUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "bench")
+DEFAULT_PASSWORD = "bench1234"
+
+HEADER = [
+    "상품주문번호", "주문번호", "주문일시", "주문상태", "배송속성", "클레임상태",
+    "상품번호", "상품명", "옵션정보", "수량", "구매자명", "구매자ID",
+    "수취인명", "수취인연락처1", "통합배송지",
+]
+
+STATUSES = ("결제완료", "결제완료", "결제완료", "발송대기", "배송중", "배송완료")
+CLAIMS = (None,) * 19 + ("취소요청",)
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = ("민준", "서연", "도윤", "지우", "하준", "서윤", "시우", "지민", "예준", "하은", "주원", "수아")
+CITIES = ("서울특별시 강남구 테헤란로", "서울특별시 마포구 월드컵로", "부산광역시 해운대구 센텀중앙로",
+          "경기도 성남시 분당구 판교역로", "대구광역시 수성구 동대구로", "인천광역시 연수구 컨벤시아대로")
+CATEGORIES = ("유기농 현미", "제주 감귤", "수제 그래놀라", "국산 들기름", "햇 고구마", "저당 잼")
+OPTIONS = ("기본", "1kg", "2kg", "5kg", "선물포장", "대용량 x2")
+
+
+def parse_size(text):
+    """'1k' -> 1000, '1m' -> 1000000, '2500' -> 2500."""
+    text = text.strip().lower()
+    mult = {"k": 1000, "m": 1000000}.get(text[-1:], 1)
+    return int(float(text[:-1] if mult > 1 else text) * mult)
+
+
+def size_label(n):
+    if n >= 1000000 and n % 1000000 == 0:
+        return f"{n // 1000000}m"
+    if n >= 1000 and n % 1000 == 0:
+        return f"{n // 1000}k"
+    return str(n)
+
+
+def iter_rows(n, seed, vendors):
+    """Yield (xlsx row, store order) pairs for n synthetic order lines."""
+    rnd = random.Random(seed)
+    products = [(f"{8000000000 + i}", f"{CATEGORIES[i % len(CATEGORIES)]} {i + 1}호") for i in range(500)]
+    # ~5% of products are not mapped to a vendor, like a fresh catalogue
+    product_vendor = {no: (None if i % 20 == 19 else f"vendor_bench_{i % vendors:02d}")
+                      for i, (no, _) in enumerate(products)}
+    start = datetime.datetime(2026, 1, 1, 9, 0, 0)
+    order_no = 2026010100000000
+    now = "2026-01-01T00:00:00.000Z"
+
+    for i in range(n):
+        if i == 0 or rnd.random() < 0.6:  # ~1.7 lines per order
+            order_no += 1
+            ordered_at = start + datetime.timedelta(seconds=i * 7)
+            buyer = rnd.choice(SURNAMES) + rnd.choice(GIVEN)
+            buyer_id = "".join(rnd.choices(string.ascii_lowercase, k=4)) + "****"
+            recipient = buyer if rnd.random() < 0.7 else rnd.choice(SURNAMES) + rnd.choice(GIVEN)
+            phone = f"010-{rnd.randrange(10000):04d}-{rnd.randrange(10000):04d}"
+            address = f"{rnd.choice(CITIES)} {rnd.randrange(1, 999)}, {rnd.randrange(101, 120)}동 {rnd.randrange(101, 2500)}호"
+        product_no, product_name = rnd.choice(products)
+        option = f"옵션: {rnd.choice(OPTIONS)}"
+        qty = rnd.choice((1, 1, 1, 2, 3))
+        product_order_no = str(2026010100000000 + i)
+
+        row = [
+            product_order_no, str(order_no), ordered_at.strftime("%Y-%m-%d %H:%M:%S"),
+            rnd.choice(STATUSES), "일반배송", rnd.choice(CLAIMS),
+            product_no, product_name, option, qty, buyer, buyer_id,
+            recipient, phone, address,
+        ]
+        vendor_id = product_vendor[product_no]
+        order = {
+            "id": product_order_no,
+            "productOrderNo": product_order_no,
+            "orderNo": str(order_no),
+            "productNo": product_no,
+            "productName": product_name,
+            "optionInfo": option,
+            "qty": qty,
+            "recipientName": recipient,
+            "recipientPhone": phone,
+            "recipientAddress": address,
+            "vendorId": vendor_id,
+            "status": "assigned" if vendor_id else "new",
+            "carrier": None,
+            "trackingNumber": "",
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        yield row, order
+
+
+def write_encrypted_xlsx(rows, path, password, header=HEADER):
+    """Write rows as a shipping export (or under `header`) and encrypt it like a SmartStore download."""
+    with tempfile.TemporaryFile() as plain:
+        with XlsxStreamWriter(plain, "주문조회", shared_strings=True) as xw:
+            xw.append(header)
+            for row in rows:
+                xw.append(row)
+        plain.seek(0)
+        try:
+            with open(f"{path}.tmp", "wb") as out:
+                OOXMLFile(plain).encrypt(password, out)
+        except BaseException:
+            if os.path.exists(f"{path}.tmp"):
+                os.unlink(f"{path}.tmp")
+            raise
+    os.replace(f"{path}.tmp", path)
+
+
+class OrdersJsonWriter:
+    """Stream {"orders": [...]} in the server's JSON.stringify(data, null, 2) layout and
+    record each vendor's order byte spans for the offset index."""
+
+    def __init__(self, path):
+        self.path = path
+        self.f = open(f"{path}.tmp", "wb")
+        self.offset = 0
+        self.count = 0
+        self.vendors = {}
+        self._write('{\n  "orders": [')
+
+    def _write(self, text):
+        data = text.encode("utf-8")
+        self.f.write(data)
+        self.offset += len(data)
+
+    def append(self, order):
+        self._write(",\n    " if self.count else "\n    ")
+        text = json.dumps(order, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+        vendor_id = order.get("vendorId")
+        if vendor_id:
+            v = self.vendors.get(vendor_id)
+            if v is None:
+                v = self.vendors[vendor_id] = {"spans": [], "hash": hashlib.sha1()}
+            data = text.encode("utf-8")
+            v["spans"].append([self.offset, len(data)])
+            v["hash"].update(data)
+        self._write(text)
+        self.count += 1
+
+    def discard(self):
+        """Drop the partial output (generation failed)."""
+        self.f.close()
+        if os.path.exists(f"{self.path}.tmp"):
+            os.unlink(f"{self.path}.tmp")
+
+    def close(self):
+        self._write("\n  ]\n}" if self.count else "]\n}")
+        self.f.close()
+        os.replace(f"{self.path}.tmp", self.path)
+        self._write_index()
+
+    def _write_index(self):
+        index_dir = os.path.join(os.path.dirname(self.path), INDEX_DIR_NAME)
+        os.makedirs(index_dir, exist_ok=True)
+        for name in os.listdir(index_dir):
+            os.unlink(os.path.join(index_dir, name))
+        st = os.stat(self.path)
+        meta = {"size": st.st_size, "mtimeMs": st.st_mtime_ns / 1e6}
+        for vendor_id, v in self.vendors.items():
+            with open(os.path.join(index_dir, f"{index_key(vendor_id)}.json"), "w", encoding="utf-8") as f:
+                json.dump({"vendorId": vendor_id, **meta, "hash": v["hash"].hexdigest(), "spans": v["spans"]}, f)
+        with open(os.path.join(index_dir, "_manifest.json"), "w", encoding="utf-8") as f:
+            json.dump({**meta, "vendors": len(self.vendors)}, f)
+
+
+def generate(n, out_dir, password=DEFAULT_PASSWORD, vendors=20, seed=1, force=False):
+    """Write the fixture set for n rows into out_dir/<label>/ (skipped if present). Returns the dir."""
+    fixture_dir = os.path.join(out_dir, size_label(n))
+    xlsx_path = os.path.join(fixture_dir, "smartstore.xlsx")
+    orders_path = os.path.join(fixture_dir, "orders.json")
+    meta_path = os.path.join(fixture_dir, "fixture.json")
+    meta = {"rows": n, "password": password, "vendors": vendors, "seed": seed}
+    if not force and os.path.exists(meta_path):
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                if json.load(f) == meta:
+                    return fixture_dir
+        except (OSError, ValueError):
+            pass
+
+    os.makedirs(fixture_dir, exist_ok=True)
+    orders = OrdersJsonWriter(orders_path)
+
+    def rows():
+        for row, order in iter_rows(n, seed, vendors):
+            orders.append(order)
+            yield row
+
+    try:
+        write_encrypted_xlsx(rows(), xlsx_path, password)
+    except BaseException:
+        orders.discard()
+        raise
+    orders.close()
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    return fixture_dir
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="1k,10k,100k", help="comma-separated row counts (1k, 10k, 100k, 1m, ...)")
+    ap.add_argument("--out-dir", default=DEFAULT_OUT_DIR)
+    ap.add_argument("--password", default=DEFAULT_PASSWORD)
+    ap.add_argument("--vendors", type=int, default=20)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--force", action="store_true", help="regenerate even if the fixture exists")
+    args = ap.parse_args()
+
+    for n in [parse_size(s) for s in args.sizes.split(",") if s.strip()]:
+        t0 = time.perf_counter()
+        path = generate(n, args.out_dir, args.password, args.vendors, args.seed, args.force)
+        print(f"{size_label(n):>6}  {path}  ({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Pillow image preparation for Instagram card assets (run inside worker.py).
+
+prepare_image() converts an uploaded product image to the format the card renderer
+embeds reliably and downscales it to fit the card (1080x1350 by default):
+
+  - JPEG sources use Image.draft(), so libjpeg decodes straight at 1/2, 1/4 or 1/8
+    scale instead of inflating the full-size photo first;
+  - what is still much larger than the card is shrunk with Image.reduce() (integer box
+    reduction), and only the last step is a LANCZOS resize;
+  - EXIF orientation is applied so phone photos are not rendered sideways.
+
+Results are cached by content hash (source bytes + options) in cache_dir, so an image
+that was already prepared is copied from the cache instead of being converted again.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+from PIL import ExifTags, Image, ImageOps
+
+CARD_SIZE = (1080, 1350)
+CACHE_MAX_FILES = 500
+_HASH_CHUNK = 1024 * 1024
+_EXT = {"PNG": ".png", "JPEG": ".jpg", "WEBP": ".webp"}
+
+
+def content_key(src, options):
+    """blake2b of the source bytes and the options that affect the output."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(src, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(block)
+    h.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _fit(size, max_size):
+    """Target size for `size` to fit inside max_size (aspect kept), or None if it already fits."""
+    (w, h), (max_w, max_h) = size, max_size
+    if w <= max_w and h <= max_h:
+        return None
+    scale = min(max_w / w, max_h / h)
+    return max(1, round(w * scale)), max(1, round(h * scale))
+
+
+def _convert(src, dst, fmt, max_size, quality):
+    with Image.open(src) as img:
+        if max_size and img.format == "JPEG":
+            # Decoder-side scaling (result stays >= target); must happen before anything loads pixels.
+            rotated = img.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8)
+            target = _fit(img.size, max_size[::-1] if rotated else max_size)
+            if target:
+                img.draft(None, target)
+        img = ImageOps.exif_transpose(img)  # loads the (drafted) pixels; applies phone orientation
+
+        target = _fit(img.size, max_size) if max_size else None
+        if target:
+            # Integer box reduction down to ~2x the target, then one LANCZOS pass
+            # (the same split Image.thumbnail makes with reducing_gap=2).
+            factor = min(img.width // target[0], img.height // target[1]) // 2
+            if factor >= 2:
+                img = img.reduce(factor)
+            img = img.resize(target, Image.Resampling.LANCZOS)
+
+        if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        elif fmt == "PNG" and img.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+            img = img.convert("RGBA")
+        save_args = {"quality": quality} if fmt in ("JPEG", "WEBP") else {}
+        img.save(dst, format=fmt, **save_args)
+        return img.width, img.height
+
+
+def _prune_cache(cache_dir, keep=CACHE_MAX_FILES):
+    """Drop the least recently used entries past `keep` (hits refresh the mtime)."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".tmp"):
+            continue
+        try:
+            entries.append((os.stat(os.path.join(cache_dir, name)).st_mtime, name))
+        except OSError:
+            pass
+    if len(entries) <= keep:
+        return
+    entries.sort()
+    for _, name in entries[:len(entries) - keep]:
+        try:
+            os.unlink(os.path.join(cache_dir, name))
+        except OSError:
+            pass
+
+
+def prepare_image(src, dst, format="PNG", max_size=CARD_SIZE, quality=90, cache_dir=None):
+    """Convert/downscale `src` into `dst`. Returns {width, height, cached}."""
+    fmt = str(format or "PNG").upper()
+    if fmt == "JPG":
+        fmt = "JPEG"
+    if fmt not in _EXT:
+        raise ValueError(f"unsupported image format: {format}")
+    max_size = tuple(max_size) if max_size else None
+
+    if not cache_dir:
+        width, height = _convert(src, dst, fmt, max_size, quality)
+        return {"width": width, "height": height, "cached": False}
+
+    os.makedirs(cache_dir, exist_ok=True)
+    key = content_key(src, {"format": fmt, "max_size": max_size, "quality": quality})
+    cached = os.path.join(cache_dir, key + _EXT[fmt])
+    hit = os.path.exists(cached)
+    if hit:
+        os.utime(cached)
+    else:
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        try:
+            _convert(src, tmp, fmt, max_size, quality)
+            os.replace(tmp, cached)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        _prune_cache(cache_dir)
+
+    if os.path.abspath(dst) != os.path.abspath(cached):
+        shutil.copyfile(cached, dst)
+    with Image.open(cached) as img:
+        return {"width": img.width, "height": img.height, "cached": hit}
+
+
+def prepare_images(items, emit, cache_dir=None):
+    """Prepare many images; emit({"index", "ok", ...}) per item. A failing item does not stop the batch.
+
+    Each item is {src, dst, format?, max_size?, quality?}. Returns the number of items that succeeded.
+    """
+    ok = 0
+    for i, item in enumerate(items):
+        try:
+            result = prepare_image(item["src"], item["dst"], item.get("format") or "PNG",
+                                   item.get("max_size", CARD_SIZE), item.get("quality") or 90,
+                                   cache_dir=item.get("cache_dir", cache_dir))
+            emit({"index": i, "ok": True, **result})
+            ok += 1
+        except Exception as e:
+            emit({"index": i, "ok": False, "error": str(e) or type(e).__name__})
+    return ok
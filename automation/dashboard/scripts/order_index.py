@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Read vendor orders from orders.json through the per-vendor offset index.
+
+server.mjs (saveOrders) writes data/orders_index/ next to orders.json:
+  _manifest.json         {"size", "mtimeMs", "vendors"}  orders.json stat the index was built for
+  <index_key(v)>.json    {"vendorId", "size", "mtimeMs", "hash", "spans": [[offset, length], ...]}
+
+Each span is the byte range of one order object inside orders.json, so a vendor's
+orders are read with one seek + read each instead of loading the whole file.
+When the manifest is missing or doesn't match the opened file (orders.json written
+by something else, or replaced mid-read), readers fall back to a full scan.
+"""
+
+import hashlib
+import json
+import os
+
+INDEX_DIR_NAME = 'orders_index'
+
+
+def index_key(vendor_id):
+    return hashlib.sha1(str(vendor_id).encode('utf-8')).hexdigest()[:16]
+
+
+def default_index_dir(orders_path):
+    return os.path.join(os.path.dirname(os.path.abspath(orders_path)), INDEX_DIR_NAME)
+
+
+def _load(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _matches(meta, st):
+    return (isinstance(meta, dict) and meta.get('size') == st.st_size
+            and abs(float(meta.get('mtimeMs') or 0) - st.st_mtime_ns / 1e6) < 1)
+
+
+def vendor_entry(index_dir, vendor_id, st):
+    """Index entry for `vendor_id` valid for file stat `st`.
+
+    {'spans': []} if the vendor has no orders, None if the index is missing or stale.
+    """
+    if not _matches(_load(os.path.join(index_dir, '_manifest.json')), st):
+        return None
+    entry = _load(os.path.join(index_dir, f'{index_key(vendor_id)}.json'))
+    if entry is None:
+        return {'spans': []}
+    if not _matches(entry, st) or entry.get('vendorId') != vendor_id:
+        return None
+    return entry
+
+
+def iter_vendor_orders(orders_path, vendor_id, index_dir=None):
+    """Yield the vendor's orders in file order (indexed reads, or a full scan if the index is stale)."""
+    index_dir = index_dir or default_index_dir(orders_path)
+    with open(orders_path, 'rb') as f:
+        entry = vendor_entry(index_dir, vendor_id, os.fstat(f.fileno()))
+        if entry is not None:
+            for offset, length in entry.get('spans') or ():
+                f.seek(offset)
+                yield json.loads(f.read(length))
+            return
+        data = json.load(f)
+
+    for o in data.get('orders') or []:
+        if o.get('vendorId') == vendor_id:
+            yield o
@@ -1,93 +1,482 @@
 #!/usr/bin/env python3
-"""Parse encrypted SmartStore order XLSX (downloaded with password) into JSON.
+"""Parse encrypted SmartStore order XLSX (downloaded with password) into NDJSON.
 
-Input: path to encrypted xlsx
-Password: SMARTSTORE_XLSX_PASSWORD env
-Output: JSON to stdout
-
-NOTE: This is MVP parsing for the '주문조회' export we saw.
+Reads SMARTSTORE_XLSX_PATH (several paths separated by os.pathsep are parsed in parallel
+and merged) with SMARTSTORE_XLSX_PASSWORD and writes a sheet record, one item per
+new/changed order row and an end record to stdout. Inputs, record formats, fingerprints
+and the schema cache are described in the dashboard README ("SmartStore order import").
 """
 
-import io
+import datetime
+import hashlib
 import json
+import multiprocessing
 import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
 
 import msoffcrypto
 from openpyxl import load_workbook
 
+# Decrypted workbook is kept in memory up to this size, then spilled to a temp file.
+DECRYPT_SPOOL_BYTES = 16 * 1024 * 1024
 
-def main():
-    pw = os.environ.get("SMARTSTORE_XLSX_PASSWORD")
-    if not pw:
-        raise SystemExit("SMARTSTORE_XLSX_PASSWORD missing")
+SCHEMA_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "smartstore_schemas.json"
+SCHEMA_CACHE_VERSION = 2  # bump when FIELD_SPECS, SCHEMAS or STATUS_TIME_HEADERS change
 
-    src = os.environ.get("SMARTSTORE_XLSX_PATH")
-    if not src:
-        raise SystemExit("SMARTSTORE_XLSX_PATH missing")
+# Output field -> header alternatives (first whose columns all exist wins; multi-column
+# alternatives are joined with a space) -> converter name.
+FIELD_SPECS = (
+    ("product_order_no", (("상품주문번호",),), "str"),
+    ("order_no", (("주문번호",),), "str_or_empty"),
+    ("ordered_at", (("주문일시",), ("주문일",), ("결제일",)), "datetime"),
+    ("order_status", (("주문상태",),), "raw"),
+    ("shipping_attr", (("배송속성",),), "raw"),
+    ("claim_status", (("클레임상태",),), "raw"),
+    ("product_no", (("상품번호",),), "str_or_empty"),
+    ("product_name", (("상품명",),), "raw"),
+    ("option_info", (("옵션정보",),), "raw"),
+    ("qty", (("수량",),), "int"),
+    ("buyer_name", (("구매자명",),), "raw"),
+    ("buyer_id", (("구매자ID",),), "raw"),
+    ("recipient_name", (("수취인명",),), "raw"),
+    ("recipient_phone", (("수취인연락처1",), ("수취인 연락처1",), ("수취인연락처",), ("수취인 연락처",)), "text"),
+    ("recipient_address", (("통합배송지",), ("배송지",), ("기본배송지", "상세배송지"), ("주소",)), "text"),
+)
 
-    p = Path(src)
-    if not p.exists():
-        raise SystemExit(f"file not found: {p}")
+# Dates of an order's latest status or claim change. When several exports in a batch carry
+# the same 상품주문번호, the row with the latest of these wins (see parse_orders_batch).
+STATUS_TIME_HEADERS = (
+    "최종상태변경일", "클레임요청일", "클레임 요청일", "취소요청일", "반품요청일", "교환요청일",
+    "발주확인일", "발송처리일", "배송완료일", "구매확정일",
+)
 
-    with p.open("rb") as f:
-        off = msoffcrypto.OfficeFile(f)
-        off.load_key(password=pw)
-        out = io.BytesIO()
-        off.decrypt(out)
+# Known export formats, recognised by the columns they must have (checked in order).
+SCHEMAS = (
+    ("shipping", ("상품주문번호", "수취인명", "통합배송지")),
+    ("shipping", ("상품주문번호", "수취인명", "기본배송지")),
+    ("order_lookup", ("상품주문번호", "주문번호", "주문일시", "주문상태")),
+    ("generic", ("상품주문번호",)),
+)
+
+
+def _to_str(v):
+    return str(v) if v not in (None, "") else None
 
-    out.seek(0)
-    wb = load_workbook(out, read_only=True, data_only=True)
 
-    # Choose '주문조회' if present
-    sheet = "주문조회" if "주문조회" in wb.sheetnames else wb.sheetnames[0]
-    ws = wb[sheet]
+def _to_str_or_empty(v):
+    return str(v or "")
 
-    headers = [ws.cell(row=1, column=c).value for c in range(1, 200)]
-    # trim
+
+def _to_datetime(v):
+    if getattr(v, "isoformat", None):
+        return v.isoformat()
+    if isinstance(v, str) and v.strip():
+        try:
+            return datetime.datetime.fromisoformat(v.strip().replace(".", "-")).isoformat()
+        except ValueError:
+            return None
+    return None
+
+
+def _to_int(v):
+    return int(v or 0)
+
+
+def _to_text(v):
+    if isinstance(v, tuple):
+        v = " ".join(str(x).strip() for x in v if x not in (None, ""))
+    elif v is not None:
+        v = str(v).strip()
+    return v or None
+
+
+CONVERTERS = {
+    "raw": None,
+    "str": _to_str,
+    "str_or_empty": _to_str_or_empty,
+    "datetime": _to_datetime,
+    "int": _to_int,
+    "text": _to_text,
+}
+
+
+def read_headers(rows):
+    """First row of the stream -> header list (trailing empty cells trimmed)."""
+    headers = list(next(rows, None) or ())
     while headers and headers[-1] in (None, ""):
         headers.pop()
+    return headers
 
-    idx = {str(h).strip(): i for i, h in enumerate(headers) if h not in (None, "")}
 
-    def get(row, key):
-        i = idx.get(key)
-        if i is None:
-            return None
-        return row[i]
+def header_signature(headers):
+    normalized = "\x1f".join("" if h is None else str(h).strip() for h in headers)
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
 
-    items = []
-    for r in range(2, ws.max_row + 1):
-        row = [ws.cell(row=r, column=c).value for c in range(1, len(headers) + 1)]
-        # skip empty
-        if not any(v not in (None, "") for v in row):
+
+def resolve_schema(headers):
+    """Header list -> {"schema", "columns": {field: [idx, ...] | None}, "converters": {field: name},
+    "status_time": [idx, ...]}."""
+    idx = {}
+    for i, h in enumerate(headers):
+        if h not in (None, ""):
+            idx.setdefault(str(h).strip(), i)
+
+    name = next((n for n, required in SCHEMAS if all(c in idx for c in required)), None)
+    if name is None:
+        raise SystemExit("unrecognized export: 상품주문번호 column missing")
+
+    columns = {}
+    for field, alternatives, _ in FIELD_SPECS:
+        columns[field] = next(
+            ([idx[h] for h in alt] for alt in alternatives if all(h in idx for h in alt)), None)
+    return {
+        "schema": name,
+        "columns": columns,
+        "converters": {field: conv for field, _, conv in FIELD_SPECS},
+        "status_time": [idx[h] for h in STATUS_TIME_HEADERS if h in idx],
+    }
+
+
+def load_schema(headers, cache_path=SCHEMA_CACHE_PATH):
+    """Resolved schema for this header row, from the on-disk cache when the signature is known."""
+    signature = header_signature(headers)
+    cache = {}
+    if cache_path:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if cache.get("version") != SCHEMA_CACHE_VERSION:
+            cache = {}
+
+    entry = (cache.get("schemas") or {}).get(signature)
+    if entry is None or set(entry.get("columns") or ()) != {f for f, _, _ in FIELD_SPECS}:
+        entry = resolve_schema(headers)
+        if cache_path:
+            cache = {"version": SCHEMA_CACHE_VERSION, "schemas": {**(cache.get("schemas") or {}), signature: entry}}
+            try:
+                tmp = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(cache, f, ensure_ascii=False)
+                os.replace(tmp, cache_path)
+            except OSError:
+                pass  # cache is an optimisation only
+    return signature, entry
+
+
+def compile_extractor(schema):
+    """Resolved schema -> row -> item dict (one itemgetter call per row, then converters)."""
+    positions = []
+    plan = []
+    for field, _, _ in FIELD_SPECS:
+        cols = schema["columns"].get(field)
+        conv = CONVERTERS[schema["converters"].get(field, "raw")]
+        if not cols:
+            plan.append((field, conv, None, None))
             continue
+        start = len(positions)
+        positions.extend(cols)
+        plan.append((field, conv, start, len(positions)))
+
+    width = max(positions) + 1
+    pad = (None,) * width
+    pick = itemgetter(*positions) if len(positions) > 1 else (lambda row: (row[positions[0]],))
+    plan = tuple(plan)
+
+    def extract(row):
+        if len(row) < width:
+            row = tuple(row) + pad[len(row):]
+        values = pick(row)
+        item = {}
+        for field, conv, start, end in plan:
+            if start is None:
+                v = None
+            elif end - start == 1:
+                v = values[start]
+            else:
+                v = values[start:end]
+            item[field] = conv(v) if conv is not None else v
+        return item
+
+    return extract
+
+
+def compile_status_time(schema):
+    """Resolved schema -> row -> latest status/claim date on the row (ISO string) or None."""
+    cols = tuple(schema.get("status_time") or ())
+
+    def status_time(row):
+        times = [t for t in (_to_datetime(row[i]) for i in cols if i < len(row)) if t]
+        return max(times, default=None)
+
+    return status_time
+
+
+def fingerprint(item):
+    """Stable hash of an item's imported fields (changes iff one of them changes)."""
+    raw = json.dumps(item, ensure_ascii=False, default=str, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def load_fingerprints(path):
+    """Sidecar index -> {product_order_no: fingerprint}; missing or unreadable file -> {}."""
+    if not path:
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("fingerprints") or {}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def iter_items(extract, rows, known=None, stats=None, seen=None, row_time=None):
+    """Remaining rows of the stream -> new/changed order items (rows without 상품주문번호 skipped).
+
+    `known` maps 상품주문번호 -> fingerprint; matching rows are only counted in `stats`.
+    Every counted 상품주문번호 (emitted or not) is appended to `seen` if given, as a
+    (상품주문번호, row_time(row)) pair when `row_time` is given.
+    """
+    known = known or {}
+    if stats is None:
+        stats = {}
+    for key in ("rows", "new", "changed", "unchanged"):
+        stats.setdefault(key, 0)
 
-        product_order_no = get(row, "상품주문번호")
-        if not product_order_no:
+    for row in rows:
+        if not row:
             continue
+        item = extract(row)
+        key = item["product_order_no"]
+        if not key:
+            continue
+        stats["rows"] += 1
+        if seen is not None:
+            seen.append(key if row_time is None else (key, row_time(row)))
+        fp = fingerprint(item)
+        prev = known.get(key)
+        if prev == fp:
+            stats["unchanged"] += 1
+            continue
+        stats["new" if prev is None else "changed"] += 1
+        item["fingerprint"] = fp
+        yield item
+
+
+@contextmanager
+def open_order_rows(src, password):
+    """Decrypt `src` into a spooled temp file and yield (sheet name, values_only row iterator)."""
+    with open(src, "rb") as f, tempfile.SpooledTemporaryFile(max_size=DECRYPT_SPOOL_BYTES) as out:
+        off = msoffcrypto.OfficeFile(f)
+        off.load_key(password=password)
+        off.decrypt(out)
+
+        out.seek(0)
+        wb = load_workbook(out, read_only=True, data_only=True)
+        try:
+            # Choose '주문조회' if present
+            sheet = "주문조회" if "주문조회" in wb.sheetnames else wb.sheetnames[0]
+            yield sheet, wb[sheet].iter_rows(values_only=True)
+        finally:
+            wb.close()
+
+
+def parse_orders(src, password, emit, known=None, schema_cache=SCHEMA_CACHE_PATH):
+    """Decrypt and parse `src`, calling emit(record) for the sheet, every new/changed item
+    and the end record (with the row summary).
+
+    Returns the number of items emitted.
+    """
+    with open_order_rows(src, password) as (sheet, rows):
+        headers = read_headers(rows)
+        signature, schema = load_schema(headers, schema_cache)
+        emit({"type": "sheet", "sheet": sheet, "headers": headers,
+              "schema": schema["schema"], "signature": signature})
+
+        count = 0
+        stats = {}
+        for item in iter_items(compile_extractor(schema), rows, known, stats):
+            emit({"type": "item", **item})
+            count += 1
+
+    emit({"type": "end", "count": count, **stats})
+    return count
+
+
+# Batch arguments (sources, password, known, schema_cache): set by parse_orders_batch, and in
+# each pool process by _init_batch.
+_BATCH = None
+
+
+def _init_batch(batch):
+    global _BATCH
+    _BATCH = batch
+
+
+def _spool_rows(items, seen, out):
+    """Write the rows of one file to `out` in row order, one line per row:
+    `[상품주문번호, status time]` JSON, a tab, then the item JSON for a new/changed row or
+    `null` for an unchanged one (JSON text never contains a raw tab)."""
+    def line(key, at, item):
+        head = json.dumps([key, at], ensure_ascii=False)
+        out.write(f"{head}\t{json.dumps(item, ensure_ascii=False, default=str)}\n")
+
+    for item in items:
+        # iter_items appends a row's key to `seen` before yielding it, so every key
+        # ahead of the last one belongs to a row that was counted but not emitted.
+        for key, at in seen[:-1]:
+            line(key, at, None)
+        line(*seen[-1], item)
+        seen.clear()
+    for key, at in seen:
+        line(key, at, None)
+    seen.clear()
+
+
+def _parse_for_batch(i):
+    """Parse file `i` of the batch -> (sheet record, path of its spooled rows, see _spool_rows).
+
+    Rows go to a temp file rather than back through the pool, so neither the worker nor
+    the parent holds a whole file's items; the caller removes the file.
+    """
+    sources, password, known, schema_cache = _BATCH
+    name = Path(sources[i]).name
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", prefix="smartstore_batch.",
+                                     suffix=".ndjson", delete=False) as out:
+        try:
+            with open_order_rows(sources[i], password) as (sheet, rows):
+                headers = read_headers(rows)
+                signature, schema = load_schema(headers, schema_cache)
+                seen = []
+                items = iter_items(compile_extractor(schema), rows, known, seen=seen,
+                                   row_time=compile_status_time(schema))
+                _spool_rows(items, seen, out)
+        except BaseException as e:
+            out.close()
+            os.unlink(out.name)
+            if isinstance(e, (Exception, SystemExit)):
+                raise SystemExit(f"{name}: {e}") from None
+            raise
+    sheet_record = {"type": "sheet", "file": name, "sheet": sheet, "headers": headers,
+                    "schema": schema["schema"], "signature": signature}
+    return sheet_record, out.name
+
+
+def _pool_context():
+    """forkserver (spawn where unavailable): the caller may be the long-lived worker, and a
+    forked child would inherit whatever threads and locks it holds."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def parse_orders_batch(sources, password, emit, known=None, schema_cache=SCHEMA_CACHE_PATH, jobs=None):
+    """Decrypt and parse several exports in a process pool and emit one merged stream.
+
+    Files are decrypted/parsed in parallel (both are CPU-bound). A 상품주문번호 found in more
+    than one file (or twice in one) is taken from the row with the latest status/claim date
+    (STATUS_TIME_HEADERS); rows without one, or with equal dates, go to the earlier file.
+    Emits a sheet record per file, the new/changed items in file order, then one end record
+    for the whole batch (rows = distinct orders, plus "files" and "duplicates"). Returns the
+    number of items emitted.
+
+    Each file's rows are spooled to a temp file by its worker. The spools are read twice:
+    once for the winning row of every 상품주문번호, then to emit the winners, so memory
+    holds one (date, position) per order, not the items.
+    """
+    global _BATCH
+    sources = [str(src) for src in sources]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(sources)))
+    _BATCH = (sources, password, known or {}, schema_cache)
+    spools = []
+    try:
+        if jobs == 1:
+            results = (_parse_for_batch(i) for i in range(len(sources)))
+            futures = []
+        else:
+            pool = ProcessPoolExecutor(jobs, mp_context=_pool_context(),
+                                       initializer=_init_batch, initargs=(_BATCH,))
+            futures = [pool.submit(_parse_for_batch, i) for i in range(len(sources))]
+            results = (fut.result() for fut in futures)
+
+        count = 0
+        stats = {"rows": 0, "new": 0, "changed": 0, "unchanged": 0, "duplicates": 0}
+        best = {}  # 상품주문번호 -> (status time, file, line) of the winning row
+        try:
+            for n, (sheet_record, spool) in enumerate(results):
+                spools.append(spool)
+                emit(sheet_record)
+                with open(spool, "r", encoding="utf-8") as f:
+                    for line_no, line in enumerate(f):
+                        key, at = json.loads(line[:line.index("\t")])
+                        cur = best.get(key)
+                        if cur is None or (at is not None and (cur[0] is None or at > cur[0])):
+                            best[key] = (at, n, line_no)
+
+            for n, spool in enumerate(spools):
+                with open(spool, "r", encoding="utf-8") as f:
+                    for line_no, line in enumerate(f):
+                        head, _, item = line.partition("\t")
+                        key = json.loads(head)[0]
+                        if best[key][1:] != (n, line_no):
+                            stats["duplicates"] += 1
+                            continue
+                        stats["rows"] += 1
+                        item = json.loads(item)
+                        if item is None:
+                            stats["unchanged"] += 1
+                            continue
+                        stats["new" if key not in (known or {}) else "changed"] += 1
+                        emit({"type": "item", **item})
+                        count += 1
+                os.unlink(spool)
+        finally:
+            if futures:
+                pool.shutdown(cancel_futures=True)
+                # Spools of files that finished but were not merged (an earlier file failed).
+                spools += [fut.result()[1] for fut in futures
+                           if fut.done() and not fut.cancelled() and fut.exception() is None]
+            for spool in spools:
+                if os.path.exists(spool):
+                    os.unlink(spool)
+    finally:
+        _BATCH = None
+
+    emit({"type": "end", "count": count, "files": len(sources), **stats})
+    return count
+
+
+def emit_line(obj):
+    sys.stdout.write(json.dumps(obj, ensure_ascii=False, default=str))
+    sys.stdout.write("\n")
+
+
+def main():
+    pw = os.environ.get("SMARTSTORE_XLSX_PASSWORD")
+    if not pw:
+        raise SystemExit("SMARTSTORE_XLSX_PASSWORD missing")
+
+    src = os.environ.get("SMARTSTORE_XLSX_PATH")
+    if not src:
+        raise SystemExit("SMARTSTORE_XLSX_PATH missing")
+
+    paths = [Path(part) for part in src.split(os.pathsep) if part]
+    for p in paths:
+        if not p.exists():
+            raise SystemExit(f"file not found: {p}")
 
-        item = {
-            "product_order_no": str(product_order_no),
-            "order_no": str(get(row, "주문번호") or ""),
-            "ordered_at": (get(row, "주문일시").isoformat() if getattr(get(row, "주문일시"), "isoformat", None) else None),
-            "order_status": get(row, "주문상태"),
-            "shipping_attr": get(row, "배송속성"),
-            "claim_status": get(row, "클레임상태"),
-            "product_no": str(get(row, "상품번호") or ""),
-            "product_name": get(row, "상품명"),
-            "option_info": get(row, "옵션정보"),
-            "qty": int(get(row, "수량") or 0),
-            "buyer_name": get(row, "구매자명"),
-            "buyer_id": get(row, "구매자ID"),
-            "recipient_name": get(row, "수취인명"),
-            # NOTE: address/phone columns are not present in this export; will be added when we get the right export.
-            "recipient_phone": None,
-            "recipient_address": None,
-        }
-        items.append(item)
-
-    print(json.dumps({"sheet": sheet, "headers": headers, "items": items}, ensure_ascii=False))
+    known = load_fingerprints(os.environ.get("SMARTSTORE_FINGERPRINTS_PATH"))
+    schema_cache = os.environ.get("SMARTSTORE_SCHEMA_CACHE") or SCHEMA_CACHE_PATH
+    if len(paths) == 1:
+        parse_orders(paths[0], pw, emit_line, known, schema_cache)
+    else:
+        parse_orders_batch(paths, pw, emit_line, known, schema_cache,
+                           jobs=int(os.environ.get("SMARTSTORE_PARSE_JOBS") or 0) or None)
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
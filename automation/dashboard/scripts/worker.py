@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Persistent Python worker for server.mjs (see lib/python-worker.mjs).
+
+Keeps openpyxl / msoffcrypto imported and runs jobs one at a time, so the server
+no longer pays interpreter startup + imports per request. Pillow is optional and
+only imported by the first image job, so order jobs work without it.
+
+Protocol
+  stdin : one JSON job per line
+          {"id": 1, "op": "parse_orders", "args": {...}}
+  stdout: binary frames
+          uint32 BE header length | uint32 BE body length | header JSON | body
+          header = {"id": 1, "event": "record" | "chunk" | "done" | "error", ...}
+
+Ops
+  parse_orders          {path, password, index_path?}  -> "record" frames (sheet/item/end), done {count}
+  parse_orders_batch    {paths, password, index_path?, jobs?} -> same, merged across files (deduped)
+  export_vendor_orders  {orders_path, vendor_id}       -> "chunk" frames (xlsx bytes, streamed), done {rows, bytes}
+  export_all_vendor_orders {orders_path, out_dir, format?, jobs?, vendors_path?} -> done {files: [{vendorId, file, rows}]}
+  prepare_image         {src, dst, format?, max_size?, quality?, cache_dir?} -> done {width, height, cached}
+  prepare_images        {items: [{src, dst, ...}], cache_dir?} -> "record" frame per item {index, ok, ...}, done {ok}
+
+A failing job answers with an "error" frame; the worker keeps running until stdin closes.
+"""
+
+import json
+import os
+import struct
+import sys
+import traceback
+
+from export_all_vendor_orders import export_all, load_usernames
+from export_vendor_orders_xlsx import export_xlsx
+from parse_smartstore_orders import load_fingerprints, parse_orders, parse_orders_batch
+
+CHUNK_BYTES = 64 * 1024
+
+_FRAME = struct.Struct(">II")
+
+
+class Channel:
+    """Frame writer bound to the real stdout (fd 1 is pointed at stderr so stray prints can't corrupt frames)."""
+
+    def __init__(self):
+        self.out = os.fdopen(os.dup(1), "wb")
+        os.dup2(2, 1)
+        sys.stdout = sys.stderr
+
+    def send(self, header, body=b""):
+        head = json.dumps(header, ensure_ascii=False, default=str).encode("utf-8")
+        self.out.write(_FRAME.pack(len(head), len(body)))
+        self.out.write(head)
+        if body:
+            self.out.write(body)
+
+    def flush(self):
+        self.out.flush()
+
+
+def op_parse_orders(job_id, args, ch):
+    count = parse_orders(args["path"], args["password"],
+                         lambda record: ch.send({"id": job_id, "event": "record", "record": record}),
+                         load_fingerprints(args.get("index_path")))
+    return {"count": count}
+
+
+def op_parse_orders_batch(job_id, args, ch):
+    count = parse_orders_batch(args["paths"], args["password"],
+                               lambda record: ch.send({"id": job_id, "event": "record", "record": record}),
+                               load_fingerprints(args.get("index_path")),
+                               jobs=args.get("jobs"))
+    return {"count": count}
+
+
+class ChunkSink:
+    """Write-only file object that forwards bytes as "chunk" frames of about CHUNK_BYTES.
+
+    Has no tell()/seek(), so zipfile streams into it with data descriptors.
+    """
+
+    def __init__(self, job_id, ch):
+        self.job_id = job_id
+        self.ch = ch
+        self.buf = bytearray()
+        self.total = 0
+
+    def write(self, data):
+        self.buf += data
+        self.total += len(data)
+        if len(self.buf) >= CHUNK_BYTES:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self.buf:
+            self.ch.send({"id": self.job_id, "event": "chunk"}, bytes(self.buf))
+            self.buf.clear()
+            self.ch.flush()
+
+
+def op_export_vendor_orders(job_id, args, ch):
+    sink = ChunkSink(job_id, ch)
+    rows = export_xlsx(args["orders_path"], args["vendor_id"], sink)
+    sink.flush()
+    return {"rows": rows, "bytes": sink.total}
+
+
+def op_export_all_vendor_orders(job_id, args, ch):
+    files = export_all(args["orders_path"], args["out_dir"], args.get("format") or "xlsx", args.get("jobs"),
+                       load_usernames(args.get("vendors_path")))
+    return {"files": files}
+
+
+def op_prepare_image(job_id, args, ch):
+    from image_ops import CARD_SIZE, prepare_image
+
+    return prepare_image(args["src"], args["dst"], args.get("format") or "PNG",
+                         args.get("max_size", CARD_SIZE), args.get("quality") or 90, args.get("cache_dir"))
+
+
+def op_prepare_images(job_id, args, ch):
+    from image_ops import prepare_images
+
+    ok = prepare_images(args["items"],
+                        lambda record: ch.send({"id": job_id, "event": "record", "record": record}),
+                        args.get("cache_dir"))
+    return {"ok": ok}
+
+
+OPS = {
+    "parse_orders": op_parse_orders,
+    "parse_orders_batch": op_parse_orders_batch,
+    "export_vendor_orders": op_export_vendor_orders,
+    "export_all_vendor_orders": op_export_all_vendor_orders,
+    "prepare_image": op_prepare_image,
+    "prepare_images": op_prepare_images,
+}
+
+
+def main():
+    ch = Channel()
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        job_id = job.get("id")
+        try:
+            fn = OPS.get(job.get("op"))
+            if fn is None:
+                raise ValueError(f"unknown op: {job.get('op')}")
+            result = fn(job_id, job.get("args") or {}, ch)
+            ch.send({"id": job_id, "event": "done", **result})
+        except (Exception, SystemExit) as e:
+            ch.send({"id": job_id, "event": "error", "message": str(e) or type(e).__name__,
+                     "traceback": traceback.format_exc()[-2000:]})
+        ch.flush()
+
+
+if __name__ == "__main__":
+    main()
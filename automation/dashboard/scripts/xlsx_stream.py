@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Minimal streaming XLSX writer (single sheet, inline or shared strings, no styles).
+
+Rows are serialized to sheet XML and compressed into the zip as they are appended,
+so the output file object receives bytes from the first rows on and memory stays
+constant. The output does not need to be seekable (stdout / a pipe works): zipfile
+then writes entry sizes in data descriptors after each entry.
+
+shared_strings=True writes strings to a sharedStrings part the way Excel does (kept in
+memory until close); the exports use inline strings, the benchmark fixtures use shared
+strings to look like real SmartStore downloads.
+
+Usage:
+    with XlsxStreamWriter(sys.stdout.buffer, "orders") as xw:
+        xw.append(["상품주문번호", "수량"])
+        xw.append(["2026...", 1])
+"""
+
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_HEAD = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_CONTENT_TYPES = _HEAD + (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{extra}</Types>'
+)
+
+_SHARED_STRINGS_TYPE = (
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+)
+
+_ROOT_RELS = _HEAD + (
+    f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_RELS = _HEAD + (
+    f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+    '{extra}</Relationships>'
+)
+
+_SHARED_STRINGS_REL = f'<Relationship Id="rId3" Type="{_REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+
+_STYLES = _HEAD + (
+    f'<styleSheet xmlns="{_NS}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+# Characters XML 1.0 does not allow (openpyxl rejects them too).
+_ILLEGAL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Rows are buffered into roughly this many characters before each zip write.
+_FLUSH_CHARS = 64 * 1024
+
+
+def _t(text):
+    """<t> element for already-escaped text (leading/trailing spaces need xml:space)."""
+    space = ' xml:space="preserve"' if text[:1].isspace() or text[-1:].isspace() else ""
+    return f"<t{space}>{text}</t>"
+
+
+def _column_letter(n):
+    letters = ""
+    while n:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+class _Output:
+    """`out` as seen by zipfile; after close() nothing more reaches `out`.
+
+    tell/seek are only forwarded when `out` has them, so zipfile still detects an
+    unseekable output and falls back to data descriptors.
+    """
+
+    def __init__(self, out):
+        self.out = out
+
+    def write(self, data):
+        if self.out is None:
+            return len(data)
+        return self.out.write(data)
+
+    def tell(self):
+        return 0 if self.out is None else self.out.tell()
+
+    def seek(self, *args):
+        return 0 if self.out is None else self.out.seek(*args)
+
+    def flush(self):
+        if self.out is not None:
+            self.out.flush()
+
+    def close(self):
+        self.out = None
+
+
+class XlsxStreamWriter:
+    """Append rows to a one-sheet workbook written straight into `out` (binary file object)."""
+
+    def __init__(self, out, title="Sheet1", shared_strings=False):
+        self.strings = {} if shared_strings else None
+        self.out = _Output(out)
+        self.zip = zipfile.ZipFile(self.out, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6)
+        self.zip.writestr("[Content_Types].xml",
+                          _CONTENT_TYPES.format(extra=_SHARED_STRINGS_TYPE if shared_strings else ""))
+        self.zip.writestr("_rels/.rels", _ROOT_RELS)
+        self.zip.writestr("xl/workbook.xml", _HEAD + (
+            f'<workbook xmlns="{_NS}" xmlns:r="{_REL_NS}"><sheets>'
+            f'<sheet name="{escape(title, {chr(34): "&quot;"})}" sheetId="1" r:id="rId1"/>'
+            '</sheets></workbook>'
+        ))
+        self.zip.writestr("xl/_rels/workbook.xml.rels",
+                          _WORKBOOK_RELS.format(extra=_SHARED_STRINGS_REL if shared_strings else ""))
+        self.zip.writestr("xl/styles.xml", _STYLES)
+
+        self.sheet = self.zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self.pending = [_HEAD, f'<worksheet xmlns="{_NS}"><sheetData>']
+        self.pending_chars = 0
+        self.rows = 0
+        self.letters = []
+
+    def append(self, values):
+        self.rows += 1
+        r = self.rows
+        while len(self.letters) < len(values):
+            self.letters.append(_column_letter(len(self.letters) + 1))
+        cells = []
+        for letter, v in zip(self.letters, values):
+            if v is None or v == "":
+                continue
+            if isinstance(v, bool):
+                cells.append(f'<c r="{letter}{r}" t="b"><v>{int(v)}</v></c>')
+            elif isinstance(v, (int, float)):
+                cells.append(f'<c r="{letter}{r}"><v>{v}</v></c>')
+            elif self.strings is not None:
+                text = escape(_ILLEGAL.sub("", str(v)))
+                idx = self.strings.setdefault(text, len(self.strings))
+                cells.append(f'<c r="{letter}{r}" t="s"><v>{idx}</v></c>')
+            else:
+                text = escape(_ILLEGAL.sub("", str(v)))
+                cells.append(f'<c r="{letter}{r}" t="inlineStr"><is>{_t(text)}</is></c>')
+        line = f'<row r="{r}">{"".join(cells)}</row>'
+        self.pending.append(line)
+        self.pending_chars += len(line)
+        if self.pending_chars >= _FLUSH_CHARS:
+            self._flush_rows()
+
+    def _flush_rows(self):
+        self.sheet.write("".join(self.pending).encode("utf-8"))
+        self.pending = []
+        self.pending_chars = 0
+
+    def close(self):
+        if self.zip is None:
+            return
+        self.pending.append("</sheetData></worksheet>")
+        self._flush_rows()
+        self.sheet.close()
+        if self.strings is not None:
+            self._write_shared_strings()
+        self.zip.close()
+        self.zip = None
+
+    def _write_shared_strings(self):
+        n = len(self.strings)
+        with self.zip.open("xl/sharedStrings.xml", "w", force_zip64=True) as part:
+            pending = [_HEAD, f'<sst xmlns="{_NS}" count="{n}" uniqueCount="{n}">']
+            size = 0
+            for text in self.strings:  # dicts keep insertion order = index order
+                item = f"<si>{_t(text)}</si>"
+                pending.append(item)
+                size += len(item)
+                if size >= _FLUSH_CHARS:
+                    part.write("".join(pending).encode("utf-8"))
+                    pending = []
+                    size = 0
+            pending.append("</sst>")
+            part.write("".join(pending).encode("utf-8"))
+
+    def __enter__(self):
+        return self
+
+    def abort(self):
+        """Drop the workbook without finishing it.
+
+        The stream into `out` is closed first, so neither the sheet entry nor the
+        central directory is written: the incomplete output is not a readable xlsx and
+        the caller removes it. `out` itself is left open (it belongs to the caller).
+        """
+        if self.zip is None:
+            return
+        self.out.close()
+        self.zip = None
+        try:
+            self.sheet.close()
+        except Exception:
+            pass  # the output is being discarded; don't mask the original error
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -1,11 +1,11 @@
 import http from 'node:http';
 import crypto from 'node:crypto';
-import { spawnSync } from 'node:child_process';
 import {
   readFileSync,
   existsSync,
   statSync,
   createReadStream,
+  createWriteStream,
   writeFileSync,
   mkdirSync,
   copyFileSync,
@@ -13,12 +13,15 @@ import {
   appendFileSync,
   readdirSync,
   unlinkSync,
+  rmSync,
 } from 'node:fs';
+import { open as openFile } from 'node:fs/promises';
 import path from 'node:path';
 import { fileURLToPath } from 'node:url';
 import * as XLSX from 'xlsx';
 import { chromium } from 'playwright';
 import archiver from 'archiver';
+import { PythonWorkerPool } from './lib/python-worker.mjs';
 
 // Naver Commerce API (conditional — only loads if env vars present)
 let naverCommerce = null;
@@ -92,7 +95,11 @@ function cleanupOldBackups(dirPath, maxDays) {
   }
 }
 
-function safeWriteJson(filePath, data, { backupDays = 7 } = {}) {
+function safeWriteJson(filePath, data, opts = {}) {
+  safeWriteText(filePath, JSON.stringify(data, null, 2), opts);
+}
+
+function safeWriteText(filePath, text, { backupDays = 7 } = {}) {
   ensureDataDir();
 
   const dir = path.dirname(filePath);
@@ -111,7 +118,7 @@ function safeWriteJson(filePath, data, { backupDays = 7 } = {}) {
   }
 
   const tmpPath = `${filePath}.tmp`;
-  writeFileSync(tmpPath, JSON.stringify(data, null, 2), 'utf8');
+  writeFileSync(tmpPath, text, 'utf8');
   renameSync(tmpPath, filePath);
 }
 
@@ -252,9 +259,32 @@ const vendorsPath = path.join(dataDir, 'vendors.json');
 const vendorSessionsPath = path.join(dataDir, 'vendor_sessions.json');
 const ownerSessionsPath = path.join(dataDir, 'owner_sessions.json');
 const ordersPath = path.join(dataDir, 'orders.json');
+const orderIndexDir = path.join(dataDir, 'orders_index');
+const exportCacheDir = path.join(dataDir, 'export_cache');
 const productsPath = path.join(dataDir, 'products.json');
 const scriptsDir = path.join(__dirname, 'scripts');
+// Long-lived python workers (xlsx import/export); see lib/python-worker.mjs
+const pyWorkers = new PythonWorkerPool({
+  script: path.join(scriptsDir, 'worker.py'),
+  size: Number(process.env.PY_WORKERS || 2),
+});
+// Separate pool for image jobs so an upload never waits behind a large xlsx import
+const imageWorkers = new PythonWorkerPool({
+  script: path.join(scriptsDir, 'worker.py'),
+  size: Number(process.env.IMAGE_WORKERS || 1),
+});
+// Per-job limits: a hung worker is killed (and respawned on the next job) instead of holding a slot.
+const WORKER_TIMEOUT_MS = {
+  parseOrders: 10 * 60 * 1000,
+  exportVendorOrders: 5 * 60 * 1000,
+  exportAllVendorOrders: 10 * 60 * 1000,
+  prepareImage: 60 * 1000,
+};
+// Prepared (converted/downscaled) images by content hash; see scripts/image_ops.py
+const imageCacheDir = path.join(dataDir, 'image_cache');
 const mappingPath = path.join(dataDir, 'mapping.json');
+// Sidecar index of SmartStore row fingerprints from past imports (see parse_smartstore_orders.py)
+const importIndexPath = path.join(dataDir, 'import_fingerprints.json');
 const auditLogPath = path.join(dataDir, 'audit.jsonl');
 const igGuidePath = path.join(dataDir, 'ig_brand_guide.json');
 const igPostsPath = path.join(dataDir, 'ig_posts.json');
@@ -483,7 +513,154 @@ function loadOrders() {
 }
 
 function saveOrders(data) {
-  saveJson(ordersPath, data);
+  const { text, vendors } = serializeOrders(data);
+  const manifestPath = path.join(orderIndexDir, '_manifest.json');
+  // readers treat a missing manifest as "index stale" while orders.json is being replaced
+  try { unlinkSync(manifestPath); } catch {}
+  safeWriteText(ordersPath, text);
+  saveOrderIndex(vendors, manifestPath);
+}
+
+// -------------------------
+// Per-vendor offset index for orders.json
+// data/orders_index/<orderIndexKey(vendorId)>.json = { vendorId, size, mtimeMs, hash, spans: [[byteOffset, byteLength], ...] }
+// Each span is one order object inside orders.json, so exports read only their vendor's rows
+// (scripts/export_vendor_orders_xlsx.py). _manifest.json records the orders.json size/mtime the
+// index was built for; readers fall back to a full scan when it doesn't match.
+// -------------------------
+function orderIndexKey(vendorId) {
+  return crypto.createHash('sha1').update(String(vendorId)).digest('hex').slice(0, 16);
+}
+
+// Same text as JSON.stringify(data, null, 2), assembled per order so each order's byte span is known.
+function serializeOrders(data) {
+  const pieces = [];
+  const vendors = new Map();
+  let offset = 0;
+  const push = (str) => {
+    pieces.push(str);
+    offset += Buffer.byteLength(str, 'utf8');
+  };
+
+  const entries = Object.entries(data || {}).filter(([, v]) => v !== undefined && typeof v !== 'function');
+  push('{');
+  entries.forEach(([key, value], i) => {
+    push(`${i ? ',' : ''}\n  ${JSON.stringify(key)}: `);
+    if (key !== 'orders' || !Array.isArray(value) || value.length === 0) {
+      push(JSON.stringify(value, null, 2).replace(/\n/g, '\n  '));
+      return;
+    }
+    push('[');
+    value.forEach((o, j) => {
+      push(`${j ? ',' : ''}\n    `);
+      const text = o === undefined || typeof o === 'function' ? 'null' : JSON.stringify(o, null, 2).replace(/\n/g, '\n    ');
+      if (o && o.vendorId) {
+        let v = vendors.get(o.vendorId);
+        if (!v) vendors.set(o.vendorId, (v = { spans: [], hash: crypto.createHash('sha1') }));
+        v.spans.push([offset, Buffer.byteLength(text, 'utf8')]);
+        v.hash.update(text);
+      }
+      push(text);
+    });
+    push('\n  ]');
+  });
+  push(entries.length ? '\n}' : '}');
+  return { text: pieces.join(''), vendors };
+}
+
+function saveOrderIndex(vendors, manifestPath) {
+  ensureDir(orderIndexDir);
+  const st = statSync(ordersPath);
+  const keep = new Set(['_manifest.json']);
+  const cacheNames = new Set();
+  const writeAtomic = (p, obj) => {
+    writeFileSync(`${p}.tmp`, JSON.stringify(obj), 'utf8');
+    renameSync(`${p}.tmp`, p);
+  };
+  for (const [vendorId, v] of vendors) {
+    const name = `${orderIndexKey(vendorId)}.json`;
+    const hash = v.hash.digest('hex');
+    keep.add(name);
+    cacheNames.add(vendorExportCacheName(vendorId, hash));
+    writeAtomic(path.join(orderIndexDir, name), {
+      vendorId,
+      size: st.size,
+      mtimeMs: st.mtimeMs,
+      hash,
+      spans: v.spans,
+    });
+  }
+  for (const name of readdirSync(orderIndexDir)) {
+    if (!keep.has(name)) {
+      try { unlinkSync(path.join(orderIndexDir, name)); } catch {}
+    }
+  }
+  writeAtomic(manifestPath, { size: st.size, mtimeMs: st.mtimeMs, vendors: vendors.size });
+  pruneExportCache(cacheNames);
+}
+
+// Rebuild the index if orders.json was written by something else (mock data, manual edit).
+function ensureOrderIndex() {
+  if (!existsSync(ordersPath)) return;
+  const manifest = loadJson(path.join(orderIndexDir, '_manifest.json'), null);
+  const st = statSync(ordersPath);
+  if (manifest && manifest.size === st.size && Math.abs(manifest.mtimeMs - st.mtimeMs) < 1) return;
+  saveOrders(loadOrders());
+}
+
+// -------------------------
+// Vendor xlsx export cache
+// data/export_cache/<orderIndexKey(vendorId)>-<format>-<hash>.xlsx, where hash is the vendor's
+// order index hash: it changes only when that vendor's rows change, so it doubles as the ETag.
+// saveOrderIndex drops files whose hash is no longer current.
+// -------------------------
+const VENDOR_EXPORT_FORMAT = 1; // bump when export_vendor_orders_xlsx.py output changes
+const EMPTY_VENDOR_HASH = crypto.createHash('sha1').digest('hex');
+
+function vendorExportCacheName(vendorId, hash) {
+  return `${orderIndexKey(vendorId)}-${VENDOR_EXPORT_FORMAT}-${hash}.xlsx`;
+}
+
+// { handle, size } for a cached export, or null when it is missing or unreadable.
+async function openCachedExport(filePath) {
+  let handle;
+  try {
+    handle = await openFile(filePath, 'r');
+    return { handle, size: (await handle.stat()).size };
+  } catch {
+    await handle?.close().catch(() => {});
+    return null;
+  }
+}
+
+// Current version of a vendor's rows, or null when the index doesn't match orders.json.
+function vendorOrdersVersion(vendorId) {
+  if (!existsSync(ordersPath)) return null;
+  const st = statSync(ordersPath);
+  const fresh = (meta) => meta && meta.size === st.size && Math.abs(meta.mtimeMs - st.mtimeMs) < 1;
+  if (!fresh(loadJson(path.join(orderIndexDir, '_manifest.json'), null))) return null;
+  const entry = loadJson(path.join(orderIndexDir, `${orderIndexKey(vendorId)}.json`), null);
+  if (!entry) return EMPTY_VENDOR_HASH; // vendor has no orders
+  return fresh(entry) ? entry.hash : null;
+}
+
+function pruneExportCache(currentNames) {
+  if (!existsSync(exportCacheDir)) return;
+  for (const name of readdirSync(exportCacheDir)) {
+    // *.tmp files belong to exports in flight; their writer renames or removes them
+    if (name.endsWith('.xlsx') && !currentNames.has(name)) {
+      try { unlinkSync(path.join(exportCacheDir, name)); } catch {}
+    }
+  }
+}
+
+function etagMatches(req, etag) {
+  const header = String(req.headers['if-none-match'] || '');
+  if (!header) return false;
+  return header.split(',').some((t) => {
+    const tag = t.trim().replace(/^W\//, '');
+    return tag === '*' || tag === etag;
+  });
 }
 
 function loadProducts() {
@@ -494,6 +671,18 @@ function saveProducts(data) {
   saveJson(productsPath, data);
 }
 
+function loadImportIndex() {
+  return loadJson(importIndexPath, { mappingKey: null, fingerprints: {} });
+}
+
+function saveImportIndex(index) {
+  // derived data: rebuilt by a full import, so no backups
+  ensureDataDir();
+  const tmpPath = `${importIndexPath}.tmp`;
+  writeFileSync(tmpPath, JSON.stringify(index), 'utf8');
+  renameSync(tmpPath, importIndexPath);
+}
+
 function loadMapping() {
   return loadJson(mappingPath, { mapping: [] });
 }
@@ -768,6 +957,22 @@ function saveIgPosts(data) {
   saveJson(igPostsPath, data);
 }
 
+// Prepare many images on the image workers, one prepare_images batch per worker.
+// Resolves with one { index, ok, width, height, cached | error } result per item.
+async function prepareImages(items) {
+  const results = new Array(items.length);
+  const per = Math.ceil(items.length / imageWorkers.size) || 1;
+  const batches = [];
+  for (let start = 0; start < items.length; start += per) {
+    batches.push(imageWorkers.run('prepare_images', { items: items.slice(start, start + per), cache_dir: imageCacheDir }, {
+      onRecord: (r) => { results[start + r.index] = { ...r, index: start + r.index }; },
+      timeoutMs: WORKER_TIMEOUT_MS.prepareImage * per,
+    }));
+  }
+  await Promise.all(batches);
+  return results;
+}
+
 function getDefaultIgGuide() {
   return {
     tone: {
@@ -1861,25 +2066,26 @@ const server = http.createServer(async (req, res) => {
         return sendJson(res, 400, { ok: false, error: 'invalid_format', detail: '지원하지 않는 이미지 형식입니다. JPG, PNG, WebP 파일만 업로드 가능합니다.' });
       }
       const finalExt = ext || { 'image/jpeg': '.jpg', 'image/png': '.png', 'image/webp': '.webp' }[filePart.contentType] || '.jpg';
-      let outName = `product${finalExt}`;
       // cleanup old variants
       for (const fn of ['product.webp','product.png','product.jpg','product.jpeg']) {
         try { if (existsSync(path.join(outDir, fn))) unlinkSync(path.join(outDir, fn)); } catch {}
       }
-      const outPath = path.join(outDir, outName);
-      writeFileSync(outPath, filePart.data);
-
-      // webp sometimes fails to render as file:// background-image in headless screenshot; convert to png for stability
-      if (finalExt === '.webp') {
-        try {
-          const pngPath = path.join(outDir, 'product.png');
-          const py = `from PIL import Image\nimg=Image.open(r'''${outPath}''')\nimg.save(r'''${pngPath}''', format='PNG')\nprint('ok')`;
-          const conv = spawnSync('python3', ['-c', py], { encoding: 'utf8' });
-          if (conv.status === 0 && existsSync(pngPath)) {
-            try { unlinkSync(outPath); } catch {}
-            outName = 'product.png';
-          }
-        } catch {}
+      const uploadPath = path.join(outDir, `upload.${crypto.randomUUID()}${finalExt}`);
+      writeFileSync(uploadPath, filePart.data);
+
+      // Downscale to the card size (the image is embedded as a data URI in every card) and
+      // convert webp to png, which sometimes fails to render as a background in headless screenshots.
+      // Re-uploading the same file is served from the image cache. Keep the original if Pillow fails.
+      const format = finalExt === '.webp' || finalExt === '.png' ? 'PNG' : 'JPEG';
+      let outName = format === 'PNG' ? 'product.png' : 'product.jpg';
+      try {
+        await imageWorkers.run('prepare_image', { src: uploadPath, dst: path.join(outDir, outName), format, cache_dir: imageCacheDir }, {
+          timeoutMs: WORKER_TIMEOUT_MS.prepareImage,
+        });
+        try { unlinkSync(uploadPath); } catch {}
+      } catch {
+        outName = `product${finalExt}`;
+        renameSync(uploadPath, path.join(outDir, outName));
       }
 
       posts.posts[idx].assets = posts.posts[idx].assets || {};
@@ -1911,6 +2117,52 @@ const server = http.createServer(async (req, res) => {
     return serveFile(res, imgPath);
   }
 
+  // Re-prepare every post's product image in one batch (e.g. full-size uploads from before
+  // images were downscaled); unchanged files come straight from the image cache.
+  if (url.pathname === '/api/admin/ig/product_images/prepare' && req.method === 'POST') {
+    const posts = loadIgPosts();
+    const targets = [];
+    for (const post of posts.posts || []) {
+      const filename = post.assets?.productImage?.filename;
+      if (!filename) continue;
+      const dir = path.join(dataDir, 'ig_assets', post.id);
+      const src = path.join(dir, filename);
+      if (!existsSync(src)) continue;
+      const format = /\.jpe?g$/i.test(filename) ? 'JPEG' : 'PNG';
+      const dstName = format === 'PNG' ? 'product.png' : 'product.jpg';
+      targets.push({ post, src, dstName, item: { src, dst: path.join(dir, dstName), format } });
+    }
+
+    let results;
+    try {
+      results = await prepareImages(targets.map((t) => t.item));
+    } catch (e) {
+      return sendJson(res, 500, { ok: false, error: 'prepare_failed', detail: String(e?.message || e) });
+    }
+
+    let converted = 0;
+    let cached = 0;
+    let renamed = false;
+    const failed = [];
+    results.forEach((r, i) => {
+      const t = targets[i];
+      if (!r?.ok) {
+        failed.push({ postId: t.post.id, error: r?.error || 'no_result' });
+        return;
+      }
+      if (r.cached) cached++; else converted++;
+      if (t.post.assets.productImage.filename !== t.dstName) {
+        try { unlinkSync(t.src); } catch {}
+        t.post.assets.productImage.filename = t.dstName;
+        renamed = true;
+      }
+    });
+    if (renamed) saveIgPosts(posts);
+
+    auditLog({ actorType: 'owner', actorId: OWNER_USERNAME, action: 'IG_PRODUCT_IMAGES_PREPARED', ip: getClientIp(req), meta: { total: targets.length, converted, cached, failed: failed.length } });
+    return sendJson(res, 200, { ok: true, total: targets.length, converted, cached, failed });
+  }
+
   // -------------------------
   // Admin APIs
   // -------------------------
@@ -2121,47 +2373,55 @@ const server = http.createServer(async (req, res) => {
     try {
       const parts = await readMultipart(req, boundary);
       const pwPart = parts.find((p) => p.name === 'password');
-      const filePart = parts.find((p) => p.name === 'file');
+      // Several `file` parts (per-period / per-store exports) are parsed in parallel and merged.
+      const fileParts = parts.filter((p) => p.name === 'file' && p.data && p.data.length > 0);
+      const fullPart = parts.find((p) => p.name === 'full');
       const password = pwPart ? pwPart.data.toString('utf8').trim() : '';
       if (!password) return sendJson(res, 400, { error: 'missing_password' });
-      if (!filePart || !filePart.data || filePart.data.length === 0) return sendJson(res, 400, { error: 'missing_file' });
+      if (fileParts.length === 0) return sendJson(res, 400, { error: 'missing_file' });
 
       const uploadsDir = path.join(dataDir, 'uploads');
       ensureDir(uploadsDir);
-      const tmpName = `smartstore.${Date.now()}.${crypto.randomUUID()}.xlsx`;
-      const tmpPath = path.join(uploadsDir, tmpName);
-      writeFileSync(tmpPath, filePart.data);
-
-      const scriptPath = path.join(__dirname, 'scripts', 'parse_smartstore_orders.py');
-      const run = spawnSync('python3', [scriptPath], {
-        env: {
-          ...process.env,
-          SMARTSTORE_XLSX_PASSWORD: password,
-          SMARTSTORE_XLSX_PATH: tmpPath,
-        },
-        encoding: 'utf8',
-        maxBuffer: 20 * 1024 * 1024,
+      const tmpPaths = fileParts.map((filePart) => {
+        const tmpName = `smartstore.${Date.now()}.${crypto.randomUUID()}.xlsx`;
+        const tmpPath = path.join(uploadsDir, tmpName);
+        writeFileSync(tmpPath, filePart.data);
+        return tmpPath;
       });
 
-      if (run.status !== 0) {
-        auditLog({ actorType: 'owner', actorId: OWNER_USERNAME, action: 'ADMIN_ORDERS_IMPORT_FAILED', ip: getClientIp(req), meta: { code: run.status, stderr: (run.stderr || '').slice(0, 2000) } });
-        return sendJson(res, 500, { error: 'parse_failed', stderr: (run.stderr || '').slice(0, 2000) });
-      }
-
-      const parsed = safeJsonParse(run.stdout || '', null);
-      if (!parsed || !Array.isArray(parsed.items)) return sendJson(res, 500, { error: 'bad_parse_output' });
-
       const mapping = loadMapping();
       const productToVendor = new Map((mapping.mapping || []).map((m2) => [String(m2.productNo), String(m2.vendorId)]));
 
-      const orders = loadOrders();
-      const byId = new Map((orders.orders || []).map((o) => [String(o.id), o]));
+      // Parsed rows are buffered and merged into a fresh copy of the store after the parse:
+      // tracking/assignment saves may land while the worker runs, and a snapshot taken
+      // before the await would overwrite them.
+      const knownIds = new Set((loadOrders().orders || []).map((o) => String(o.id)));
+      const parsed = new Map();
       let imported = 0;
       let assigned = 0;
       let unassigned = 0;
+      let summary = null;
       const now = new Date().toISOString();
 
-      for (const it of parsed.items) {
+      // Rows whose fingerprint matches the index are skipped by the parser. The index is only
+      // valid for the product->vendor mapping it was built with and for orders still in the store;
+      // `full=1` ignores it.
+      const mappingKey = crypto.createHash('sha1').update(JSON.stringify(mapping.mapping || [])).digest('hex');
+      let index = loadImportIndex();
+      let indexDirty = false;
+      if (index.mappingKey !== mappingKey || (fullPart && fullPart.data.toString('utf8').trim() === '1')) {
+        index = { mappingKey, fingerprints: {} };
+        indexDirty = true;
+      }
+      for (const id of Object.keys(index.fingerprints || {})) {
+        if (!knownIds.has(id)) {
+          delete index.fingerprints[id];
+          indexDirty = true;
+        }
+      }
+      if (indexDirty) saveImportIndex(index);
+
+      const importItem = (it) => {
         const id = String(it.product_order_no);
         const productNo = String(it.product_no || '');
         const vendorId = productToVendor.get(productNo) || null;
@@ -2182,7 +2442,7 @@ const server = http.createServer(async (req, res) => {
           status: vendorId ? 'assigned' : 'new',
           carrier: null,
           trackingNumber: '',
-          createdAt: byId.has(id) ? byId.get(id).createdAt : now,
+          createdAt: now,
           updatedAt: now,
           _raw: {
             orderedAt: it.ordered_at || null,
@@ -2194,22 +2454,72 @@ const server = http.createServer(async (req, res) => {
           },
         };
 
-        if (byId.has(id)) {
-          // overwrite mutable fields; keep tracking info if already entered
+        parsed.set(id, row);
+        if (it.fingerprint) index.fingerprints[id] = it.fingerprint;
+        imported++;
+      };
+
+      // Orders are saved only after a complete parse.
+      try {
+        const indexPath = Object.keys(index.fingerprints).length ? importIndexPath : null;
+        const [op, args] = tmpPaths.length === 1
+          ? ['parse_orders', { path: tmpPaths[0], password, index_path: indexPath }]
+          : ['parse_orders_batch', { paths: tmpPaths, password, index_path: indexPath }];
+        await pyWorkers.run(op, args, {
+          onRecord: (rec) => {
+            if (!rec || !rec.type) throw new Error('bad_parse_output');
+            if (rec.type === 'item') importItem(rec);
+            else if (rec.type === 'end' && rec.count === imported) summary = rec;
+          },
+          timeoutMs: WORKER_TIMEOUT_MS.parseOrders,
+        });
+      } catch (e) {
+        const stderr = String(e.pythonTraceback || e.message || e).slice(-2000);
+        auditLog({ actorType: 'owner', actorId: OWNER_USERNAME, action: 'ADMIN_ORDERS_IMPORT_FAILED', ip: getClientIp(req), meta: { stderr } });
+        return sendJson(res, 500, { error: 'parse_failed', stderr });
+      }
+      if (!summary) return sendJson(res, 500, { error: 'bad_parse_output' });
+
+      let totalAfter;
+      if (imported) {
+        // No await between load and save, so no other request can interleave.
+        const orders = loadOrders();
+        const byId = new Map((orders.orders || []).map((o) => [String(o.id), o]));
+        for (const [id, row] of parsed) {
           const prev = byId.get(id);
-          row.carrier = prev.carrier || row.carrier;
-          row.trackingNumber = prev.trackingNumber || row.trackingNumber;
+          if (prev) {
+            // overwrite mutable fields; keep tracking info if already entered
+            row.createdAt = prev.createdAt;
+            row.carrier = prev.carrier || row.carrier;
+            row.trackingNumber = prev.trackingNumber || row.trackingNumber;
+          }
+          byId.set(id, row);
         }
-
-        byId.set(id, row);
-        imported++;
+        orders.orders = Array.from(byId.values());
+        saveOrders(orders);
+        saveImportIndex(index);
+        totalAfter = orders.orders.length;
+      } else {
+        totalAfter = (loadOrders().orders || []).length;
       }
-
-      orders.orders = Array.from(byId.values());
-      saveOrders(orders);
-
-      auditLog({ actorType: 'owner', actorId: OWNER_USERNAME, action: 'ADMIN_ORDERS_IMPORTED', ip: getClientIp(req), meta: { imported, assigned, unassigned } });
-      return sendJson(res, 200, { ok: true, imported, assigned, unassigned, totalAfter: orders.orders.length });
+      const unchanged = summary.unchanged || 0;
+
+      const files = tmpPaths.length;
+      const duplicates = summary.duplicates || 0;
+
+      auditLog({ actorType: 'owner', actorId: OWNER_USERNAME, action: 'ADMIN_ORDERS_IMPORTED', ip: getClientIp(req), meta: { imported, assigned, unassigned, unchanged, rows: summary.rows, files, duplicates } });
+      return sendJson(res, 200, {
+        ok: true,
+        imported,
+        assigned,
+        unassigned,
+        new: summary.new || 0,
+        changed: summary.changed || 0,
+        unchanged,
+        files,
+        duplicates,
+        totalAfter,
+      });
     } catch (e) {
       return sendJson(res, 500, { error: 'import_exception', message: String(e?.message || e) });
     }
@@ -2317,6 +2627,53 @@ const server = http.createServer(async (req, res) => {
     return res.end(out);
   }
 
+  // All vendors' order sheets in one ZIP. The worker reads orders.json once, partitions it by
+  // vendorId and writes the per-vendor files in parallel (scripts/export_all_vendor_orders.py).
+  if (url.pathname === '/api/admin/vendor_orders_export.zip' && req.method === 'GET') {
+    const format = url.searchParams.get('format') === 'csv' ? 'csv' : 'xlsx';
+    const outDir = path.join(dataDir, 'exports', crypto.randomUUID());
+    const cleanup = () => {
+      try { rmSync(outDir, { recursive: true, force: true }); } catch {}
+    };
+
+    let files;
+    try {
+      const args = { orders_path: ordersPath, out_dir: outDir, format, vendors_path: vendorsPath };
+      ({ files } = await pyWorkers.run('export_all_vendor_orders', args, {
+        timeoutMs: WORKER_TIMEOUT_MS.exportAllVendorOrders,
+      }));
+    } catch (e) {
+      cleanup();
+      return sendJson(res, 500, { error: 'export_failed', stderr: String(e.pythonTraceback || e.message || e) });
+    }
+
+    const stamp = new Date().toISOString().slice(0, 10);
+    res.writeHead(200, {
+      'Content-Type': 'application/zip',
+      'Content-Disposition': `attachment; filename="vendor_orders-${stamp}.${format}.zip"`,
+    });
+    res.on('close', cleanup);
+
+    const archive = archiver('zip', { zlib: { level: 6 } });
+    archive.on('error', (e) => res.destroy(e));
+    archive.pipe(res);
+    for (const f of files) {
+      // named orders-<username> (or <vendorId>) by export_all_vendor_orders.py;
+      // xlsx is already deflated, storing it again just burns CPU
+      archive.file(path.join(outDir, f.file), { name: f.file, store: format === 'xlsx' });
+    }
+    archive.finalize();
+
+    auditLog({
+      actorType: 'owner',
+      actorId: OWNER_USERNAME,
+      action: 'ADMIN_VENDOR_ORDERS_EXPORT',
+      ip: getClientIp(req),
+      meta: { format, vendors: files.length, rows: files.reduce((n, f) => n + f.rows, 0) },
+    });
+    return;
+  }
+
   // -------------------------
   // Vendor APIs
   // -------------------------
@@ -2416,27 +2773,92 @@ const server = http.createServer(async (req, res) => {
     const vendor = requireVendor(req, res);
     if (!vendor) return;
 
-    const py = path.join(scriptsDir, 'export_vendor_orders_xlsx.py');
-    const out = spawnSync('python3', [py], {
-      env: {
-        ...process.env,
-        ORDERS_JSON_PATH: ordersPath,
-        VENDOR_ID: vendor.id,
-      },
-      maxBuffer: 20 * 1024 * 1024,
-    });
+    const version = vendorOrdersVersion(vendor.id);
+    const etag = version ? `"${VENDOR_EXPORT_FORMAT}-${version}"` : null;
+    const headers = {
+      'Content-Type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+      'Content-Disposition': `attachment; filename="orders-${vendor.username}.xlsx"`,
+      'Cache-Control': 'private, no-cache',
+      ...(etag ? { ETag: etag } : {}),
+    };
+    if (etag && etagMatches(req, etag)) {
+      res.writeHead(304, { ETag: etag, 'Cache-Control': headers['Cache-Control'] });
+      return res.end();
+    }
+
+    const cachePath = version ? path.join(exportCacheDir, vendorExportCacheName(vendor.id, version)) : null;
+    // Opened before any headers go out, so a cache file pruned or unreadable since the version
+    // check falls through to the streaming export below.
+    const cached = cachePath ? await openCachedExport(cachePath) : null;
+    if (cached) {
+      res.writeHead(200, { ...headers, 'Content-Length': cached.size });
+      const stream = cached.handle.createReadStream();
+      // A read error after the headers aborts the response rather than sending a short file.
+      stream.on('error', (e) => res.destroy(e));
+      res.on('close', () => stream.destroy());
+      stream.pipe(res);
+      auditLog({ actorType: 'vendor', actorId: vendor.id, action: 'DOWNLOAD_VENDOR_ORDERS_XLSX', ip: getClientIp(req), meta: { cached: true } });
+      return;
+    }
+
+    // Stream the workbook as the worker writes it (chunked transfer, no Content-Length),
+    // teeing the bytes into the cache file for the next download.
+    let cacheTmp = null;
+    let cacheOut = null;
+    if (cachePath) {
+      ensureDir(exportCacheDir);
+      cacheTmp = `${cachePath}.${crypto.randomUUID()}.tmp`;
+      cacheOut = createWriteStream(cacheTmp);
+      cacheOut.on('error', () => {}); // a failed cache write only costs the next download
+    }
+    const dropCacheTmp = () => {
+      cacheOut?.destroy();
+      if (cacheTmp) {
+        try { unlinkSync(cacheTmp); } catch {}
+      }
+    };
 
-    if (out.status !== 0) {
-      return sendJson(res, 500, { error: 'export_failed', stderr: String(out.stderr || '') });
+    let started = false;
+    try {
+      await pyWorkers.run('export_vendor_orders', { orders_path: ordersPath, vendor_id: vendor.id }, {
+        onChunk: (chunk, flow) => {
+          cacheOut?.write(chunk);
+          if (res.destroyed) return; // client went away: let the worker finish, drop the bytes
+          if (!started) {
+            started = true;
+            res.writeHead(200, headers);
+          }
+          if (!res.write(chunk)) {
+            flow.pause();
+            const resume = () => {
+              res.off('drain', resume);
+              res.off('close', resume);
+              flow.resume();
+            };
+            res.on('drain', resume);
+            res.on('close', resume);
+          }
+        },
+        timeoutMs: WORKER_TIMEOUT_MS.exportVendorOrders,
+      });
+    } catch (e) {
+      dropCacheTmp();
+      // Headers already sent: abort the response so the client sees a failed download, not a corrupt file.
+      if (started) return res.destroy(e);
+      return sendJson(res, 500, { error: 'export_failed', stderr: String(e.pythonTraceback || e.message || e) });
     }
 
     auditLog({ actorType: 'vendor', actorId: vendor.id, action: 'DOWNLOAD_VENDOR_ORDERS_XLSX', ip: getClientIp(req) });
+    res.end();
 
-    res.writeHead(200, {
-      'Content-Type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-      'Content-Disposition': `attachment; filename="orders-${vendor.username}.xlsx"`,
-    });
-    return res.end(out.stdout);
+    if (cacheOut) {
+      cacheOut.end(() => {
+        // Orders saved while exporting: the file may not match `version`, don't keep it.
+        if (cacheOut.errored || vendorOrdersVersion(vendor.id) !== version) return dropCacheTmp();
+        try { renameSync(cacheTmp, cachePath); } catch { dropCacheTmp(); }
+      });
+    }
+    return;
   }
 
   if (url.pathname === '/api/vendor/orders/bulk_tracking' && req.method === 'POST') {
@@ -3585,6 +4007,8 @@ async function _doAutoExecute() {
   }
 }
 
+ensureOrderIndex();
+
 server.listen(PORT, () => {
   console.log(`[dashboard] running on http://localhost:${PORT}`);
   console.log(`[dashboard] owner basic auth user=${OWNER_USERNAME} (password via DASHBOARD_PASSWORD)`);
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+server.mjs 엔드투엔드 테스트 공용 fixture
+
+server.mjs 는 __dirname/data 에 쓰므로 임시 디렉터리에 복사해서 실행한다.
+node 또는 npm 의존성이 없으면 server fixture 를 쓰는 테스트는 건너뛴다.
+테스트 모듈은 seed_data fixture 를 재정의해서 시작 전 data/ 에 파일을 넣을 수 있다.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import shutil
+import socket
+import subprocess
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+DASHBOARD_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+NODE = shutil.which('node')
+OWNER_PASSWORD = 'test-owner-pw'
+
+
+def npm_installed():
+    with open(os.path.join(DASHBOARD_DIR, 'package.json'), 'r', encoding='utf-8') as f:
+        deps = json.load(f).get('dependencies', {})
+    return all(os.path.exists(os.path.join(DASHBOARD_DIR, 'node_modules', name, 'package.json')) for name in deps)
+
+
+def vendor_account(vendor_id, username, password):
+    """data/vendors.json 항목 (server.mjs hashPassword 와 같은 pbkdf2)"""
+    salt = os.urandom(16)
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 120_000, 32)
+    return {'id': vendor_id, 'name': username, 'username': username, 'active': True,
+            'password': {'salt': salt.hex(), 'hash': digest.hex(), 'algo': 'pbkdf2_sha256', 'iter': 120_000}}
+
+
+class Dashboard:
+    """실행 중인 server.mjs — base URL, data 디렉터리, 요청 헬퍼"""
+
+    def __init__(self, base, data_dir):
+        self.base = base
+        self.data_dir = data_dir
+
+    def request(self, method, path, body=None, headers=None, owner=True, timeout=60):
+        """(status, headers, body bytes); owner 면 Basic 인증 헤더를 붙인다"""
+        headers = dict(headers or {})
+        if owner:
+            token = base64.b64encode(f'han:{OWNER_PASSWORD}'.encode()).decode()
+            headers['Authorization'] = f'Basic {token}'
+        if isinstance(body, dict):
+            body = json.dumps(body).encode()
+            headers.setdefault('Content-Type', 'application/json')
+        req = urllib.request.Request(f'{self.base}{path}', data=body, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                return resp.status, resp.headers, resp.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read()
+
+    def vendor_login(self, username, password):
+        """vendor_session 쿠키 헤더"""
+        status, headers, body = self.request('POST', '/api/vendor/login',
+                                             {'username': username, 'password': password}, owner=False)
+        assert status == 200, body
+        return {'Cookie': headers['Set-Cookie'].split(';', 1)[0]}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def seed_data():
+    """서버 시작 전 data/ 에 쓸 {파일 이름: JSON}"""
+    return {}
+
+
+@pytest.fixture
+def server(tmp_path, seed_data):
+    if not NODE or not npm_installed():
+        pytest.skip('node and npm dependencies are required')
+    root = tmp_path / 'dashboard'
+    (root / 'data').mkdir(parents=True)
+    shutil.copy(os.path.join(DASHBOARD_DIR, 'server.mjs'), root / 'server.mjs')
+    shutil.copy(os.path.join(DASHBOARD_DIR, 'package.json'), root / 'package.json')
+    for name in ('lib', 'scripts', 'public', 'node_modules'):
+        os.symlink(os.path.join(DASHBOARD_DIR, name), root / name)
+    for name, content in seed_data.items():
+        (root / 'data' / name).write_text(json.dumps(content, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    port = free_port()
+    env = {**os.environ, 'PORT': str(port), 'DASHBOARD_PASSWORD': OWNER_PASSWORD, 'PY_WORKERS': '1'}
+    env.pop('NAVER_CLIENT_ID', None)
+    proc = subprocess.Popen([NODE, 'server.mjs'], cwd=root, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    dashboard = Dashboard(f'http://127.0.0.1:{port}', root / 'data')
+    deadline = time.monotonic() + 20
+    while True:
+        try:
+            dashboard.request('GET', '/api/health', timeout=1)
+            break
+        except OSError:
+            if proc.poll() is not None or time.monotonic() > deadline:
+                proc.kill()
+                pytest.fail(f'server did not start: {proc.stderr.read().decode(errors="replace")}')
+            time.sleep(0.1)
+    try:
+        yield dashboard
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+전체 벤더 일괄 내보내기 단위 테스트 (파일 이름 규칙, 벤더별 행 분할)
+"""
+
+import csv
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from export_all_vendor_orders import export_all, load_usernames  # noqa: E402
+
+VENDOR_IDS = ('vendor_a', 'vendor_b', 'vendor_c', 'vendor/d')
+
+
+@pytest.fixture
+def orders_path(tmp_path):
+    orders = [{'id': str(i), 'productOrderNo': str(i), 'vendorId': VENDOR_IDS[i % 4], 'qty': 1}
+              for i in range(20)]
+    orders.append({'id': 'x', 'vendorId': None})
+    path = tmp_path / 'orders.json'
+    path.write_text(json.dumps({'orders': orders}), encoding='utf-8')
+    return str(path)
+
+
+def export(orders_path, tmp_path, usernames, jobs=1):
+    out_dir = str(tmp_path / 'out')
+    files = export_all(orders_path, out_dir, 'csv', jobs, usernames)
+    assert sorted(os.listdir(out_dir)) == sorted(f['file'] for f in files)
+    return {f['vendorId']: f['file'] for f in files}, out_dir
+
+
+class TestFileNames:
+    """orders-<username>, 없거나 겹치면 vendorId"""
+
+    def test_named_by_username(self, orders_path, tmp_path):
+        names, _ = export(orders_path, tmp_path, {'vendor_a': '대한식품', 'vendor_b': 'a/b'})
+        assert names == {
+            'vendor_a': 'orders-대한식품.csv',
+            'vendor_b': 'orders-a_b.csv',
+            'vendor_c': 'vendor_c.csv',
+            'vendor/d': 'vendor_d.csv',
+        }
+
+    def test_taken_username_falls_back_to_vendor_id(self, orders_path, tmp_path):
+        names, _ = export(orders_path, tmp_path, {'vendor_a': 'same', 'vendor_b': 'Same', 'vendor_c': 'other'})
+        assert sorted(names.values()) == sorted(['orders-same.csv', 'vendor_b.csv', 'orders-other.csv',
+                                                 'vendor_d.csv'])
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_rows_per_vendor(self, orders_path, tmp_path, jobs):
+        names, out_dir = export(orders_path, tmp_path, {}, jobs)
+        for name in names.values():
+            with open(os.path.join(out_dir, name), 'r', encoding='utf-8-sig', newline='') as f:
+                assert len(list(csv.reader(f))) == 1 + 5
+
+
+def test_load_usernames(tmp_path):
+    path = tmp_path / 'vendors.json'
+    path.write_text(json.dumps({'vendors': [{'id': 'v1', 'username': 'alpha'}, {'id': 'v2'}, 'bogus']}))
+    assert load_usernames(str(path)) == {'v1': 'alpha'}
+    assert load_usernames(str(tmp_path / 'missing.json')) == {}
+    assert load_usernames(None) == {}
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+IG 카드 이미지 준비 단위 테스트 (축소, EXIF 회전, 내용 해시 캐시 적중/미적중, 일괄 처리)
+"""
+
+import os
+import sys
+
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import image_ops  # noqa: E402
+from image_ops import prepare_image, prepare_images  # noqa: E402
+
+
+def photo(path, size=(3000, 2000), color=(200, 80, 40), orientation=None):
+    img = Image.new('RGB', size, color)
+    exif = Image.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    img.save(path, format='JPEG', quality=85, exif=exif)
+    return str(path)
+
+
+class TestConvert:
+    """변환/축소"""
+
+    def test_downscales_to_fit_card(self, tmp_path):
+        result = prepare_image(photo(tmp_path / 'a.jpg'), str(tmp_path / 'out.png'))
+        assert result == {'width': 1080, 'height': 720, 'cached': False}
+        with Image.open(tmp_path / 'out.png') as img:
+            assert (img.format, img.size) == ('PNG', (1080, 720))
+
+    def test_small_image_is_not_enlarged(self, tmp_path):
+        result = prepare_image(photo(tmp_path / 'a.jpg', size=(400, 300)), str(tmp_path / 'out.jpg'), 'jpg')
+        assert (result['width'], result['height']) == (400, 300)
+
+    def test_exif_orientation_applied(self, tmp_path):
+        result = prepare_image(photo(tmp_path / 'a.jpg', size=(2000, 1500), orientation=6), str(tmp_path / 'out.png'))
+        assert result['height'] == 1350 and result['width'] == pytest.approx(1012, abs=1)
+
+    def test_unsupported_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            prepare_image(photo(tmp_path / 'a.jpg'), str(tmp_path / 'out.gif'), 'GIF')
+
+
+class TestCache:
+    """내용 해시 캐시"""
+
+    def test_miss_then_hit(self, tmp_path, monkeypatch):
+        cache_dir = str(tmp_path / 'cache')
+        src = photo(tmp_path / 'a.jpg')
+        first = prepare_image(src, str(tmp_path / 'one.png'), cache_dir=cache_dir)
+        assert first['cached'] is False
+        assert len(os.listdir(cache_dir)) == 1
+
+        def unexpected(*args):
+            raise AssertionError('cached image was converted again')
+
+        monkeypatch.setattr(image_ops, '_convert', unexpected)
+        second = prepare_image(src, str(tmp_path / 'two.png'), cache_dir=cache_dir)
+        assert second == {**first, 'cached': True}
+        assert (tmp_path / 'one.png').read_bytes() == (tmp_path / 'two.png').read_bytes()
+
+    def test_content_and_options_are_keyed(self, tmp_path):
+        cache_dir = str(tmp_path / 'cache')
+        src = photo(tmp_path / 'a.jpg')
+        prepare_image(src, str(tmp_path / 'one.png'), cache_dir=cache_dir)
+        assert prepare_image(src, str(tmp_path / 'two.jpg'), 'JPEG', cache_dir=cache_dir)['cached'] is False
+        assert prepare_image(src, str(tmp_path / 'three.png'), max_size=(500, 500),
+                             cache_dir=cache_dir)['cached'] is False
+        other = photo(tmp_path / 'b.jpg', color=(10, 20, 30))
+        assert prepare_image(other, str(tmp_path / 'four.png'), cache_dir=cache_dir)['cached'] is False
+        assert len(os.listdir(cache_dir)) == 4
+
+    def test_prune_keeps_most_recent(self, tmp_path):
+        cache_dir = tmp_path / 'cache'
+        cache_dir.mkdir()
+        for i in range(5):
+            path = cache_dir / f'{i}.png'
+            path.write_bytes(b'x')
+            os.utime(path, (1000 + i, 1000 + i))
+        (cache_dir / 'inflight.png.1.tmp').write_bytes(b'x')
+        image_ops._prune_cache(str(cache_dir), keep=2)
+        assert sorted(os.listdir(cache_dir)) == ['3.png', '4.png', 'inflight.png.1.tmp']
+
+
+def test_prepare_images_reports_each_item(tmp_path):
+    records = []
+    items = [
+        {'src': photo(tmp_path / 'a.jpg'), 'dst': str(tmp_path / 'a.png')},
+        {'src': str(tmp_path / 'missing.jpg'), 'dst': str(tmp_path / 'b.png')},
+        {'src': photo(tmp_path / 'c.jpg', size=(600, 600)), 'dst': str(tmp_path / 'c.webp'), 'format': 'webp'},
+    ]
+    assert prepare_images(items, records.append, cache_dir=str(tmp_path / 'cache')) == 2
+    assert [(r['index'], r['ok']) for r in records] == [(0, True), (1, False), (2, True)]
+    assert records[1]['error']
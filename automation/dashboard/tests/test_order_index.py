@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+orders.json 벤더별 오프셋 인덱스 단위 테스트 (바이트 구간 읽기 vs 전체 스캔)
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from gen_order_fixtures import OrdersJsonWriter  # noqa: E402
+from order_index import INDEX_DIR_NAME, iter_vendor_orders, vendor_entry  # noqa: E402
+
+VENDORS = ('vendor_a', 'vendor_b', 'vendor_c')
+
+
+@pytest.fixture
+def orders_path(tmp_path):
+    path = str(tmp_path / 'orders.json')
+    writer = OrdersJsonWriter(path)
+    for i in range(60):
+        writer.append({
+            'id': str(i),
+            # 멀티바이트 문자와 이스케이프가 필요한 문자로 바이트 오프셋 검증
+            'productName': f'제주 감귤 {i}호 "특"\n',
+            'vendorId': None if i % 7 == 6 else VENDORS[i % 3],
+            'qty': i % 4 + 1,
+        })
+    writer.close()
+    return path
+
+
+def full_scan(path, vendor_id):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [o for o in json.load(f)['orders'] if o.get('vendorId') == vendor_id]
+
+
+class TestIterVendorOrders:
+    """인덱스 구간 읽기"""
+
+    def test_written_file_is_server_layout(self, orders_path):
+        with open(orders_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        assert text == json.dumps(json.loads(text), ensure_ascii=False, indent=2)
+
+    @pytest.mark.parametrize('vendor_id', VENDORS)
+    def test_spans_match_full_scan(self, orders_path, vendor_id):
+        entry = vendor_entry(os.path.join(os.path.dirname(orders_path), INDEX_DIR_NAME),
+                             vendor_id, os.stat(orders_path))
+        assert entry is not None and entry['spans']
+        assert list(iter_vendor_orders(orders_path, vendor_id)) == full_scan(orders_path, vendor_id)
+
+    def test_unknown_vendor_is_empty(self, orders_path):
+        index_dir = os.path.join(os.path.dirname(orders_path), INDEX_DIR_NAME)
+        assert vendor_entry(index_dir, 'vendor_zzz', os.stat(orders_path)) == {'spans': []}
+        assert list(iter_vendor_orders(orders_path, 'vendor_zzz')) == []
+
+    def test_missing_index_falls_back_to_scan(self, orders_path, tmp_path):
+        index_dir = str(tmp_path / 'no_index')
+        assert vendor_entry(index_dir, 'vendor_a', os.stat(orders_path)) is None
+        assert list(iter_vendor_orders(orders_path, 'vendor_a', index_dir)) == full_scan(orders_path, 'vendor_a')
+
+    def test_stale_index_falls_back_to_scan(self, orders_path):
+        # 다른 프로그램이 orders.json을 다시 쓴 경우 — 크기/mtime이 매니페스트와 달라짐
+        with open(orders_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['orders'] = [{'id': 'x', 'vendorId': 'vendor_a'}] + data['orders']
+        with open(orders_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        index_dir = os.path.join(os.path.dirname(orders_path), INDEX_DIR_NAME)
+        assert vendor_entry(index_dir, 'vendor_a', os.stat(orders_path)) is None
+        orders = list(iter_vendor_orders(orders_path, 'vendor_a'))
+        assert orders[0] == {'id': 'x', 'vendorId': 'vendor_a'}
+        assert orders == full_scan(orders_path, 'vendor_a')
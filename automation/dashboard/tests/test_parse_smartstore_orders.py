@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+스마트스토어 주문 엑셀 파서 단위 테스트 (단일 iter_rows 패스, itemgetter 추출기, 지문, 스키마 캐시, 병렬 병합)
+"""
+
+import datetime
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import parse_smartstore_orders as pso  # noqa: E402
+from gen_order_fixtures import DEFAULT_PASSWORD, HEADER, generate, write_encrypted_xlsx  # noqa: E402
+
+ROW = ('2026010100000001', 2026010100000000, '2026.01.01 09:00:00', '결제완료', '일반배송', None,
+       8000000001, '제주 감귤 2호', '옵션: 1kg', 2, '김민준', 'abcd****',
+       '이서연', ' 010-1234-5678 ', '서울특별시 강남구 테헤란로 1')
+
+
+def extractor(headers):
+    return pso.compile_extractor(pso.resolve_schema(list(headers)))
+
+
+class TestSchema:
+    """헤더 → 스키마 해석과 캐시"""
+
+    def test_resolve_shipping_export(self):
+        schema = pso.resolve_schema(HEADER)
+        assert schema['schema'] == 'shipping'
+        assert schema['columns']['recipient_address'] == [HEADER.index('통합배송지')]
+
+    def test_missing_product_order_no(self):
+        with pytest.raises(SystemExit):
+            pso.resolve_schema(['주문번호', '수취인명'])
+
+    def test_cache_written_and_reused(self, tmp_path, monkeypatch):
+        cache_path = str(tmp_path / 'schemas.json')
+        signature, entry = pso.load_schema(HEADER, cache_path)
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        assert cache['version'] == pso.SCHEMA_CACHE_VERSION
+        assert cache['schemas'][signature] == entry
+
+        def unexpected(headers):
+            raise AssertionError('cached schema was resolved again')
+
+        monkeypatch.setattr(pso, 'resolve_schema', unexpected)
+        assert pso.load_schema(HEADER, cache_path) == (signature, entry)
+
+    def test_stale_cache_version_is_ignored(self, tmp_path):
+        cache_path = tmp_path / 'schemas.json'
+        signature = pso.header_signature(HEADER)
+        cache_path.write_text(json.dumps({'version': -1, 'schemas': {signature: {'bogus': True}}}))
+        _, entry = pso.load_schema(HEADER, str(cache_path))
+        assert entry == pso.resolve_schema(HEADER)
+
+
+class TestExtractor:
+    """행 → 주문 항목"""
+
+    def test_read_headers_trims_trailing_blanks(self):
+        assert pso.read_headers(iter([('a', 'b', None, ''), ('x',)])) == ['a', 'b']
+
+    def test_converters(self):
+        item = extractor(HEADER)(ROW)
+        assert item['product_order_no'] == '2026010100000001'
+        assert item['order_no'] == '2026010100000000'
+        assert item['ordered_at'] == '2026-01-01T09:00:00'
+        assert item['product_no'] == '8000000001'
+        assert item['qty'] == 2
+        assert item['claim_status'] is None
+        assert item['recipient_phone'] == '010-1234-5678'
+        assert list(item) == [field for field, _, _ in pso.FIELD_SPECS]
+
+    def test_datetime_cells(self):
+        row = list(ROW)
+        row[2] = datetime.datetime(2026, 1, 2, 3, 4, 5)
+        assert extractor(HEADER)(row)['ordered_at'] == '2026-01-02T03:04:05'
+
+    def test_short_rows_are_padded(self):
+        item = extractor(HEADER)(ROW[:3])
+        assert item['order_no'] == '2026010100000000'
+        assert item['qty'] == 0
+        assert item['recipient_address'] is None
+
+    def test_split_address_columns_are_joined(self):
+        headers = ['상품주문번호', '수취인명', '기본배송지', '상세배송지']
+        item = extractor(headers)(('1', '이서연', '서울특별시 마포구 ', ' 101동 1202호'))
+        assert item['recipient_address'] == '서울특별시 마포구 101동 1202호'
+        assert item['ordered_at'] is None
+
+    def test_single_column_export(self):
+        assert extractor(['상품주문번호'])(('7',))['product_order_no'] == '7'
+
+
+class TestFingerprints:
+    """지문 기반 증분 가져오기"""
+
+    def test_fingerprint_tracks_field_changes(self):
+        item = extractor(HEADER)(ROW)
+        assert pso.fingerprint(item) == pso.fingerprint(dict(item))
+        assert pso.fingerprint(item) != pso.fingerprint({**item, 'qty': 3})
+
+    def test_iter_items_skips_unchanged(self):
+        extract = extractor(HEADER)
+        rows = [ROW, (), ('', ) + ROW[1:], ('2',) + ROW[1:], ('3',) + ROW[1:]]
+        known = {
+            '2026010100000001': pso.fingerprint(extract(ROW)),
+            '2': 'outdated',
+        }
+        stats, seen = {}, []
+        items = list(pso.iter_items(extract, iter(rows), known, stats, seen))
+        assert [item['product_order_no'] for item in items] == ['2', '3']
+        assert all(item['fingerprint'] == pso.fingerprint({k: v for k, v in item.items() if k != 'fingerprint'})
+                   for item in items)
+        assert stats == {'rows': 3, 'new': 1, 'changed': 1, 'unchanged': 1}
+        assert seen == ['2026010100000001', '2', '3']
+
+    def test_load_fingerprints(self, tmp_path):
+        path = tmp_path / 'index.json'
+        path.write_text(json.dumps({'fingerprints': {'1': 'abc'}}))
+        assert pso.load_fingerprints(str(path)) == {'1': 'abc'}
+        assert pso.load_fingerprints(str(tmp_path / 'missing.json')) == {}
+        path.write_text('[]')
+        assert pso.load_fingerprints(str(path)) == {}
+
+
+@pytest.fixture(scope='module')
+def export(tmp_path_factory):
+    fixture_dir = generate(120, str(tmp_path_factory.mktemp('fixtures')))
+    return os.path.join(fixture_dir, 'smartstore.xlsx')
+
+
+class TestParseOrders:
+    """암호화된 엑셀 전체 경로"""
+
+    def parse(self, export, tmp_path, known=None):
+        records = []
+        pso.parse_orders(export, DEFAULT_PASSWORD, records.append, known, str(tmp_path / 'schemas.json'))
+        return records
+
+    def test_all_rows_new(self, export, tmp_path):
+        records = self.parse(export, tmp_path)
+        assert records[0]['type'] == 'sheet' and records[0]['schema'] == 'shipping'
+        assert records[-1] == {'type': 'end', 'count': 120, 'rows': 120, 'new': 120, 'changed': 0, 'unchanged': 0}
+
+    def test_reimport_emits_only_changes(self, export, tmp_path):
+        items = [r for r in self.parse(export, tmp_path) if r['type'] == 'item']
+        known = {item['product_order_no']: item['fingerprint'] for item in items}
+        known[items[0]['product_order_no']] = 'outdated'
+        records = self.parse(export, tmp_path, known)
+        assert [r['product_order_no'] for r in records if r['type'] == 'item'] == [items[0]['product_order_no']]
+        assert records[-1]['changed'] == 1 and records[-1]['unchanged'] == 119
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_batch_keeps_first_file(self, export, tmp_path, jobs):
+        single = [r for r in self.parse(export, tmp_path) if r['type'] == 'item']
+        records = []
+        pso.parse_orders_batch([export, export], DEFAULT_PASSWORD, records.append,
+                               schema_cache=str(tmp_path / 'schemas.json'), jobs=jobs)
+        assert [r for r in records if r['type'] == 'item'] == single
+        assert [r['type'] for r in records].count('sheet') == 2
+        assert records[-1]['rows'] == 120 and records[-1]['duplicates'] == 120
+
+
+class TestParseOrdersBatch:
+    """여러 파일 병합 — 상태/클레임 날짜가 가장 늦은 행"""
+
+    HEADER = ['상품주문번호', '주문상태', '최종상태변경일']
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_latest_status_wins(self, tmp_path, jobs):
+        older = [('A', '결제완료', '2026.01.01 10:00:00'), ('B', '배송중', '2026.01.03'), ('C', '결제완료', None)]
+        newer = [('A', '배송중', '2026.01.02 09:00:00'), ('B', '결제완료', '2026.01.02'), ('C', '배송완료', None)]
+        paths = []
+        for name, rows in (('first.xlsx', older), ('second.xlsx', newer)):
+            paths.append(str(tmp_path / name))
+            # msoffcrypto can't read back packages under 4 KB (OLE mini stream); pad with other orders
+            filler = [(f'{name}-{i}', '결제완료', None) for i in range(200)]
+            write_encrypted_xlsx(rows + filler, paths[-1], DEFAULT_PASSWORD, header=self.HEADER)
+
+        records = []
+        pso.parse_orders_batch(paths, DEFAULT_PASSWORD, records.append, known={'C': 'outdated'},
+                               schema_cache=str(tmp_path / 'schemas.json'), jobs=jobs)
+        items = [r for r in records if r['type'] == 'item' and len(r['product_order_no']) == 1]
+        assert [(r['product_order_no'], r['order_status']) for r in items] == [
+            ('B', '배송중'), ('C', '결제완료'), ('A', '배송중')]
+        assert records[-1] == {'type': 'end', 'count': 403, 'files': 2, 'rows': 403, 'new': 402, 'changed': 1,
+                               'unchanged': 0, 'duplicates': 3}
+
+    def test_pool_does_not_fork(self):
+        assert pso._pool_context().get_start_method() != 'fork'
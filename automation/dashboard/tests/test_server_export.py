@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+벤더 주문 내보내기 엔드투엔드 테스트
+(/api/vendor/orders.xlsx 캐시: ETag/304, 캐시 파일, 벤더별 무효화 / 전체 벤더 ZIP 파일 이름)
+"""
+
+import io
+import json
+import time
+import zipfile
+
+import pytest
+from openpyxl import load_workbook
+
+from conftest import vendor_account
+
+VENDOR_PASSWORD = 'vendor-pw'
+
+
+def order(i, vendor_id):
+    return {'id': str(i), 'productOrderNo': str(i), 'productName': f'상품 {i}', 'qty': 1,
+            'vendorId': vendor_id, 'status': 'assigned' if vendor_id else 'new',
+            'createdAt': f'2026-01-01T00:00:{i:02d}Z'}
+
+
+@pytest.fixture
+def seed_data():
+    return {
+        'vendors.json': {'vendors': [vendor_account('vendor_a', 'alpha', VENDOR_PASSWORD),
+                                     vendor_account('vendor_b', 'bravo', VENDOR_PASSWORD)]},
+        'orders.json': {'orders': [order(i, ('vendor_a', 'vendor_b', None)[i % 3]) for i in range(12)]},
+    }
+
+
+def download(server, cookie, etag=None):
+    headers = {**cookie, **({'If-None-Match': etag} if etag else {})}
+    return server.request('GET', '/api/vendor/orders.xlsx', headers=headers, owner=False)
+
+
+def cached_files(server):
+    deadline = time.monotonic() + 5
+    while True:
+        names = sorted(p.name for p in (server.data_dir / 'export_cache').glob('*.xlsx'))
+        if len(names) == 2 or time.monotonic() > deadline:
+            return names
+        time.sleep(0.05)
+
+
+def audit(server, action):
+    with open(server.data_dir / 'audit.jsonl', 'r', encoding='utf-8') as f:
+        return [e for e in map(json.loads, f) if e['action'] == action]
+
+
+def rows(body):
+    wb = load_workbook(io.BytesIO(body), read_only=True)
+    try:
+        return sum(1 for _ in wb.active.iter_rows()) - 1
+    finally:
+        wb.close()
+
+
+def test_export_is_cached_and_revalidated(server):
+    alpha = server.vendor_login('alpha', VENDOR_PASSWORD)
+    bravo = server.vendor_login('bravo', VENDOR_PASSWORD)
+
+    status, headers, body = download(server, alpha)
+    assert status == 200 and rows(body) == 4
+    etag = headers['ETag']
+    assert headers['Content-Length'] is None  # streamed from the worker
+    status, headers, _ = download(server, bravo)
+    assert status == 200
+    bravo_etag = headers['ETag']
+    before = cached_files(server)
+    assert len(before) == 2
+
+    status, headers, cached = download(server, alpha)
+    assert status == 200 and cached == body
+    assert headers['ETag'] == etag and int(headers['Content-Length']) == len(body)
+    assert [e.get('meta') for e in audit(server, 'DOWNLOAD_VENDOR_ORDERS_XLSX')] == [None, None, {'cached': True}]
+
+    status, headers, not_modified = download(server, alpha, etag)
+    assert (status, headers['ETag'], not_modified) == (304, etag, b'')
+
+    # an assignment changes vendor_a's rows only
+    status, _, _ = server.request('POST', '/api/admin/orders_assign', {'vendorId': 'vendor_a', 'orderIds': ['2']})
+    assert status == 200
+    status, headers, body = download(server, alpha, etag)
+    assert status == 200 and headers['ETag'] != etag and rows(body) == 5
+    assert download(server, bravo, bravo_etag)[0] == 304
+    after = cached_files(server)
+    assert len(after) == 2
+    assert len(set(before) & set(after)) == 1
+
+    # a missing cache file falls back to the streaming export
+    for name in after:
+        (server.data_dir / 'export_cache' / name).unlink()
+    status, headers, streamed = download(server, alpha)
+    assert status == 200 and headers['Content-Length'] is None and rows(streamed) == 5
+
+
+def test_bulk_zip_names_files_by_username(server):
+    status, headers, body = server.request('GET', '/api/admin/vendor_orders_export.zip?format=csv')
+    assert status == 200 and headers['Content-Type'] == 'application/zip'
+    with zipfile.ZipFile(io.BytesIO(body)) as zf:
+        assert sorted(zf.namelist()) == ['orders-alpha.csv', 'orders-bravo.csv']
+        assert len(zf.read('orders-alpha.csv').decode('utf-8-sig').splitlines()) == 1 + 4
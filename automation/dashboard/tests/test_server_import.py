@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+/api/admin/orders_xlsx_import 엔드투엔드 테스트 (server.mjs + python 워커)
+"""
+
+import json
+import os
+import sys
+import uuid
+
+import pytest
+
+pytest.importorskip('openpyxl')
+pytest.importorskip('msoffcrypto')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from gen_order_fixtures import DEFAULT_PASSWORD, generate  # noqa: E402
+
+
+def post_import(server, xlsx_path, password):
+    boundary = uuid.uuid4().hex
+    with open(xlsx_path, 'rb') as f:
+        data = f.read()
+    body = b''.join([
+        f'--{boundary}\r\nContent-Disposition: form-data; name="password"\r\n\r\n{password}\r\n'.encode(),
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="orders.xlsx"\r\n'
+        'Content-Type: application/vnd.openxmlformats-officedocument.spreadsheetml.sheet\r\n\r\n'.encode(),
+        data,
+        f'\r\n--{boundary}--\r\n'.encode(),
+    ])
+    status, _, body = server.request('POST', '/api/admin/orders_xlsx_import', body, {
+        'Content-Type': f'multipart/form-data; boundary={boundary}',
+    })
+    return status, json.loads(body)
+
+
+def test_import_then_unchanged_reimport(server, tmp_path):
+    fixture_dir = generate(25, str(tmp_path / 'fixtures'))
+    xlsx_path = os.path.join(fixture_dir, 'smartstore.xlsx')
+
+    status, body = post_import(server, xlsx_path, DEFAULT_PASSWORD)
+    assert status == 200, body
+    assert body['imported'] == 25
+    assert body['totalAfter'] == 25
+    with open(server.data_dir / 'orders.json', 'r', encoding='utf-8') as f:
+        assert len(json.load(f)['orders']) == 25
+
+    # every row matches its fingerprint: nothing is imported, the store is untouched
+    status, body = post_import(server, xlsx_path, DEFAULT_PASSWORD)
+    assert status == 200, body
+    assert body['imported'] == 0
+    assert body['unchanged'] == 25
+    assert body['totalAfter'] == 25
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+상주 Python 워커 프레임 프로토콜 테스트 (record/chunk/done/error 프레임, 오류 후 계속 동작)
+"""
+
+import io
+import json
+import os
+import struct
+import subprocess
+import sys
+
+import pytest
+from openpyxl import load_workbook
+
+SCRIPTS = os.path.join(os.path.dirname(__file__), '..', 'scripts')
+sys.path.insert(0, SCRIPTS)
+
+from gen_order_fixtures import DEFAULT_PASSWORD, generate  # noqa: E402
+
+FRAME = struct.Struct('>II')
+
+
+class Worker:
+    """scripts/worker.py 프로세스 — 작업 한 줄 전송, 프레임 수신"""
+
+    def __init__(self):
+        self.proc = subprocess.Popen([sys.executable, os.path.join(SCRIPTS, 'worker.py')],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def frame(self):
+        head_len, body_len = FRAME.unpack(self.proc.stdout.read(FRAME.size))
+        header = json.loads(self.proc.stdout.read(head_len))
+        return header, self.proc.stdout.read(body_len)
+
+    def run(self, job_id, op, args):
+        """작업 하나 → done/error 까지의 프레임 목록"""
+        self.proc.stdin.write(json.dumps({'id': job_id, 'op': op, 'args': args}).encode() + b'\n')
+        self.proc.stdin.flush()
+        frames = []
+        while True:
+            header, body = self.frame()
+            assert header['id'] == job_id
+            frames.append((header, body))
+            if header['event'] in ('done', 'error'):
+                return frames
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait(timeout=10)
+        self.proc.stdout.close()
+        self.proc.stderr.close()
+
+
+@pytest.fixture
+def worker():
+    w = Worker()
+    try:
+        yield w
+    finally:
+        w.close()
+
+
+@pytest.fixture(scope='module')
+def fixture_dir(tmp_path_factory):
+    return generate(30, str(tmp_path_factory.mktemp('fixtures')), vendors=3)
+
+
+def test_error_frame_keeps_worker_running(worker, fixture_dir):
+    ((header, body),) = worker.run(1, 'no_such_op', {})
+    assert header['event'] == 'error' and 'unknown op' in header['message'] and body == b''
+
+    ((header, _),) = worker.run(2, 'parse_orders', {'path': os.path.join(fixture_dir, 'missing.xlsx'),
+                                                    'password': DEFAULT_PASSWORD})
+    assert header['event'] == 'error' and header['traceback']
+
+    frames = worker.run(3, 'parse_orders', {'path': os.path.join(fixture_dir, 'smartstore.xlsx'),
+                                            'password': DEFAULT_PASSWORD})
+    assert frames[-1][0] == {'id': 3, 'event': 'done', 'count': 30}
+
+
+def test_parse_orders_streams_records(worker, fixture_dir):
+    frames = worker.run(7, 'parse_orders', {'path': os.path.join(fixture_dir, 'smartstore.xlsx'),
+                                            'password': DEFAULT_PASSWORD})
+    records = [header['record'] for header, _ in frames[:-1]]
+    assert all(header['event'] == 'record' for header, _ in frames[:-1])
+    assert [r['type'] for r in records] == ['sheet'] + ['item'] * 30 + ['end']
+    assert records[-1]['count'] == 30
+
+
+def test_export_streams_chunk_frames(worker, fixture_dir):
+    orders_path = os.path.join(fixture_dir, 'orders.json')
+    with open(orders_path, 'r', encoding='utf-8') as f:
+        orders = json.load(f)['orders']
+    vendor_id = next(o['vendorId'] for o in orders if o['vendorId'])
+    expected = sum(1 for o in orders if o['vendorId'] == vendor_id)
+
+    frames = worker.run(9, 'export_vendor_orders', {'orders_path': orders_path, 'vendor_id': vendor_id})
+    done = frames[-1][0]
+    chunks = [body for header, body in frames[:-1] if header['event'] == 'chunk']
+    assert len(chunks) == len(frames) - 1
+    data = b''.join(chunks)
+    assert done == {'id': 9, 'event': 'done', 'rows': expected, 'bytes': len(data)}
+
+    wb = load_workbook(io.BytesIO(data), read_only=True)
+    try:
+        assert sum(1 for _ in wb.active.iter_rows()) == expected + 1
+    finally:
+        wb.close()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+스트리밍 xlsx 작성기 단위 테스트 (openpyxl로 다시 읽기)
+"""
+
+import gc
+import io
+import os
+import sys
+import zipfile
+
+import pytest
+from openpyxl import load_workbook
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from xlsx_stream import XlsxStreamWriter  # noqa: E402
+
+ROWS = [
+    ['상품주문번호', '수량', '금액', '발송', '비고'],
+    ['2026010100000001', 2, 12500.5, True, '  앞뒤 공백  '],
+    ['2026010100000002', 0, -1, False, None],
+    ['<&">', None, '', 3, 'tab\there\x01\x1f'],
+]
+
+EXPECTED = [
+    ('상품주문번호', '수량', '금액', '발송', '비고'),
+    ('2026010100000001', 2, 12500.5, True, '  앞뒤 공백  '),
+    ('2026010100000002', 0, -1, False, None),
+    ('<&">', None, None, 3, 'tab\there'),
+]
+
+
+def write(rows, **kwargs):
+    out = io.BytesIO()
+    with XlsxStreamWriter(out, kwargs.pop('title', '주문'), **kwargs) as xw:
+        for row in rows:
+            xw.append(row)
+    out.seek(0)
+    return out
+
+
+def read(out):
+    wb = load_workbook(out, read_only=True)
+    ws = wb.active
+    rows = [tuple(row) for row in ws.iter_rows(values_only=True)]
+    # <dimension>이 없어 read-only 모드는 행마다 마지막 값까지만 돌려줌
+    width = max(map(len, rows), default=0)
+    return ws.title, [row + (None,) * (width - len(row)) for row in rows]
+
+
+class TestXlsxStreamWriter:
+    """openpyxl 호환성"""
+
+    @pytest.mark.parametrize('shared_strings', [False, True])
+    def test_round_trip(self, shared_strings):
+        title, rows = read(write(ROWS, shared_strings=shared_strings))
+        assert title == '주문'
+        assert rows == EXPECTED
+
+    def test_shared_strings_are_deduplicated(self):
+        out = write([['같은 값', '같은 값'], ['같은 값']], shared_strings=True)
+        with zipfile.ZipFile(out) as zf:
+            assert zf.read('xl/sharedStrings.xml').decode('utf-8').count('<si>') == 1
+        assert read(out)[1] == [('같은 값', '같은 값'), ('같은 값', None)]
+
+    def test_many_rows_across_flushes(self):
+        rows = [[f'{i:08d}', i, f'상품 {i % 37}'] for i in range(5000)]
+        _, back = read(write(rows, shared_strings=True))
+        assert back == [tuple(row) for row in rows]
+
+    def test_title_is_escaped(self):
+        assert read(write([['x']], title='a "b" & c'))[0] == 'a "b" & c'
+
+    def test_exception_leaves_unreadable_output(self):
+        out = io.BytesIO()
+        with pytest.raises(RuntimeError):
+            with XlsxStreamWriter(out, '주문') as xw:
+                xw.append(['1'])
+                raise RuntimeError('boom')
+        assert not out.closed
+        assert not zipfile.is_zipfile(io.BytesIO(out.getvalue()))
+
+    def test_abort_writes_nothing_more(self, monkeypatch):
+        unraisable = []
+        monkeypatch.setattr(sys, 'unraisablehook', unraisable.append)
+        out = io.BytesIO()
+        xw = XlsxStreamWriter(out, '주문')
+        xw.append(['1'])
+        written = out.getvalue()
+        xw.abort()
+        del xw
+        gc.collect()
+        assert out.getvalue() == written and out.tell() == len(written)
+        assert unraisable == []
+
+    def test_abort_on_unseekable_output(self):
+        class Sink:
+            def __init__(self):
+                self.data = bytearray()
+
+            def write(self, data):
+                self.data += data
+                return len(data)
+
+            def flush(self):
+                pass
+
+        sink = Sink()
+        with pytest.raises(RuntimeError):
+            with XlsxStreamWriter(sink, '주문') as xw:
+                xw.append(['1'])
+                written = bytes(sink.data)
+                raise RuntimeError('boom')
+        assert bytes(sink.data) == written
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Alert Rule Engine
+가격/김치 프리미엄 알림 규칙 엔진
+
+규칙 파일에 등록된 수천 개의 알림 규칙을 조회(틱)마다 증분 평가합니다.
+(거래소, 코인, 지표)별로 임계값을 정렬해 두고, 직전 값과 현재 값 사이에서 경계를
+넘은 규칙만 이진 탐색으로 찾아 확인하므로 규칙 수가 늘어나도 평가 비용이 거의
+늘지 않습니다. 히스테리시스(재무장 간격)와 쿨다운을 지원하며, 쿨다운 중에 경계를 넘은
+규칙은 조건이 유지되면 쿨다운이 끝난 뒤 첫 평가에서 발동합니다.
+
+규칙 파일 형식 (한 줄에 하나, # 주석):
+
+    BTC upbit premium > 3%
+    ETH < ₩4,000,000
+    XRP bithumb premium < -1% hysteresis=0.5 cooldown=600
+    SOL binance price > $250
+
+거래소는 exchanges.ADAPTERS 에 등록된 이름 (upbit, bithumb, binance, coinone, korbit, okx).
+거래소를 생략하면 upbit, 지표를 생략하면 값에 %가 있으면 premium, 없으면 price 입니다.
+>= / <= 는 > / < 와 같게 취급합니다.
+"""
+
+import bisect
+import json
+import os
+import re
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from exchanges import ADAPTERS
+
+# 기본 히스테리시스: 프리미엄 0.2%p, 가격 0.5%
+DEFAULT_HYSTERESIS = {'premium': 0.2, 'price': 0.005}
+DEFAULT_COOLDOWN = 300.0
+
+RULE_PATTERN = re.compile(
+    r'^(?P<symbol>[A-Za-z0-9]+)\s+'
+    r'(?:(?P<exchange>' + '|'.join(ADAPTERS) + r')\s+)?'
+    r'(?:(?P<metric>price|premium)\s*)?'
+    r'(?P<op>>=|<=|>|<)\s*'
+    r'(?P<value>[₩$]?\s*[-+]?[\d,]*\.?\d+\s*%?)'
+    r'(?P<options>(?:\s+\w+=[\d.]+)*)\s*$',
+    re.IGNORECASE,
+)
+
+SeriesKey = Tuple[str, str, str]  # (exchange, symbol, metric)
+
+
+class Rule:
+    """알림 규칙 1개"""
+
+    __slots__ = ('key', 'text', 'exchange', 'symbol', 'metric', 'above', 'threshold',
+                 'hysteresis', 'cooldown', 'armed', 'last_fired')
+
+    def __init__(self, text: str, exchange: str, symbol: str, metric: str, above: bool,
+                 threshold: float, hysteresis: float, cooldown: float):
+        self.text = text
+        self.exchange = exchange
+        self.symbol = symbol
+        self.metric = metric
+        self.above = above
+        self.threshold = threshold
+        self.hysteresis = hysteresis
+        self.cooldown = cooldown
+        # 상태 저장 키 — 옵션까지 포함해 규칙마다 따로 재무장/쿨다운 상태 유지
+        self.key = (f"{exchange} {symbol} {metric} {'>' if above else '<'} {threshold:g}"
+                    f" hysteresis={hysteresis:g} cooldown={cooldown:g}")
+        self.armed = True
+        self.last_fired = 0.0
+
+    @property
+    def rearm_level(self) -> float:
+        """재무장 경계 — 임계값에서 히스테리시스만큼 반대쪽"""
+        return self.threshold - self.hysteresis if self.above else self.threshold + self.hysteresis
+
+    def holds(self, value: float) -> bool:
+        """값이 조건을 만족하는지 (임계값을 넘은 상태)"""
+        return value > self.threshold if self.above else value < self.threshold
+
+
+def parse_rule(line: str, default_cooldown: float = DEFAULT_COOLDOWN) -> Rule:
+    """규칙 한 줄 파싱"""
+    match = RULE_PATTERN.match(line.strip())
+    if not match:
+        raise ValueError(f"규칙 형식 오류: {line.strip()}")
+
+    raw_value = match.group('value').replace(' ', '')
+    is_percent = raw_value.endswith('%')
+    value = float(raw_value.strip('₩$%').replace(',', ''))
+
+    metric = (match.group('metric') or ('premium' if is_percent else 'price')).lower()
+    exchange = (match.group('exchange') or 'upbit').lower()
+    if metric == 'premium' and ADAPTERS[exchange].quote != 'KRW':
+        raise ValueError(f"{ADAPTERS[exchange].label}에는 김치 프리미엄이 없습니다 (원화 마켓 전용): {line.strip()}")
+
+    options = dict(opt.split('=') for opt in match.group('options').split())
+    unknown = sorted(set(options) - {'hysteresis', 'cooldown'})
+    if unknown:
+        raise ValueError(f"알 수 없는 옵션 {', '.join(unknown)}: {line.strip()}")
+    if 'hysteresis' in options:
+        hysteresis = float(options['hysteresis'])
+    elif metric == 'price':
+        hysteresis = abs(value) * DEFAULT_HYSTERESIS['price']
+    else:
+        hysteresis = DEFAULT_HYSTERESIS['premium']
+
+    return Rule(
+        text=line.strip(),
+        exchange=exchange,
+        symbol=match.group('symbol').upper(),
+        metric=metric,
+        above=match.group('op').startswith('>'),
+        threshold=value,
+        hysteresis=hysteresis,
+        cooldown=float(options.get('cooldown', default_cooldown)),
+    )
+
+
+def load_rules(path: str, default_cooldown: float = DEFAULT_COOLDOWN) -> List[Rule]:
+    """규칙 파일 로드 (형식 오류 줄은 경고 후 건너뜀)"""
+    rules = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            try:
+                rules.append(parse_rule(line, default_cooldown))
+            except ValueError as e:
+                print(f"⚠️  {path}:{lineno} {e}")
+    return rules
+
+
+class _SortedRules:
+    """경계값 기준 정렬된 규칙 목록"""
+
+    __slots__ = ('levels', 'rules')
+
+    def __init__(self, pairs: List[Tuple[float, Rule]]):
+        pairs.sort(key=lambda pair: pair[0])
+        self.levels = [level for level, _ in pairs]
+        self.rules = [rule for _, rule in pairs]
+
+    def between(self, low: float, high: float, rising: bool) -> List[Rule]:
+        """상승이면 low <= level < high, 하락이면 low < level <= high 범위 규칙"""
+        if rising:
+            start = bisect.bisect_left(self.levels, low)
+            end = bisect.bisect_left(self.levels, high)
+        else:
+            start = bisect.bisect_right(self.levels, low)
+            end = bisect.bisect_right(self.levels, high)
+        return self.rules[start:end]
+
+
+class _SeriesIndex:
+    """(거래소, 코인, 지표) 하나의 규칙 인덱스"""
+
+    __slots__ = ('rules', 'above_fire', 'above_rearm', 'below_fire', 'below_rearm', 'last', 'pending')
+
+    def __init__(self, rules: List[Rule]):
+        self.rules = rules
+        above = [rule for rule in rules if rule.above]
+        below = [rule for rule in rules if not rule.above]
+        self.above_fire = _SortedRules([(rule.threshold, rule) for rule in above])
+        self.above_rearm = _SortedRules([(rule.rearm_level, rule) for rule in above])
+        self.below_fire = _SortedRules([(rule.threshold, rule) for rule in below])
+        self.below_rearm = _SortedRules([(rule.rearm_level, rule) for rule in below])
+        self.last: Optional[float] = None
+        # 쿨다운 중 교차해 발동을 미룬 규칙 (조건이 유지되는 동안)
+        self.pending: List[Rule] = []
+
+    def crossed(self, value: float) -> Tuple[List[Rule], List[Rule]]:
+        """(발동 후보, 재무장 대상) — 직전 값과 현재 값 사이 경계를 넘은 규칙만"""
+        prev, self.last = self.last, value
+        if prev is None:
+            # 첫 관측: 이미 조건을 만족하는 규칙 전체가 후보
+            fire = self.above_fire.between(float('-inf'), value, rising=True)
+            fire += self.below_fire.between(value, float('inf'), rising=False)
+            return fire, []
+        if value > prev:
+            fire = self.above_fire.between(prev, value, rising=True)
+            rearm = self.below_rearm.between(prev, value, rising=True)
+        elif value < prev:
+            fire = self.below_fire.between(value, prev, rising=False)
+            rearm = self.above_rearm.between(value, prev, rising=False)
+        else:
+            return [], []
+        return fire, rearm
+
+
+class AlertEngine:
+    """거래소/코인/지표별 정렬 인덱스 기반 증분 알림 평가기"""
+
+    def __init__(self, rules: List[Rule], state_path: Optional[str] = None):
+        self.rules = rules
+        self.state_path = state_path
+
+        grouped: Dict[SeriesKey, List[Rule]] = {}
+        for rule in rules:
+            grouped.setdefault((rule.exchange, rule.symbol, rule.metric), []).append(rule)
+        self.index = {key: _SeriesIndex(group) for key, group in grouped.items()}
+        self.load_state()
+
+    def symbols(self) -> List[str]:
+        """규칙이 참조하는 코인 목록"""
+        return sorted({symbol for _, symbol, _ in self.index})
+
+    def symbol_exchanges(self) -> Dict[str, Set[str]]:
+        """코인별로 규칙 평가에 필요한 거래소 (프리미엄 규칙은 기준가인 binance 포함)"""
+        needed: Dict[str, Set[str]] = {}
+        for exchange, symbol, metric in self.index:
+            exchanges = needed.setdefault(symbol, set())
+            exchanges.add(exchange)
+            if metric == 'premium':
+                exchanges.add('binance')
+        return needed
+
+    def update(self, exchange: str, symbol: str, metric: str, value: float,
+               ts: Optional[float] = None) -> List[Dict]:
+        """값 1건 반영 — 발동한 알림 목록 반환"""
+        series = self.index.get((exchange, symbol, metric))
+        if series is None:
+            return []
+        ts = time.time() if ts is None else ts
+
+        fire, rearm = series.crossed(value)
+        for rule in rearm:
+            rule.armed = True
+
+        # 쿨다운 중 교차한 규칙은 조건이 유지되는 동안 매 평가마다 다시 확인
+        pending, series.pending = series.pending, []
+        if pending:
+            crossed = set(fire)
+            fire = fire + [rule for rule in pending if rule.holds(value) and rule not in crossed]
+
+        alerts = []
+        for rule in fire:
+            if not rule.armed:
+                continue
+            if ts - rule.last_fired < rule.cooldown:
+                # 쿨다운이 끝난 뒤 첫 평가에서 조건이 여전히 만족되면 발동
+                series.pending.append(rule)
+                continue
+            rule.armed = False
+            rule.last_fired = ts
+            alerts.append({
+                'rule': rule.text,
+                'exchange': exchange,
+                'symbol': symbol,
+                'metric': metric,
+                'value': value,
+                'threshold': rule.threshold,
+                'direction': 'above' if rule.above else 'below',
+                'ts': ts,
+            })
+        return alerts
+
+    def update_snapshot(self, data: Dict, premiums: Dict[Tuple[str, str], float],
+                        ts: Optional[float] = None) -> List[Dict]:
+        """get_all_prices() 결과 + 프리미엄 한 번을 반영"""
+        ts = time.time() if ts is None else ts
+        alerts = []
+        for exchange, symbol, metric in self.index:
+            if metric == 'premium':
+                value = premiums.get((exchange, symbol))
+            else:
+                value = (data.get(exchange) or {}).get(symbol, {}).get('price')
+            if value is not None:
+                alerts.extend(self.update(exchange, symbol, metric, value, ts))
+        return alerts
+
+    # ------------------------------------------------------------------
+    # 상태 저장 (실행 간 재무장/쿨다운 유지)
+    # ------------------------------------------------------------------
+    def load_state(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  알림 상태 로드 실패: {e}")
+            return
+
+        rules_state = state.get('rules', {})
+        for rule in self.rules:
+            saved = rules_state.get(rule.key)
+            if saved:
+                rule.armed, rule.last_fired = bool(saved[0]), float(saved[1])
+        for key, value in state.get('last', {}).items():
+            series = self.index.get(tuple(key.split(' ')))
+            if series is not None:
+                series.last = value
+                # 무장 상태로 조건을 만족하고 있던 규칙 (쿨다운으로 미뤄졌거나 새로 추가된 규칙)
+                series.pending = [rule for rule in series.rules if rule.armed and rule.holds(value)]
+
+    def save_state(self):
+        if not self.state_path:
+            return
+        state = {
+            'rules': {rule.key: [rule.armed, rule.last_fired] for rule in self.rules},
+            'last': {' '.join(key): series.last for key, series in self.index.items() if series.last is not None},
+        }
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Candle Backfill
+캔들 히스토리 백필 + 로컬 캐시
+
+업비트/빗썸/바이낸스의 분/시간/일 캔들을 추적 대상 전체에 대해 내려받습니다.
+페이지 단위 요청은 거래소별 호출 제한 안에서 동시에 실행되고, 결과는 시리즈별
+.npy 파일(numpy.load(mmap_mode='r') 가능)과 수집 구간 목록에 저장되어 이후 실행에서는
+비어 있는 구간만 다시 요청합니다.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from exchanges import CANDLE_DTYPE
+from history import TICK_DTYPE
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.korean-crypto-tracker', 'candles')
+
+# 간격별 초 단위 길이
+INTERVAL_SECONDS = {
+    'minute': 60,
+    'hour': 60 * 60,
+    'day': 24 * 60 * 60,
+}
+
+# 일봉 시작 시각의 UTC 기준 오프셋 — 빗썸 일봉은 KST(UTC+9) 자정, 업비트/바이낸스는 UTC 자정
+DAY_CANDLE_UTC_OFFSET = {'bithumb': 9 * 60 * 60}
+
+# 간격별 기본 백필 기간 (일)
+DEFAULT_BACKFILL_DAYS = {
+    'minute': 1,
+    'hour': 30,
+    'day': 365,
+}
+
+Range = Tuple[int, int]  # [start, end) unix seconds
+
+
+def merge_ranges(ranges: List[Range]) -> List[Range]:
+    """겹치거나 맞닿은 구간 병합"""
+    merged: List[List[int]] = []
+    for start, end in sorted(ranges):
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def subtract_ranges(start: int, end: int, covered: List[Range]) -> List[Range]:
+    """[start, end) 에서 이미 수집된 구간을 뺀 나머지"""
+    missing = []
+    cursor = start
+    for c_start, c_end in merge_ranges(covered):
+        if c_end <= cursor or c_start >= end:
+            continue
+        if c_start > cursor:
+            missing.append((cursor, c_start))
+        cursor = max(cursor, c_end)
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+class CandleCache:
+    """거래소/간격/코인별 캔들 캐시"""
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR):
+        self.root = root
+
+    def _base(self, exchange: str, interval: str, symbol: str) -> str:
+        return os.path.join(self.root, exchange, interval, symbol)
+
+    def coverage(self, exchange: str, interval: str, symbol: str) -> List[Range]:
+        path = self._base(exchange, interval, symbol) + '.json'
+        if not os.path.exists(path):
+            return []
+        with open(path, 'r', encoding='utf-8') as f:
+            return [tuple(r) for r in json.load(f).get('ranges', [])]
+
+    def missing(self, exchange: str, interval: str, symbol: str, start: int, end: int) -> List[Range]:
+        return subtract_ranges(start, end, self.coverage(exchange, interval, symbol))
+
+    def load(self, exchange: str, interval: str, symbol: str, mmap: bool = True) -> np.ndarray:
+        path = self._base(exchange, interval, symbol) + '.npy'
+        if not os.path.exists(path):
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        return np.load(path, mmap_mode='r' if mmap else None)
+
+    def store(self, exchange: str, interval: str, symbol: str,
+              candles: np.ndarray, ranges: List[Range]):
+        """새 캔들 병합 저장 + 수집 구간 갱신"""
+        base = self._base(exchange, interval, symbol)
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+
+        existing = self.load(exchange, interval, symbol, mmap=False)
+        merged = np.concatenate([np.asarray(candles, dtype=CANDLE_DTYPE), existing])
+        # 같은 시각은 새로 받은 값 우선
+        _, first = np.unique(merged['ts'], return_index=True)
+        merged = merged[first]
+
+        tmp_path = base + '.tmp.npy'
+        np.save(tmp_path, merged)
+        os.replace(tmp_path, base + '.npy')
+
+        covered = merge_ranges(self.coverage(exchange, interval, symbol) + list(ranges))
+        with open(base + '.json.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'ranges': covered}, f)
+        os.replace(base + '.json.tmp', base + '.json')
+
+
+# ----------------------------------------------------------------------
+# 백필
+# ----------------------------------------------------------------------
+def _pages(start: int, end: int, step: int, page_size: int) -> List[Range]:
+    span = step * page_size
+    return [(s, min(s + span, end)) for s in range(start, end, span)]
+
+
+def plan_requests(tracker, cache: CandleCache, interval: str, start: int, end: int,
+                  exchanges: List[str], listed: Optional[Dict[str, Set[str]]] = None) -> List[Tuple]:
+    """캐시에 없는 구간만 페이지 요청으로 분해 (listed: 거래소별 상장 코인 — 없는 코인은 건너뜀)"""
+    step = INTERVAL_SECONDS[interval]
+    listed = listed or {}
+    tasks = []
+    for exchange in exchanges:
+        adapter = tracker.adapters[exchange]
+        symbols = listed.get(exchange)
+        for symbol in tracker.symbols_for(exchange):
+            if symbols is not None and symbol not in symbols:
+                continue
+            missing = cache.missing(exchange, interval, symbol, start, end)
+            if not missing:
+                continue
+            if adapter.candle_page_size is None:
+                # 페이지 조회 불가 — 1회 요청으로 받을 수 있는 만큼만
+                tasks.append((exchange, symbol, missing))
+                continue
+            for m_start, m_end in missing:
+                for page in _pages(m_start, m_end, step, adapter.candle_page_size):
+                    tasks.append((exchange, symbol, [page]))
+    return tasks
+
+
+def listed_symbols(tracker, exchanges: List[str]) -> Dict[str, Set[str]]:
+    """거래소별 상장 코인 목록 (조회 실패한 거래소는 거르지 않음)"""
+    listed = {}
+    for exchange in exchanges:
+        adapter = tracker.adapters[exchange]
+        try:
+            listed[exchange] = adapter.list_symbols()
+        except Exception as e:
+            print(f"⚠️  {adapter.label} 마켓 목록 조회 실패: {e}")
+    return listed
+
+
+def backfill(tracker, interval: str, start: int, end: int,
+             exchanges: Optional[List[str]] = None,
+             cache: Optional[CandleCache] = None,
+             workers: int = 16) -> Dict[str, int]:
+    """추적 대상 전체 캔들 백필 — 거래소별 받은 캔들 수 반환"""
+    exchanges = [ex for ex in (exchanges or tracker.adapters) if ex in tracker.adapters]
+    for exchange in list(exchanges):
+        adapter = tracker.adapters[exchange]
+        if not adapter.supports('fetch_candles'):
+            print(f"⚠️  {adapter.label}: 캔들 조회를 지원하지 않아 건너뜁니다.")
+            exchanges.remove(exchange)
+    cache = cache or CandleCache()
+    step = INTERVAL_SECONDS[interval]
+    # 진행 중인 캔들은 제외
+    end = min(end, int(time.time()) // step * step)
+    start = start // step * step
+
+    # 상장되지 않은 코인은 요청하지 않음 (바이낸스는 매번 HTTP 400)
+    listed = listed_symbols(tracker, exchanges)
+    tasks = plan_requests(tracker, cache, interval, start, end, exchanges, listed)
+
+    def run(task):
+        # 거래소별 호출 제한은 어댑터가 적용
+        exchange, symbol, ranges = task
+        adapter = tracker.adapters[exchange]
+        lo, hi = ranges[0][0], ranges[-1][1]
+        candles = adapter.fetch_candles(symbol, interval, lo, hi)
+        if candles.size:
+            candles = candles[(candles['ts'] >= lo) & (candles['ts'] < hi)]
+        if adapter.candle_page_size is not None:
+            return candles, ranges
+        # 페이지 조회 불가 거래소는 최근 구간만 반환 — 실제로 받은 구간만 수집 완료로 기록
+        if candles.size == 0:
+            return candles, []
+        return candles, [(int(candles['ts'].min()), hi)]
+
+    # 시리즈별로 모아서 한 번에 저장
+    results: Dict[Tuple[str, str], List] = {}
+    counts = {exchange: 0 for exchange in exchanges}
+    failed = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run, task): task for task in tasks}
+        for future in as_completed(futures):
+            exchange, symbol, _ = futures[future]
+            try:
+                candles, covered = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"⚠️  {exchange} {symbol} 캔들 조회 실패: {e}")
+                continue
+            parts = results.setdefault((exchange, symbol), [[], []])
+            parts[0].append(candles)
+            parts[1].extend(covered)
+            counts[exchange] += int(candles.size)
+
+    for (exchange, symbol), (candles, ranges) in results.items():
+        cache.store(exchange, interval, symbol, np.concatenate(candles), ranges)
+
+    if failed:
+        print(f"⚠️  실패한 요청 {failed}건은 다음 실행에서 다시 시도합니다.")
+    return counts
+
+
+# ----------------------------------------------------------------------
+# 히스토리/베이스라인 시딩
+# ----------------------------------------------------------------------
+def _join_keys(candles: np.ndarray, exchange: str, interval: str) -> np.ndarray:
+    """거래소 간 캔들 매칭 키 — 일봉은 거래소 기준 시간대의 날짜, 그 외는 시작 시각"""
+    if interval != 'day':
+        return candles['ts']
+    return (candles['ts'] + DAY_CANDLE_UTC_OFFSET.get(exchange, 0)) // INTERVAL_SECONDS['day']
+
+
+def seed_history(tracker, cache: CandleCache, interval: str, store, baseline=None) -> int:
+    """캐시된 캔들로 틱 히스토리와 거래량 베이스라인 초기화
+
+    과거 환율은 없으므로 현재 환율로 프리미엄을 근사합니다. 거래량은 캔들 거래량의
+    24시간 이동 합계로 24h 거래량을 재구성하며, 24시간 구간이 다 차지 않은 앞쪽
+    캔들은 부분 합계가 베이스라인을 낮추지 않도록 시딩하지 않습니다. 일봉 프리미엄은
+    빗썸(KST 자정)과 바이낸스(UTC 자정)의 시작 시각이 달라 같은 날짜끼리 매칭합니다.
+    """
+    step = INTERVAL_SECONDS[interval]
+    day = INTERVAL_SECONDS['day']
+    usd_krw = tracker.usd_krw_rate
+
+    parts = []
+    for symbol in tracker.symbols.keys():
+        global_candles = cache.load('binance', interval, symbol)
+        global_keys = _join_keys(global_candles, 'binance', interval)
+        for exchange in ['upbit', 'bithumb', 'binance']:
+            candles = cache.load(exchange, interval, symbol)
+            if candles.size == 0:
+                continue
+            # [t + step - 24h, t + step) 구간 합계 — 거래 없는 분은 캔들이 없어 개수 대신 시각으로 자름
+            ts = candles['ts']
+            window_start = ts + step - day
+            csum = np.cumsum(np.insert(candles['volume'], 0, 0.0))
+            volume_24h = csum[1:] - csum[np.searchsorted(ts, window_start, side='left')]
+            full = window_start >= ts[0]
+            if not full.any():
+                continue
+            candles, volume_24h = candles[full], volume_24h[full]
+
+            premium = np.full(candles.size, np.nan)
+            if exchange != 'binance' and global_candles.size:
+                keys = _join_keys(candles, exchange, interval)
+                idx = np.searchsorted(global_keys, keys)
+                idx = np.minimum(idx, global_candles.size - 1)
+                matched = global_keys[idx] == keys
+                global_close = global_candles['close'][idx]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    premium = np.where(matched & (global_close > 0),
+                                       (candles['close'] / usd_krw - global_close) / global_close * 100,
+                                       np.nan)
+
+            rows = np.empty(candles.size, dtype=TICK_DTYPE)
+            rows['ts'] = candles['ts'] + step
+            rows['exchange'] = exchange.encode()
+            rows['symbol'] = symbol.encode()
+            rows['price'] = candles['close']
+            rows['usd_krw'] = usd_krw
+            rows['premium'] = premium
+            rows['volume_24h'] = volume_24h
+            parts.append(rows)
+
+    if not parts:
+        return 0
+    ticks = np.concatenate(parts)
+    ticks = ticks[np.argsort(ticks['ts'], kind='stable')]
+    seeded = store.append(ticks)
+
+    if baseline is not None:
+        for row in ticks[ticks['exchange'] != b'binance'].tolist():
+            baseline.observe(row[1].decode(), row[2].decode(), row[6], row[0])
+    return seeded
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Volume Baseline
+코인별 거래량 베이스라인
+
+거래소/코인마다 24시간 거래량의 지수가중 이동평균(EWMA)과 분산을 유지합니다.
+조회(틱)마다 O(1) 로 갱신되며, 현재 거래량을 "같은 코인의 평소 거래량"과 비교해
+급등 여부를 판단합니다. 상태는 JSON 파일로 실행 간에 유지됩니다.
+"""
+
+import json
+import math
+import os
+import time
+from typing import Dict, List, Optional
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.expanduser('~'), '.korean-crypto-tracker', 'volume_baseline.json')
+
+# 반감기 기본값: 24시간
+DEFAULT_HALFLIFE = 24 * 60 * 60
+
+
+class VolumeBaseline:
+    """거래소/코인별 EWMA 거래량 베이스라인"""
+
+    def __init__(self, path: str = DEFAULT_BASELINE_PATH, halflife: float = DEFAULT_HALFLIFE,
+                 min_samples: int = 5):
+        self.path = path
+        self.halflife = halflife
+        self.min_samples = min_samples
+        # "exchange:symbol" -> [mean, var, samples, last_ts]
+        self.state: Dict[str, List[float]] = {}
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.state)
+
+    def load(self):
+        """저장된 베이스라인 로드"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.state = {key: list(value) for key, value in data.get('series', {}).items()}
+        except (OSError, ValueError) as e:
+            print(f"⚠️  베이스라인 로드 실패: {e}")
+            self.state = {}
+
+    def save(self):
+        """베이스라인 저장 (임시 파일 → rename)"""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'halflife': self.halflife, 'series': self.state}, f)
+        os.replace(tmp_path, self.path)
+
+    def observe(self, exchange: str, symbol: str, volume: float,
+                ts: Optional[float] = None) -> Optional[Dict]:
+        """거래량 1건 반영 — 갱신 전 베이스라인 대비 통계 반환 (첫 관측이면 None)"""
+        ts = time.time() if ts is None else ts
+        key = f"{exchange}:{symbol}"
+        entry = self.state.get(key)
+
+        if entry is None:
+            self.state[key] = [volume, 0.0, 1, ts]
+            return None
+
+        mean, var, samples, last_ts = entry
+        if ts <= last_ts:
+            # 같은 틱을 중복 반영하지 않음
+            return None
+
+        std = math.sqrt(var)
+        stats = {
+            'exchange': exchange,
+            'symbol': symbol,
+            'volume': volume,
+            'baseline': mean,
+            'std': std,
+            'ratio': volume / mean if mean > 0 else 0.0,
+            'zscore': (volume - mean) / std if std > 0 else 0.0,
+            'samples': int(samples),
+        }
+
+        # 시간 간격을 반영한 EWMA 갱신
+        alpha = 1.0 - 0.5 ** ((ts - last_ts) / self.halflife)
+        diff = volume - mean
+        incr = alpha * diff
+        mean += incr
+        var = (1.0 - alpha) * (var + diff * incr)
+        self.state[key] = [mean, var, samples + 1, ts]
+
+        return stats
+
+    def observe_snapshot(self, data: Dict, exchanges=('upbit', 'bithumb'),
+                         ts: Optional[float] = None) -> List[Dict]:
+        """get_all_prices() 결과 한 번을 반영"""
+        results = []
+        for exchange in exchanges:
+            for symbol, info in (data.get(exchange) or {}).items():
+                tick_ts = ts if ts is not None else info.get('timestamp')
+                stats = self.observe(exchange, symbol, float(info.get('volume_24h') or 0), tick_ts)
+                if stats is not None:
+                    results.append(stats)
+        return results
+
+    def surges(self, observations: List[Dict], multiplier: float = 2.0) -> List[Dict]:
+        """베이스라인 대비 multiplier 배 이상인 관측만"""
+        return [
+            item for item in observations
+            if item['samples'] >= self.min_samples and item['ratio'] >= multiplier
+        ]
+
+    def seed_from_store(self, store, exchanges=('upbit', 'bithumb')) -> int:
+        """틱 히스토리를 재생해 베이스라인 초기화"""
+        wanted = {exchange.encode() for exchange in exchanges}
+        seeded = 0
+        for chunk in store.iter_chunks():
+            rows = zip(chunk['exchange'].tolist(), chunk['symbol'].tolist(),
+                       chunk['volume_24h'].tolist(), chunk['ts'].tolist())
+            for exchange, symbol, volume, ts in rows:
+                if exchange not in wanted:
+                    continue
+                self.observe(exchange.decode(), symbol.decode(), volume, ts)
+                seeded += 1
+        return seeded
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Tracker Benchmarks
+오프라인 재생 서버 기반 성능 측정
+
+replay.py 재생 서버를 띄우고 실제 API 없이 다음을 측정합니다.
+
+- 조회 1회 전체 시간 (초기화 포함 콜드 스타트 + 반복 조회 평균/p50/p95)
+- watch 모드 처리량 (초당 조회 주기 수)
+- 코인 수(8 → 500)에 따른 분석 단계별 비용 (프리미엄, 거래량 급등, 알림, 호가 VWAP, 렌더링)
+- 단계별 최대 메모리 (tracemalloc) 와 프로세스 최대 RSS
+
+기본적으로 거래소 호출 제한을 끄고 측정합니다 (--rate-limits 로 실제 제한 적용).
+
+사용법:
+    python bench.py
+    python bench.py --latency 0.03 --jitter 0.01 --error-rate 0.02 --cycles 50
+    python bench.py --sizes 8,100,500 --format json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from alerts import AlertEngine, parse_rule
+from baseline import VolumeBaseline
+from crypto import KoreanCryptoTracker, build_parser, run_cycle
+from depth import DEFAULT_NOTIONALS, executable_premiums, fetch_all_orderbooks
+from exchanges import ADAPTERS
+from history import TickStore
+from ratelimit import RateLimiter
+from replay import ReplayServer
+
+DEFAULT_SIZES = [8, 50, 100, 250, 500]
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def timing_stats(samples: List[float]) -> Dict:
+    """초 단위 샘플 → ms 요약"""
+    return {
+        'n': len(samples),
+        'mean_ms': statistics.fmean(samples) * 1000,
+        'p50_ms': percentile(samples, 0.5) * 1000,
+        'p95_ms': percentile(samples, 0.95) * 1000,
+        'max_ms': max(samples) * 1000,
+    }
+
+
+def make_tracker(server: ReplayServer, coins: int, rate_limits: bool) -> KoreanCryptoTracker:
+    """재생 서버를 바라보는 트래커 (coins 개 코인 추적)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracker = KoreanCryptoTracker(base_urls=server.base_urls(list(ADAPTERS) + ['fx']))
+    for symbol in server.data.symbols[:coins]:
+        tracker.add_symbol(symbol)
+    if not rate_limits:
+        for adapter in tracker.adapters.values():
+            adapter.limiter = RateLimiter(1e9, 10 ** 9)
+    return tracker
+
+
+def measure(fn: Callable, repeat: int) -> Dict:
+    """repeat 회 실행 시간 + 1회 실행 중 최대 메모리"""
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - started)
+    stats = timing_stats(samples)
+    stats['peak_kb'] = peak / 1024
+    return stats
+
+
+# ----------------------------------------------------------------------
+# 시나리오
+# ----------------------------------------------------------------------
+def bench_cycle(server: ReplayServer, cycles: int, rate_limits: bool, workdir: str) -> Dict:
+    """콜드 스타트 + 반복 조회 (--all 과 같은 분석/렌더링 포함)"""
+    args = build_parser().parse_args([
+        '--all', '--record',
+        '--history-dir', os.path.join(workdir, 'history'),
+        '--baseline-path', os.path.join(workdir, 'baseline.json'),
+    ])
+
+    started = time.perf_counter()
+    tracker = make_tracker(server, 8, rate_limits)
+    init_seconds = time.perf_counter() - started
+
+    store = TickStore(args.history_dir)
+    baseline = VolumeBaseline(args.baseline_path)
+
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_cycle(tracker, args, store, baseline)
+        first_seconds = time.perf_counter() - started
+        loop_started = time.perf_counter()
+        for _ in range(cycles):
+            cycle_started = time.perf_counter()
+            run_cycle(tracker, args, store, baseline)
+            samples.append(time.perf_counter() - cycle_started)
+        loop_seconds = time.perf_counter() - loop_started
+    tracker.scheduler.close()
+
+    result = timing_stats(samples)
+    result.update({
+        'init_ms': init_seconds * 1000,
+        'cold_cycle_ms': first_seconds * 1000,
+        'cycles_per_sec': cycles / loop_seconds if loop_seconds > 0 else float('inf'),
+    })
+    return result
+
+
+def bench_scaling(server: ReplayServer, sizes: List[int], repeat: int, rate_limits: bool, workdir: str) -> List[Dict]:
+    """코인 수별 조회/분석 단계 비용"""
+    rows = []
+    for size in sizes:
+        tracker = make_tracker(server, size, rate_limits)
+        fetch = measure(tracker.get_all_prices, repeat)
+        with contextlib.redirect_stdout(io.StringIO()):
+            data = tracker.get_all_prices()
+            books = fetch_all_orderbooks(tracker)
+        premiums = tracker.get_premiums(data)
+
+        baseline = VolumeBaseline(os.path.join(workdir, f'baseline-{size}.json'))
+        rules = [
+            parse_rule(f"{symbol} {exchange} premium {op} {value}%")
+            for symbol in tracker.symbols
+            for exchange in ('upbit', 'bithumb')
+            for op, value in (('>', 3), ('<', -1))
+        ]
+        engine = AlertEngine(rules)
+
+        stages = {
+            'fetch': fetch,
+            'premiums': measure(lambda: tracker.get_premiums(data), repeat),
+            'volume_surge': measure(lambda: baseline.surges(baseline.observe_snapshot(data, tracker.krw_exchanges())), repeat),
+            'alerts': measure(lambda: engine.update_snapshot(data, premiums), repeat),
+            'depth_vwap': measure(lambda: executable_premiums(books, tracker.usd_krw_rate, DEFAULT_NOTIONALS), repeat),
+            'render': measure(lambda: (tracker.display_kimchi_premium(data), tracker.market_summary(data)), repeat),
+        }
+        tracker.scheduler.close()
+
+        rows.append({
+            'coins': size,
+            'tickers': sum(len(v) for v in data.values() if isinstance(v, dict)),
+            'stages': stages,
+            'peak_kb': max(stage['peak_kb'] for stage in stages.values()),
+        })
+    return rows
+
+
+# ----------------------------------------------------------------------
+# 출력
+# ----------------------------------------------------------------------
+def print_report(report: Dict):
+    from tabulate import tabulate
+
+    config = report['config']
+    print(f"🧪 재생 서버 벤치마크 — 지연 {config['latency'] * 1000:.0f}±{config['jitter'] * 1000:.0f}ms, "
+          f"오류율 {config['error_rate']:.0%}, 호출 제한 {'적용' if config['rate_limits'] else '해제'}")
+
+    cycle = report['cycle']
+    print(f"\n🔁 조회 주기 (--all, 8개 코인, {cycle['n']}회)")
+    print(f"  • 초기화: {cycle['init_ms']:.1f}ms / 첫 조회(콜드): {cycle['cold_cycle_ms']:.1f}ms")
+    print(f"  • 평균 {cycle['mean_ms']:.1f}ms / p50 {cycle['p50_ms']:.1f}ms / p95 {cycle['p95_ms']:.1f}ms")
+    print(f"  • watch 처리량: {cycle['cycles_per_sec']:.1f} 주기/초")
+
+    stage_names = list(report['scaling'][0]['stages']) if report['scaling'] else []
+    table = []
+    for row in report['scaling']:
+        table.append([row['coins'], row['tickers']]
+                     + [f"{row['stages'][name]['mean_ms']:.2f}" for name in stage_names]
+                     + [f"{row['peak_kb']:,.0f}"])
+    print("\n📈 코인 수별 단계 비용 (평균 ms)")
+    print(tabulate(table, headers=['코인', '시세'] + stage_names + ['최대 KB'], tablefmt='grid'))
+
+    print(f"\n💾 프로세스 최대 RSS: {report['max_rss_mb']:.1f}MB")
+    print(f"📡 재생 서버 요청 {report['server']['requests']}건 (주입 오류 {report['server']['errors']}건)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='재생 서버 기반 트래커 벤치마크')
+    parser.add_argument('--cycles', type=int, default=20, help='반복 조회 횟수')
+    parser.add_argument('--repeat', type=int, default=5, help='분석 단계별 반복 횟수')
+    parser.add_argument('--sizes', type=str, default=','.join(map(str, DEFAULT_SIZES)), help='코인 수 목록 (쉼표 구분)')
+    parser.add_argument('--latency', type=float, default=0.0, help='재생 서버 요청당 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연 변동폭 (± 초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 확률 (0~1)')
+    parser.add_argument('--rate-limits', action='store_true', help='거래소별 호출 제한 적용')
+    parser.add_argument('--format', choices=['table', 'json'], default='table', help='출력 형식')
+    args = parser.parse_args()
+
+    sizes = [int(n) for n in args.sizes.split(',')]
+    with ReplayServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                      coins=max(sizes), seed=0) as server, tempfile.TemporaryDirectory() as workdir:
+        report = {
+            'config': {
+                'latency': args.latency,
+                'jitter': args.jitter,
+                'error_rate': args.error_rate,
+                'rate_limits': args.rate_limits,
+            },
+            'cycle': bench_cycle(server, args.cycles, args.rate_limits, workdir),
+            'scaling': bench_scaling(server, sizes, args.repeat, args.rate_limits, workdir),
+        }
+        report['server'] = {'requests': server.requests, 'errors': server.errors}
+
+    # ru_maxrss: 리눅스는 KB, macOS 는 바이트
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report['max_rss_mb'] = max_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+    if args.format == 'json':
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
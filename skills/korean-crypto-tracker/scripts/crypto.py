@@ -6,26 +6,63 @@ Korean Crypto Tracker
 업비트, 빗썸의 실시간 시세와 김치 프리미엄을 추적합니다.
 """
 
-import requests
+import time
+_IMPORT_STARTED = time.perf_counter()
+
 import json
 import argparse
-import time
+import contextlib
 import datetime
-from typing import Dict, List, Optional, Tuple
-from tabulate import tabulate
-from colorama import init, Fore, Style, Back
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
 import sys
 import os
 
-# 컬러 출력 초기화
-init(autoreset=True)
+from baseline import DEFAULT_BASELINE_PATH, VolumeBaseline
+from exchanges import ADAPTERS, DEFAULT_EXCHANGES, FanOutScheduler, build_adapters
+from net import HttpMetrics, build_session
+from stream import EventWriter
+import profiling
+from profiling import phase
+
+# 알림/백필/호가/히스토리 모듈은 해당 옵션을 쓰는 실행에서만 import
+if TYPE_CHECKING:
+    from alerts import AlertEngine
+    from history import TickStore
+
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
+FX_BASE_URL = 'https://api.exchangerate-api.com'
+
+# 거래소별 테이블 제목 아이콘/색 (없으면 기본값)
+_EXCHANGE_STYLE = {'upbit': ('🔵', 'BLUE'), 'bithumb': ('🟡', 'YELLOW')}
+_DEFAULT_STYLE = ('🟢', 'GREEN')
+
+# 테이블/컬러 출력 모듈 — 테이블을 처음 출력할 때 import (--format json/ndjson 실행은 불러오지 않음)
+_table_modules = None
+
+
+@contextlib.contextmanager
+def _render():
+    """테이블 출력 단계 → (Fore, Style, tabulate)"""
+    global _table_modules
+    if _table_modules is None:
+        with phase('import:table'):
+            import colorama
+            from tabulate import tabulate
+            colorama.init(autoreset=True)
+        _table_modules = (colorama.Fore, colorama.Style, tabulate)
+    with phase('render'):
+        yield _table_modules
+
 
 class KoreanCryptoTracker:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Korean-Crypto-Tracker/1.0'
-        })
+    def __init__(self, universe: str = 'major', exchanges: Optional[List[str]] = None,
+                 metrics: Optional[HttpMetrics] = None, base_urls: Optional[Dict[str, str]] = None):
+        # keep-alive 커넥션 풀 + 재시도 (metrics 지정시 요청 구간별 시간 측정)
+        self.metrics = metrics
+        # --format json/ndjson 이벤트 출력
+        self.writer = EventWriter()
+        self.session = build_session(metrics)
         
         # 주요 암호화폐 심볼 매핑 (실제 존재하는 마켓만)
         self.symbols = {
@@ -39,133 +76,86 @@ class KoreanCryptoTracker:
             'DOGE': {'upbit': 'KRW-DOGE', 'bithumb': 'DOGE', 'binance': 'DOGEUSDT'},
         }
         
+        # 일부 거래소에서만 조회하는 코인 {코인: 거래소} (알림 규칙에만 있는 코인 등)
+        self.symbol_exchanges: Dict[str, Set[str]] = {}
+        
+        # 거래소 어댑터 + 동시 조회 스케줄러
+        # base_urls: 거래소/환율('fx') API 주소 교체 (재생 서버 등)
+        self.base_urls = base_urls or {}
+        self.fx_base_url = self.base_urls.get('fx', FX_BASE_URL)
+        self.adapters = build_adapters(exchanges or DEFAULT_EXCHANGES, self.session, self.base_urls)
+        self.scheduler = FanOutScheduler(self.adapters)
+        
+        if universe == 'all':
+            self.load_universe()
+        
         # 현재 환율 (USD/KRW)
         self.usd_krw_rate = self.get_exchange_rate()
     
+    def add_symbol(self, symbol: str, exchanges: Optional[Iterable[str]] = None):
+        """추적 대상 코인 추가 (exchanges 지정시 해당 거래소에서만 조회)"""
+        if symbol in self.symbols:
+            # 이미 전체 거래소에서 조회하는 코인은 그대로, 제한된 코인은 거래소를 합침
+            if symbol in self.symbol_exchanges:
+                if exchanges is None:
+                    del self.symbol_exchanges[symbol]
+                else:
+                    self.symbol_exchanges[symbol].update(exchanges)
+            return
+        self.symbols[symbol] = {
+            'upbit': f'KRW-{symbol}',
+            'bithumb': symbol,
+            'binance': f'{symbol}USDT'
+        }
+        if exchanges is not None:
+            self.symbol_exchanges[symbol] = set(exchanges)
+    
+    def symbols_for(self, exchange: str) -> List[str]:
+        """거래소에서 조회할 코인 목록"""
+        return [symbol for symbol in self.symbols
+                if symbol not in self.symbol_exchanges or exchange in self.symbol_exchanges[symbol]]
+    
+    def load_universe(self):
+        """국내(KRW) 거래소 마켓 전체를 추적 대상으로 등록"""
+        listed = self.scheduler.run('list_symbols', only=self.krw_exchanges())
+        for symbol in sorted(set().union(*listed.values())):
+            self.add_symbol(symbol)
+    
     def get_exchange_rate(self) -> float:
         """USD/KRW 환율 조회"""
         try:
-            response = self.session.get(
-                'https://api.exchangerate-api.com/v4/latest/USD',
-                timeout=10
-            )
-            data = response.json()
+            with phase('fetch:fx'):
+                response = self.session.get(
+                    f'{self.fx_base_url}/v4/latest/USD',
+                    timeout=10
+                )
+            with phase('json_decode:fx'):
+                data = response.json()
             return data['rates']['KRW']
         except Exception as e:
             print(f"⚠️  환율 조회 실패: {e}")
             return 1330.0  # 기본값
     
-    def get_upbit_prices(self, markets: List[str] = None) -> Dict:
-        """업비트 시세 조회"""
+    def _fetch_tickers(self, exchange: str, symbols: List[str]) -> Dict:
+        adapter = self.adapters.get(exchange) or build_adapters([exchange], self.session, self.base_urls)[exchange]
         try:
-            if markets is None:
-                markets = [self.symbols[symbol]['upbit'] for symbol in self.symbols.keys()]
-            
-            market_param = ','.join(markets)
-            url = f'https://api.upbit.com/v1/ticker?markets={market_param}'
-            
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            result = {}
-            
-            for item in data:
-                market = item['market']
-                symbol = market.split('-')[1]
-                result[symbol] = {
-                    'exchange': 'upbit',
-                    'symbol': symbol,
-                    'price': item['trade_price'],
-                    'change_rate': item['signed_change_rate'] * 100,
-                    'volume_24h': item['acc_trade_volume_24h'],
-                    'trade_value_24h': item['acc_trade_price_24h'],
-                    'high_24h': item['high_price'],
-                    'low_24h': item['low_price'],
-                    'timestamp': item['timestamp'] / 1000
-                }
-            
-            return result
-            
+            return adapter.fetch_tickers(symbols)
         except Exception as e:
-            print(f"❌ 업비트 API 오류: {e}")
+            print(f"❌ {adapter.label} API 오류: {e}")
             return {}
     
+    def get_upbit_prices(self, markets: List[str] = None) -> Dict:
+        """업비트 시세 조회"""
+        symbols = [market.split('-')[1] for market in markets] if markets else self.symbols_for('upbit')
+        return self._fetch_tickers('upbit', symbols)
+    
     def get_bithumb_prices(self) -> Dict:
         """빗썸 시세 조회"""
-        try:
-            url = 'https://api.bithumb.com/public/ticker/ALL_KRW'
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            if data['status'] != '0000':
-                raise Exception(f"Bithumb API Error: {data['status']}")
-            
-            result = {}
-            for symbol, price_data in data['data'].items():
-                # 'date' 키는 전체 응답의 타임스탬프이므로 건너뛰기
-                if symbol == 'date' or not isinstance(price_data, dict):
-                    continue
-                
-                if symbol in [s for s in self.symbols.keys()]:
-                    try:
-                        result[symbol] = {
-                            'exchange': 'bithumb',
-                            'symbol': symbol,
-                            'price': float(price_data['closing_price']),
-                            'change_rate': float(price_data['fluctate_rate_24H']),
-                            'volume_24h': float(price_data['units_traded_24H']),
-                            'trade_value_24h': float(price_data['acc_trade_value_24H']),
-                            'high_24h': float(price_data['max_price']),
-                            'low_24h': float(price_data['min_price']),
-                            'timestamp': float(data['data']['date']) / 1000
-                        }
-                    except (KeyError, ValueError) as e:
-                        print(f"⚠️  빗썸 {symbol} 파싱 오류: {e}")
-                        continue
-            
-            return result
-            
-        except Exception as e:
-            print(f"❌ 빗썸 API 오류: {e}")
-            return {}
+        return self._fetch_tickers('bithumb', self.symbols_for('bithumb'))
     
     def get_binance_prices(self, symbols: List[str] = None) -> Dict:
         """바이낸스 시세 조회 (김치프리미엄 계산용)"""
-        try:
-            result = {}
-            
-            if symbols is None:
-                symbols = list(self.symbols.keys())
-            
-            for symbol in symbols:
-                if symbol not in self.symbols:
-                    continue
-                    
-                binance_symbol = self.symbols[symbol]['binance']
-                url = f'https://api.binance.com/api/v3/ticker/24hr?symbol={binance_symbol}'
-                
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                
-                data = response.json()
-                result[symbol] = {
-                    'exchange': 'binance',
-                    'symbol': symbol,
-                    'price': float(data['lastPrice']),
-                    'change_rate': float(data['priceChangePercent']),
-                    'volume_24h': float(data['volume']),
-                    'high_24h': float(data['highPrice']),
-                    'low_24h': float(data['lowPrice']),
-                    'timestamp': data['closeTime'] / 1000
-                }
-            
-            return result
-            
-        except Exception as e:
-            print(f"❌ 바이낸스 API 오류: {e}")
-            return {}
+        return self._fetch_tickers('binance', symbols or self.symbols_for('binance'))
     
     def calculate_kimchi_premium(self, korean_price: float, global_price: float) -> float:
         """김치 프리미엄 계산"""
@@ -173,232 +163,538 @@ class KoreanCryptoTracker:
         premium = ((korean_price_usd - global_price) / global_price) * 100
         return premium
     
+    def krw_exchanges(self) -> List[str]:
+        """원화 마켓 거래소 (김치 프리미엄 계산 대상)"""
+        return [name for name, adapter in self.adapters.items() if adapter.quote == 'KRW']
+    
+    def exchange_title(self, exchange: str) -> str:
+        """테이블 제목용 거래소 이름 (예: 업비트 (Upbit))"""
+        return f"{self.adapters[exchange].label} ({exchange.capitalize()})"
+    
+    def get_premiums(self, data: Dict) -> Dict[Tuple[str, str], float]:
+        """거래소/코인별 김치 프리미엄 {(exchange, symbol): premium}"""
+        premiums = {}
+        for symbol in self.symbols.keys():
+            binance_price = data['binance'].get(symbol, {}).get('price', 0)
+            if binance_price == 0:
+                continue
+            for exchange in self.krw_exchanges():
+                korean_price = data[exchange].get(symbol, {}).get('price', 0)
+                if korean_price > 0:
+                    premiums[(exchange, symbol)] = self.calculate_kimchi_premium(korean_price, binance_price)
+        return premiums
+    
     def get_all_prices(self) -> Dict:
-        """모든 거래소 시세 조회"""
+        """모든 거래소 시세 동시 조회"""
         print("📡 실시간 시세 조회 중...")
         
-        upbit_data = self.get_upbit_prices()
-        bithumb_data = self.get_bithumb_prices()
-        binance_data = self.get_binance_prices()
-        
-        return {
-            'upbit': upbit_data,
-            'bithumb': bithumb_data,
-            'binance': binance_data,
-            'usd_krw': self.usd_krw_rate
-        }
+        data = self.scheduler.run('fetch_tickers', args_for=lambda exchange: (self.symbols_for(exchange),))
+        for exchange in [*DEFAULT_EXCHANGES, *self.adapters]:
+            data.setdefault(exchange, {})
+        data['usd_krw'] = self.usd_krw_rate
+        return data
     
     def display_prices(self, data: Dict, format_type: str = 'table'):
         """시세 정보 출력"""
         if format_type == 'json':
-            print(json.dumps(data, indent=2, ensure_ascii=False))
+            # 기존 --format json 출력 형식 (거래소별 시세 + usd_krw) 유지
+            self.writer.emit('prices', data)
+            return
+        if format_type == 'ndjson':
+            self.writer.emit('prices', {
+                'usd_krw': data.get('usd_krw'),
+                'exchanges': {name: tickers for name, tickers in data.items() if isinstance(tickers, dict)},
+            })
             return
         
-        print(f"\n🏦 {Fore.YELLOW}한국 암호화폐 거래소 실시간 시세{Style.RESET_ALL}")
-        print(f"💱 현재 환율: {self.usd_krw_rate:,.2f} KRW/USD")
-        print(f"⏰ 업데이트: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        
-        # 업비트 테이블
-        if data['upbit']:
-            upbit_table = []
-            for symbol, info in data['upbit'].items():
-                change_color = Fore.RED if info['change_rate'] < 0 else Fore.GREEN
-                upbit_table.append([
-                    symbol,
-                    f"{info['price']:,.0f}",
-                    f"{change_color}{info['change_rate']:+.2f}%{Style.RESET_ALL}",
-                    f"{info['volume_24h']:,.2f}",
-                    f"{info['trade_value_24h']/1e8:.1f}억"
-                ])
-            
-            print(f"🔵 {Fore.BLUE}업비트 (Upbit){Style.RESET_ALL}")
-            print(tabulate(upbit_table, 
-                headers=['코인', '현재가(KRW)', '24h 변동률', '24h 거래량', '24h 거래대금'],
-                tablefmt='grid'))
-            print()
-        
-        # 빗썸 테이블
-        if data['bithumb']:
-            bithumb_table = []
-            for symbol, info in data['bithumb'].items():
-                change_color = Fore.RED if info['change_rate'] < 0 else Fore.GREEN
-                bithumb_table.append([
-                    symbol,
-                    f"{info['price']:,.0f}",
-                    f"{change_color}{info['change_rate']:+.2f}%{Style.RESET_ALL}",
-                    f"{info['volume_24h']:,.2f}",
-                    f"{info['trade_value_24h']/1e8:.1f}억"
-                ])
+        with _render() as (Fore, Style, tabulate):
+            print(f"\n🏦 {Fore.YELLOW}한국 암호화폐 거래소 실시간 시세{Style.RESET_ALL}")
+            print(f"💱 현재 환율: {self.usd_krw_rate:,.2f} KRW/USD")
+            print(f"⏰ 업데이트: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        
+            # 원화 마켓 거래소별 테이블
+            for exchange in self.krw_exchanges():
+                tickers = data.get(exchange) or {}
+                if not tickers:
+                    continue
+                price_table = []
+                for symbol, info in tickers.items():
+                    change_color = Fore.RED if info['change_rate'] < 0 else Fore.GREEN
+                    price_table.append([
+                        symbol,
+                        f"{info['price']:,.0f}",
+                        f"{change_color}{info['change_rate']:+.2f}%{Style.RESET_ALL}",
+                        f"{info['volume_24h']:,.2f}",
+                        f"{info['trade_value_24h']/1e8:.1f}억"
+                    ])
             
-            print(f"🟡 {Fore.YELLOW}빗썸 (Bithumb){Style.RESET_ALL}")
-            print(tabulate(bithumb_table, 
-                headers=['코인', '현재가(KRW)', '24h 변동률', '24h 거래량', '24h 거래대금'],
-                tablefmt='grid'))
-            print()
+                icon, color = _EXCHANGE_STYLE.get(exchange, _DEFAULT_STYLE)
+                print(f"{icon} {getattr(Fore, color)}{self.exchange_title(exchange)}{Style.RESET_ALL}")
+                print(tabulate(price_table, 
+                    headers=['코인', '현재가(KRW)', '24h 변동률', '24h 거래량', '24h 거래대금'],
+                    tablefmt='grid'))
+                print()
     
-    def display_kimchi_premium(self, data: Dict, threshold: float = None):
-        """김치 프리미엄 출력"""
-        print(f"\n🌶️  {Fore.RED}김치 프리미엄 현황{Style.RESET_ALL}")
-        print(f"💱 환율: {self.usd_krw_rate:,.2f} KRW/USD")
-        print(f"⏰ 업데이트: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        
-        premium_table = []
-        
+    def kimchi_premium_report(self, data: Dict, threshold: float = None) -> Dict:
+        """코인별 국내 거래소 가격/김치 프리미엄 + 요약 통계"""
+        exchanges = self.krw_exchanges()
+        rows = []
         for symbol in self.symbols.keys():
-            upbit_price = data['upbit'].get(symbol, {}).get('price', 0)
-            bithumb_price = data['bithumb'].get(symbol, {}).get('price', 0)
             binance_price = data['binance'].get(symbol, {}).get('price', 0)
-            
             if binance_price == 0:
                 continue
             
-            upbit_premium = self.calculate_kimchi_premium(upbit_price, binance_price) if upbit_price > 0 else 0
-            bithumb_premium = self.calculate_kimchi_premium(bithumb_price, binance_price) if bithumb_price > 0 else 0
+            prices = {}
+            premiums = {}
+            for exchange in exchanges:
+                price = data.get(exchange, {}).get(symbol, {}).get('price', 0)
+                if price > 0:
+                    prices[exchange] = price
+                    premiums[exchange] = self.calculate_kimchi_premium(price, binance_price)
             
             # 임계값 필터링
-            if threshold is not None:
-                if abs(upbit_premium) < threshold and abs(bithumb_premium) < threshold:
-                    continue
-            
-            # 컬러 설정
-            upbit_color = Fore.GREEN if upbit_premium > 0 else Fore.RED
-            bithumb_color = Fore.GREEN if bithumb_premium > 0 else Fore.RED
-            
-            premium_table.append([
-                symbol,
-                f"${binance_price:,.2f}",
-                f"₩{upbit_price:,.0f}" if upbit_price > 0 else "N/A",
-                f"{upbit_color}{upbit_premium:+.2f}%{Style.RESET_ALL}" if upbit_price > 0 else "N/A",
-                f"₩{bithumb_price:,.0f}" if bithumb_price > 0 else "N/A",
-                f"{bithumb_color}{bithumb_premium:+.2f}%{Style.RESET_ALL}" if bithumb_price > 0 else "N/A"
-            ])
-        
-        print(tabulate(premium_table,
-            headers=['코인', '바이낸스(USD)', '업비트(KRW)', '업비트 프리미엄', '빗썸(KRW)', '빗썸 프리미엄'],
-            tablefmt='grid'))
-        
-        # 요약 통계
-        premiums = []
-        for row in premium_table:
-            if "N/A" not in row[3]:
-                premiums.append(float(row[3].split('%')[0].replace('+', '').replace(Fore.GREEN, '').replace(Fore.RED, '').replace(Style.RESET_ALL, '')))
-            if "N/A" not in row[5]:
-                premiums.append(float(row[5].split('%')[0].replace('+', '').replace(Fore.GREEN, '').replace(Fore.RED, '').replace(Style.RESET_ALL, '')))
-        
-        if premiums:
-            avg_premium = sum(premiums) / len(premiums)
-            max_premium = max(premiums)
-            min_premium = min(premiums)
-            
-            print(f"\n📊 김치 프리미엄 요약:")
-            print(f"  • 평균: {avg_premium:+.2f}%")
-            print(f"  • 최대: {max_premium:+.2f}%")
-            print(f"  • 최소: {min_premium:+.2f}%")
-    
-    def detect_volume_surge(self, data: Dict, multiplier: float = 2.0):
-        """거래량 급등 종목 탐지"""
-        print(f"\n📈 {Fore.CYAN}거래량 급등 종목 탐지{Style.RESET_ALL}")
-        print(f"🔍 기준: 평균 대비 {multiplier}배 이상 거래량\n")
-        
-        surge_table = []
-        
-        # 업비트 거래량 분석
-        if data['upbit']:
-            volumes = [info['volume_24h'] for info in data['upbit'].values()]
-            avg_volume = sum(volumes) / len(volumes) if volumes else 0
-            
-            for symbol, info in data['upbit'].items():
-                volume_ratio = info['volume_24h'] / avg_volume if avg_volume > 0 else 0
-                
-                if volume_ratio >= multiplier:
-                    surge_table.append([
-                        'Upbit',
-                        symbol,
-                        f"{info['price']:,.0f}",
-                        f"{info['change_rate']:+.2f}%",
-                        f"{info['volume_24h']:,.0f}",
-                        f"{volume_ratio:.1f}x"
-                    ])
+            if threshold is not None and all(abs(premium) < threshold for premium in premiums.values()):
+                continue
+            rows.append({'symbol': symbol, 'binance_usd': binance_price, 'prices': prices, 'premiums': premiums})
         
-        # 빗썸 거래량 분석
-        if data['bithumb']:
-            volumes = [info['volume_24h'] for info in data['bithumb'].values()]
-            avg_volume = sum(volumes) / len(volumes) if volumes else 0
-            
-            for symbol, info in data['bithumb'].items():
-                volume_ratio = info['volume_24h'] / avg_volume if avg_volume > 0 else 0
-                
-                if volume_ratio >= multiplier:
-                    surge_table.append([
-                        'Bithumb',
-                        symbol,
-                        f"{info['price']:,.0f}",
-                        f"{info['change_rate']:+.2f}%",
-                        f"{info['volume_24h']:,.0f}",
-                        f"{volume_ratio:.1f}x"
-                    ])
+        values = [premium for row in rows for premium in row['premiums'].values()]
+        summary = None
+        if values:
+            summary = {'avg': sum(values) / len(values), 'max': max(values), 'min': min(values)}
+        return {'usd_krw': self.usd_krw_rate, 'threshold': threshold, 'rows': rows, 'summary': summary}
+    
+    def display_kimchi_premium(self, data: Dict, threshold: float = None, format_type: str = 'table'):
+        """김치 프리미엄 출력"""
+        report = self.kimchi_premium_report(data, threshold)
+        if format_type != 'table':
+            self.writer.emit('kimchi_premium', report)
+            return
+        
+        with _render() as (Fore, Style, tabulate):
+            print(f"\n🌶️  {Fore.RED}김치 프리미엄 현황{Style.RESET_ALL}")
+            print(f"💱 환율: {self.usd_krw_rate:,.2f} KRW/USD")
+            print(f"⏰ 업데이트: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        
+            def fmt_premium(row, exchange):
+                if exchange not in row['premiums']:
+                    return "N/A"
+                premium = row['premiums'][exchange]
+                color = Fore.GREEN if premium > 0 else Fore.RED
+                return f"{color}{premium:+.2f}%{Style.RESET_ALL}"
+        
+            exchanges = self.krw_exchanges()
+            premium_table = []
+            for row in report['rows']:
+                table_row = [row['symbol'], f"${row['binance_usd']:,.2f}"]
+                for exchange in exchanges:
+                    price = row['prices'].get(exchange)
+                    table_row += [f"₩{price:,.0f}" if price else "N/A", fmt_premium(row, exchange)]
+                premium_table.append(table_row)
+        
+            headers = ['코인', '바이낸스(USD)']
+            for exchange in exchanges:
+                label = self.adapters[exchange].label
+                headers += [f'{label}(KRW)', f'{label} 프리미엄']
+            print(tabulate(premium_table, headers=headers, tablefmt='grid'))
+        
+            # 요약 통계
+            summary = report['summary']
+            if summary:
+                print(f"\n📊 김치 프리미엄 요약:")
+                print(f"  • 평균: {summary['avg']:+.2f}%")
+                print(f"  • 최대: {summary['max']:+.2f}%")
+                print(f"  • 최소: {summary['min']:+.2f}%")
+    
+    def detect_volume_surge(self, data: Dict, baseline: VolumeBaseline, multiplier: float = 2.0,
+                            format_type: str = 'table'):
+        """거래량 급등 종목 탐지 (코인별 EWMA 베이스라인 대비)"""
+        observations = baseline.observe_snapshot(data, self.krw_exchanges())
+        surges = sorted(baseline.surges(observations, multiplier), key=lambda x: x['ratio'], reverse=True)
+        
+        if format_type != 'table':
+            payloads = []
+            for item in surges:
+                info = data[item['exchange']][item['symbol']]
+                payloads.append(dict(
+                    item, price=info['price'], change_rate=info['change_rate'], multiplier=multiplier
+                ))
+            self.writer.emit_many('volume_surge', payloads)
+            return
+        
+        with _render() as (Fore, Style, tabulate):
+            print(f"\n📈 {Fore.CYAN}거래량 급등 종목 탐지{Style.RESET_ALL}")
+            print(f"🔍 기준: 코인별 평소 거래량(EWMA) 대비 {multiplier}배 이상\n")
+        
+            surge_table = []
+            for item in surges:
+                info = data[item['exchange']][item['symbol']]
+                surge_table.append([
+                    item['exchange'].capitalize(),
+                    item['symbol'],
+                    f"{info['price']:,.0f}",
+                    f"{info['change_rate']:+.2f}%",
+                    f"{item['volume']:,.0f}",
+                    f"{item['baseline']:,.0f}",
+                    f"{item['ratio']:.1f}x"
+                ])
+        
+            if surge_table:
+                print(tabulate(surge_table,
+                    headers=['거래소', '코인', '현재가', '24h 변동률', '24h 거래량', '평소 거래량', '평소 대비'],
+                    tablefmt='grid'))
+            elif not any(item['samples'] >= baseline.min_samples for item in observations):
+                print(f"⚠️  베이스라인 수집 중입니다 (코인별 최소 {baseline.min_samples}회 관측 필요).")
+            else:
+                print("⚠️  현재 거래량 급등 종목이 없습니다.")
+    
+    def executable_premium_report(self, notionals: List[float]) -> Dict:
+        """호가 조회 + 주문 금액별 실거래 김치 프리미엄"""
+        from depth import executable_premiums, fetch_all_orderbooks
+        
+        started = time.perf_counter()
+        books = fetch_all_orderbooks(self)
+        results = executable_premiums(books, self.usd_krw_rate, notionals)
+        return {
+            'usd_krw': self.usd_krw_rate,
+            'notionals_krw': list(notionals),
+            'orderbooks': sum(len(b) for b in books.values()),
+            'elapsed': time.perf_counter() - started,
+            'results': results,
+        }
+    
+    def display_executable_premium(self, notionals: List[float], format_type: str = 'table'):
+        """호가 깊이 기반 실거래 김치 프리미엄 출력"""
+        report = self.executable_premium_report(notionals)
+        if format_type != 'table':
+            self.writer.emit('executable_premium', report)
+            return
+        
+        with _render() as (Fore, Style, tabulate):
+            print(f"\n📚 {Fore.RED}실거래 김치 프리미엄 (호가 깊이 기준){Style.RESET_ALL}")
+            print(f"💱 환율: {self.usd_krw_rate:,.2f} KRW/USD")
+            print(f"⏱️  호가 {report['orderbooks']}개 조회 + 계산: {report['elapsed']:.2f}초")
+            print("ℹ️  매수: 국내 매수 vs 해외 매도 / 매도: 국내 매도 vs 해외 매수\n")
+        
+            def fmt(value):
+                if value != value:  # NaN — 호가 부족
+                    return "호가 부족"
+                color = Fore.GREEN if value > 0 else Fore.RED
+                return f"{color}{value:+.2f}%{Style.RESET_ALL}"
+        
+            depth_table = []
+            for item in report['results']:
+                row = [item['exchange'].capitalize(), item['symbol']]
+                for size in item['sizes']:
+                    row.append(f"{fmt(size['ask_premium'])} / {fmt(size['bid_premium'])}")
+                depth_table.append(row)
+        
+            if depth_table:
+                headers = ['거래소', '코인'] + [f"₩{n:,.0f} 매수/매도" for n in notionals]
+                print(tabulate(depth_table, headers=headers, tablefmt='grid'))
+            else:
+                print("⚠️  호가 데이터를 가져오지 못했습니다.")
+    
+    def display_coin(self, data: Dict, symbol: str, format_type: str = 'table'):
+        """특정 코인 거래소별 시세"""
+        if symbol not in self.symbols:
+            print(f"❌ 지원하지 않는 코인: {symbol}")
+            print(f"지원 코인: {', '.join(self.symbols.keys())}")
+            return
+        
+        quotes = {
+            exchange: tickers[symbol]
+            for exchange, tickers in data.items()
+            if isinstance(tickers, dict) and symbol in tickers
+        }
+        if format_type != 'table':
+            self.writer.emit('coin', {'symbol': symbol, 'exchanges': quotes})
+            return
+        
+        print(f"\n🔍 {symbol} 상세 정보:")
+        for exchange, info in quotes.items():
+            print(f"  {exchange}: {info['price']:,.2f} ({info['change_rate']:+.2f}%)")
+    
+    def display_alerts(self, alerts: List[Dict], format_type: str = 'table'):
+        """알림 규칙 발동 결과 출력"""
+        if format_type != 'table':
+            self.writer.emit_many('alert', alerts, ts_key='ts')
+            return
+        if not alerts:
+            return
+        
+        with _render() as (Fore, Style, tabulate):
+            print(f"\n🔔 {Fore.YELLOW}알림 {len(alerts)}건{Style.RESET_ALL}")
+            alert_table = []
+            for alert in alerts:
+                if alert['metric'] == 'premium':
+                    value = f"{alert['value']:+.2f}%"
+                elif ADAPTERS[alert['exchange']].quote != 'KRW':
+                    value = f"${alert['value']:,.2f}"
+                else:
+                    value = f"₩{alert['value']:,.0f}"
+                arrow = f"{Fore.GREEN}▲" if alert['direction'] == 'above' else f"{Fore.RED}▼"
+                alert_table.append([
+                    alert['exchange'].capitalize(),
+                    alert['symbol'],
+                    f"{arrow}{Style.RESET_ALL} {value}",
+                    alert['rule']
+                ])
+        
+            print(tabulate(alert_table, headers=['거래소', '코인', '현재값', '규칙'], tablefmt='grid'))
+    
+    def display_http_metrics(self, format_type: str = 'table'):
+        """엔드포인트별 HTTP 요청 지표 출력"""
+        if self.metrics is None:
+            return
+        rows = self.metrics.summary()
+        
+        if format_type != 'table':
+            self.writer.emit('http_metrics', {'endpoints': rows})
+            return
+        
+        with _render() as (Fore, Style, tabulate):
+            print(f"\n📡 {Fore.CYAN}HTTP 요청 지표{Style.RESET_ALL} (평균 ms, 재사용 커넥션은 DNS/연결/TLS 0)")
+            if not rows:
+                print("⚠️  기록된 요청이 없습니다.")
+                return
+        
+            metrics_table = []
+            for row in rows:
+                metrics_table.append([
+                    row['endpoint'],
+                    row['requests'],
+                    row['errors'],
+                    row['retries'],
+                    row['new_connections'],
+                    f"{row['dns_ms']:.1f}",
+                    f"{row['connect_ms']:.1f}",
+                    f"{row['tls_ms']:.1f}",
+                    f"{row['ttfb_ms']:.1f}",
+                    f"{row['total_ms']:.1f}",
+                    f"{row['p95_ms']:.1f}",
+                    f"{row['bytes'] / 1024:,.1f}",
+                ])
+        
+            headers = ['엔드포인트', '요청', '오류', '재시도', '새 연결', 'DNS', '연결', 'TLS', 'TTFB', '전체', 'p95', 'KB']
+            print(tabulate(metrics_table, headers=headers, tablefmt='grid'))
+            total_ms = sum(row['sum_ms'] for row in rows)
+            total_kb = sum(row['bytes'] for row in rows) / 1024
+            print(f"⏱️  요청 {sum(row['requests'] for row in rows)}건 / 누적 {total_ms:,.0f}ms / {total_kb:,.1f}KB")
+    
+    def display_premium_anomalies(self, store: 'TickStore', data: Dict,
+                                  zscore: float = 3.0, window: int = 60, format_type: str = 'table'):
+        """과거 틱 대비 통계적으로 이례적인 김치 프리미엄 출력"""
+        from history import premium_zscores
+        
+        results = premium_zscores(store, self.get_premiums(data), window=window)
+        anomalies = sorted(
+            (item for item in results if abs(item['zscore']) >= zscore),
+            key=lambda x: abs(x['zscore']), reverse=True
+        )
+        
+        if format_type != 'table':
+            if not results:
+                print("⚠️  히스토리가 부족합니다. --record 로 틱을 먼저 쌓아주세요.")
+            self.writer.emit_many('premium_anomaly',
+                                  [dict(item, threshold=zscore, window=window) for item in anomalies])
+            return
+        
+        with _render() as (Fore, Style, tabulate):
+            print(f"\n🚨 {Fore.RED}김치 프리미엄 이상 변동{Style.RESET_ALL}")
+            print(f"🔍 기준: 최근 {window}틱 대비 |z| ≥ {zscore}\n")
+        
+            if not results:
+                print("⚠️  히스토리가 부족합니다. --record 로 틱을 먼저 쌓아주세요.")
+                return
+        
+            anomaly_table = []
+            for item in anomalies:
+                z_color = Fore.GREEN if item['zscore'] > 0 else Fore.RED
+                anomaly_table.append([
+                    item['exchange'].capitalize(),
+                    item['symbol'],
+                    f"{item['premium']:+.2f}%",
+                    f"{item['mean']:+.2f}%",
+                    f"{item['std']:.2f}",
+                    f"{z_color}{item['zscore']:+.2f}{Style.RESET_ALL}",
+                    item['samples']
+                ])
         
-        if surge_table:
-            print(tabulate(surge_table,
-                headers=['거래소', '코인', '현재가', '24h 변동률', '24h 거래량', '평균 대비'],
-                tablefmt='grid'))
-        else:
-            print("⚠️  현재 거래량 급등 종목이 없습니다.")
+            if anomaly_table:
+                print(tabulate(anomaly_table,
+                    headers=['거래소', '코인', '현재 프리미엄', '평균', '표준편차', 'z-score', '표본'],
+                    tablefmt='grid'))
+            else:
+                print("✅ 이례적인 프리미엄 변동이 없습니다.")
     
-    def market_summary(self, data: Dict):
+    def market_summary_report(self, data: Dict) -> Dict:
+        """원화 마켓 거래소별 상승/하락 종목 수·평균 김치 프리미엄, 상위 상승/하락 종목
+
+        avg_premium 은 기존 출력 형식대로 업비트 평균입니다.
+        """
+        exchanges = self.krw_exchanges()
+        counts = {}
+        all_coins = []
+        for exchange in exchanges:
+            tickers = data.get(exchange) or {}
+            counts[exchange] = {
+                'up': sum(1 for info in tickers.values() if info['change_rate'] > 0),
+                'down': sum(1 for info in tickers.values() if info['change_rate'] < 0),
+            }
+            all_coins += [(symbol, exchange, info) for symbol, info in tickers.items()]
+        
+        mover = lambda item: {'symbol': item[0], 'exchange': item[1], 'change_rate': item[2]['change_rate']}
+        top_gainers = [mover(item) for item in sorted(all_coins, key=lambda x: x[2]['change_rate'], reverse=True)[:3]]
+        top_losers = [mover(item) for item in sorted(all_coins, key=lambda x: x[2]['change_rate'])[:3]]
+        
+        by_exchange: Dict[str, List[float]] = {exchange: [] for exchange in exchanges}
+        for (exchange, _), premium in self.get_premiums(data).items():
+            by_exchange[exchange].append(premium)
+        avg_premiums = {exchange: sum(values) / len(values) for exchange, values in by_exchange.items() if values}
+        
+        return {
+            'usd_krw': self.usd_krw_rate,
+            'counts': counts,
+            'top_gainers': top_gainers,
+            'top_losers': top_losers,
+            'avg_premium': avg_premiums.get('upbit'),
+            'avg_premiums': avg_premiums,
+        }
+    
+    def market_summary(self, data: Dict, format_type: str = 'table'):
         """시장 요약"""
-        print(f"\n📋 {Fore.MAGENTA}한국 암호화폐 시장 요약{Style.RESET_ALL}")
-        print(f"📅 {datetime.datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}")
-        print(f"💱 USD/KRW: {self.usd_krw_rate:,.2f}")
-        print("-" * 60)
-        
-        # 상승/하락 종목 수
-        upbit_up = sum(1 for info in data['upbit'].values() if info['change_rate'] > 0)
-        upbit_down = sum(1 for info in data['upbit'].values() if info['change_rate'] < 0)
-        
-        print(f"\n🔵 업비트:")
-        print(f"  상승: {upbit_up}개  📈")
-        print(f"  하락: {upbit_down}개  📉")
-        
-        if data['bithumb']:
-            bithumb_up = sum(1 for info in data['bithumb'].values() if info['change_rate'] > 0)
-            bithumb_down = sum(1 for info in data['bithumb'].values() if info['change_rate'] < 0)
-            
-            print(f"\n🟡 빗썸:")
-            print(f"  상승: {bithumb_up}개  📈")
-            print(f"  하락: {bithumb_down}개  📉")
+        report = self.market_summary_report(data)
+        if format_type != 'table':
+            self.writer.emit('market_summary', report)
+            return
         
-        # 상위 상승 종목
-        all_coins = list(data['upbit'].items()) + list(data['bithumb'].items())
-        top_gainers = sorted(all_coins, key=lambda x: x[1]['change_rate'], reverse=True)[:3]
+        with _render() as (Fore, Style, tabulate):
+            print(f"\n📋 {Fore.MAGENTA}한국 암호화폐 시장 요약{Style.RESET_ALL}")
+            print(f"📅 {datetime.datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}")
+            print(f"💱 USD/KRW: {self.usd_krw_rate:,.2f}")
+            print("-" * 60)
         
-        print(f"\n🏆 상위 상승 종목:")
-        for i, (symbol, info) in enumerate(top_gainers, 1):
-            print(f"  {i}. {symbol} ({info['exchange']}): {info['change_rate']:+.2f}%")
+            # 상승/하락 종목 수
+            for exchange, count in report['counts'].items():
+                if not data.get(exchange):
+                    continue
+                icon, _ = _EXCHANGE_STYLE.get(exchange, _DEFAULT_STYLE)
+                print(f"\n{icon} {self.adapters[exchange].label}:")
+                print(f"  상승: {count['up']}개  📈")
+                print(f"  하락: {count['down']}개  📉")
         
-        # 상위 하락 종목
-        top_losers = sorted(all_coins, key=lambda x: x[1]['change_rate'])[:3]
+            # 상위 상승 종목
+            print(f"\n🏆 상위 상승 종목:")
+            for i, item in enumerate(report['top_gainers'], 1):
+                print(f"  {i}. {item['symbol']} ({item['exchange']}): {item['change_rate']:+.2f}%")
         
-        print(f"\n📉 상위 하락 종목:")
-        for i, (symbol, info) in enumerate(top_losers, 1):
-            print(f"  {i}. {symbol} ({info['exchange']}): {info['change_rate']:+.2f}%")
+            # 상위 하락 종목
+            print(f"\n📉 상위 하락 종목:")
+            for i, item in enumerate(report['top_losers'], 1):
+                print(f"  {i}. {item['symbol']} ({item['exchange']}): {item['change_rate']:+.2f}%")
         
-        # 김치 프리미엄 요약
-        premiums = []
-        for symbol in self.symbols.keys():
-            upbit_price = data['upbit'].get(symbol, {}).get('price', 0)
-            binance_price = data['binance'].get(symbol, {}).get('price', 0)
-            
-            if upbit_price > 0 and binance_price > 0:
-                premium = self.calculate_kimchi_premium(upbit_price, binance_price)
-                premiums.append(premium)
+            # 김치 프리미엄 요약
+            if report['avg_premiums']:
+                print(f"\n🌶️  평균 김치프리미엄:")
+                for exchange, premium in report['avg_premiums'].items():
+                    print(f"  {self.adapters[exchange].label}: {premium:+.2f}%")
+
+def run_cycle(tracker: KoreanCryptoTracker, args: argparse.Namespace,
+              store: Optional['TickStore'] = None, baseline: Optional[VolumeBaseline] = None,
+              engine: Optional['AlertEngine'] = None):
+    """1회 조회 + 분석 + 기록"""
+    # 데이터 수집
+    with phase('fetch'):
+        data = tracker.get_all_prices()
+    
+    if args.prices or args.all:
+        with phase('analysis:prices'):
+            tracker.display_prices(data, args.format)
+    
+    if args.kimchi_premium or args.all:
+        with phase('analysis:kimchi_premium'):
+            tracker.display_kimchi_premium(data, args.threshold, args.format)
+    
+    if baseline is not None:
+        with phase('analysis:volume_surge'):
+            if args.volume_surge or args.all:
+                tracker.detect_volume_surge(data, baseline, args.surge_multiplier, args.format)
+            else:
+                baseline.observe_snapshot(data, tracker.krw_exchanges())
+            baseline.save()
+    
+    if args.market_summary or args.all:
+        with phase('analysis:market_summary'):
+            tracker.market_summary(data, args.format)
+    
+    if args.coin:
+        tracker.display_coin(data, args.coin.upper(), args.format)
+    
+    if engine is not None:
+        with phase('analysis:alerts'):
+            tracker.display_alerts(engine.update_snapshot(data, tracker.get_premiums(data)), args.format)
+            engine.save_state()
+    
+    if args.depth:
+        from depth import DEFAULT_NOTIONALS
+        
+        notionals = [float(n) for n in args.sizes.split(',')] if args.sizes else DEFAULT_NOTIONALS
+        with phase('analysis:depth'):
+            tracker.display_executable_premium(notionals, args.format)
+    
+    if args.zscore is not None:
+        with phase('analysis:zscore'):
+            tracker.display_premium_anomalies(store, data, args.zscore, args.window, args.format)
+    
+    if args.record:
+        with phase('record'):
+            rows = store.append_snapshot(data, tracker.get_premiums(data))
+        print(f"\n💾 히스토리 기록: {rows}틱 → {store.root}")
+    
+    if args.metrics:
+        # watch 모드에서는 조회 주기마다 지표를 새로 집계
+        tracker.display_http_metrics(args.format)
+        tracker.metrics.reset()
+    
+    # --format json: 이번 조회의 결과를 JSON 문서 하나로
+    tracker.writer.flush()
+
+
+def run_backfill(tracker: KoreanCryptoTracker, args: argparse.Namespace):
+    """캔들 백필 (+ 선택적으로 히스토리 시딩)"""
+    from backfill import DEFAULT_BACKFILL_DAYS, DEFAULT_CACHE_DIR, CandleCache, backfill, seed_history
+    
+    days = args.days if args.days is not None else DEFAULT_BACKFILL_DAYS[args.backfill]
+    end = int(time.time())
+    start = end - int(days * 24 * 60 * 60)
+    exchanges = list(tracker.adapters.keys())
+    cache = CandleCache(args.cache_dir or DEFAULT_CACHE_DIR)
+    
+    print(f"📥 캔들 백필: {args.backfill} / 최근 {days:g}일 / {len(tracker.symbols)}개 코인 / {', '.join(exchanges)}")
+    started = time.perf_counter()
+    # 시딩은 24시간 거래량 합계가 찬 캔들부터 — 요청 기간 첫 캔들부터 시딩되도록 하루 더 받음
+    fetch_start = start - 24 * 60 * 60 if args.seed and args.backfill != 'day' else start
+    counts = backfill(tracker, args.backfill, fetch_start, end, exchanges, cache)
+    elapsed = time.perf_counter() - started
+    
+    for exchange, count in counts.items():
+        print(f"  • {exchange}: 신규 캔들 {count:,}개")
+    print(f"⏱️  {elapsed:.1f}초 → {cache.root}")
+    
+    if args.seed:
+        from history import DEFAULT_HISTORY_DIR, TickStore
         
-        if premiums:
-            avg_premium = sum(premiums) / len(premiums)
-            print(f"\n🌶️  평균 김치프리미엄: {avg_premium:+.2f}%")
+        store = TickStore(args.history_dir or DEFAULT_HISTORY_DIR)
+        if len(store) > 0:
+            print("⚠️  히스토리가 비어 있을 때만 시딩할 수 있습니다 (추가 전용 저장소).")
+            return
+        baseline = VolumeBaseline(args.baseline_path, halflife=args.baseline_halflife * 3600)
+        seeded = seed_history(tracker, cache, args.backfill, store, baseline)
+        baseline.save()
+        print(f"🌱 히스토리 시딩: {seeded:,}틱 → {store.root}")
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description='한국 암호화폐 거래소 실시간 추적 도구')
     parser.add_argument('--prices', action='store_true', help='실시간 시세 조회')
     parser.add_argument('--kimchi-premium', action='store_true', help='김치 프리미엄 계산')
@@ -406,47 +702,148 @@ def main():
     parser.add_argument('--market-summary', action='store_true', help='일일 시장 요약')
     parser.add_argument('--coin', type=str, help='특정 코인 조회 (예: BTC)')
     parser.add_argument('--threshold', type=float, help='김치 프리미엄 임계값 (퍼센트)')
-    parser.add_argument('--format', choices=['table', 'json'], default='table', help='출력 형식')
+    parser.add_argument('--format', choices=['table', 'json', 'ndjson'], default='table',
+                        help='출력 형식 (ndjson: 분석 결과/알림마다 JSON 한 줄 스트리밍)')
     parser.add_argument('--all', action='store_true', help='모든 정보 출력')
-    
+    parser.add_argument('--record', action='store_true', help='조회 결과를 히스토리에 틱으로 기록')
+    parser.add_argument('--history-dir', type=str, help='히스토리 저장 경로 (기본: ~/.korean-crypto-tracker/history)')
+    parser.add_argument('--zscore', type=float, help='히스토리 대비 프리미엄 이상 변동 z-score 임계값')
+    parser.add_argument('--window', type=int, default=60, help='이동 통계 윈도우 (틱 수)')
+    parser.add_argument('--surge-multiplier', type=float, default=2.0, help='거래량 급등 기준 (평소 대비 배수)')
+    parser.add_argument('--baseline-path', type=str, default=DEFAULT_BASELINE_PATH, help='거래량 베이스라인 저장 경로')
+    parser.add_argument('--baseline-halflife', type=float, default=24, help='거래량 베이스라인 반감기 (시간)')
+    parser.add_argument('--universe', choices=['major', 'all'], default='major', help='추적 대상 (주요 코인 / KRW 마켓 전체)')
+    parser.add_argument('--rules', type=str, help='알림 규칙 파일 (예: "BTC upbit premium > 3%%")')
+    parser.add_argument('--alert-cooldown', type=float, help='알림 규칙 기본 쿨다운 (초, 기본: 300)')
+    parser.add_argument('--depth', action='store_true', help='호가 깊이 기반 실거래 김치 프리미엄')
+    parser.add_argument('--sizes', type=str, help='실거래 프리미엄 주문 금액 (KRW, 쉼표 구분)')
+    parser.add_argument('--backfill', choices=['minute', 'hour', 'day'], help='캔들 히스토리 백필 (분/시간/일)')
+    parser.add_argument('--days', type=float, help='백필 기간 (일, 기본: 분 1 / 시간 30 / 일 365)')
+    parser.add_argument('--exchanges', type=str, default=','.join(DEFAULT_EXCHANGES),
+                        help=f"조회 거래소 (쉼표 구분, 지원: {', '.join(ADAPTERS)})")
+    parser.add_argument('--cache-dir', type=str, help='캔들 캐시 경로 (기본: ~/.korean-crypto-tracker/candles)')
+    parser.add_argument('--seed', action='store_true', help='백필한 캔들로 프리미엄 히스토리/거래량 베이스라인 초기화')
+    parser.add_argument('--watch', type=float, metavar='SECONDS', help='지정 간격(초)으로 반복 조회')
+    parser.add_argument('--metrics', action='store_true', help='엔드포인트별 HTTP 지연(DNS/연결/TLS/TTFB/전체)과 바이트 수 출력')
+    parser.add_argument('--profile', nargs='?', const='-', metavar='FILE',
+                        help='단계별 실행 시간/메모리 리포트 (기본: stderr 에 JSON, FILE.prof 면 cProfile 덤프도 저장)')
+    parser.add_argument('--base-url', type=str, help='모든 거래소/환율 API 를 이 서버의 /{거래소} 경로로 요청 (replay.py 재생 서버용)')
+    return parser
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
     
     if len(sys.argv) == 1:
         parser.print_help()
         return
     
-    tracker = KoreanCryptoTracker()
+    writer = None
+    output = contextlib.nullcontext()
+    if args.format != 'table':
+        # stdout 에는 JSON 만 — 진행/경고 메시지는 stderr 로
+        writer = EventWriter(sys.stdout, document=args.format == 'json')
+        output = contextlib.redirect_stdout(sys.stderr)
     
-    try:
-        # 데이터 수집
-        data = tracker.get_all_prices()
-        
-        if args.prices or args.all:
-            tracker.display_prices(data, args.format)
-        
-        if args.kimchi_premium or args.all:
-            tracker.display_kimchi_premium(data, args.threshold)
+    with output:
+        if args.profile is None:
+            run(args, writer)
+            return
         
-        if args.volume_surge or args.all:
-            tracker.detect_volume_surge(data)
+        profiler = profiling.enable()
+        profiler.record('startup:imports', _IMPORT_SECONDS)
+        cprofile = None
+        if args.profile.endswith('.prof'):
+            import cProfile
+            cprofile = cProfile.Profile()
+            cprofile.enable()
+        try:
+            run(args, writer)
+        finally:
+            if cprofile is not None:
+                cprofile.disable()
+                cprofile.dump_stats(args.profile)
+            write_profile_report(profiler.report(), args.profile)
+
+
+def write_profile_report(report: Dict, target: str):
+    """--profile 리포트 출력 (stdout 출력과 섞이지 않도록 stderr 또는 파일)"""
+    text = json.dumps({'profile': report}, ensure_ascii=False, indent=2)
+    if target == '-' or target.endswith('.prof'):
+        print(text, file=sys.stderr)
+        if target != '-':
+            print(f"📈 cProfile 덤프: {target} (python -m pstats {target})", file=sys.stderr)
+        return
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write(text + '\n')
+    print(f"📈 프로파일 리포트: {target}", file=sys.stderr)
+
+
+def run(args: argparse.Namespace, writer: Optional[EventWriter] = None):
+    """인자 검증 후 백필 또는 조회 루프 실행"""
+    exchanges = [ex.strip() for ex in args.exchanges.split(',') if ex.strip()]
+    unknown = [ex for ex in exchanges if ex not in ADAPTERS]
+    if unknown:
+        print(f"❌ 지원하지 않는 거래소: {', '.join(unknown)} (지원: {', '.join(ADAPTERS)})")
+        sys.exit(1)
+    
+    metrics = HttpMetrics() if args.metrics else None
+    with phase('init'):
+        base_urls = None
+        if args.base_url:
+            base_urls = {name: f"{args.base_url.rstrip('/')}/{name}" for name in list(ADAPTERS) + ['fx']}
+        tracker = KoreanCryptoTracker(universe=args.universe, exchanges=exchanges, metrics=metrics,
+                                      base_urls=base_urls)
+    if writer is not None:
+        tracker.writer = writer
+    
+    engine = None
+    if args.rules:
+        from alerts import DEFAULT_COOLDOWN, AlertEngine, load_rules
         
-        if args.market_summary or args.all:
-            tracker.market_summary(data)
+        cooldown = DEFAULT_COOLDOWN if args.alert_cooldown is None else args.alert_cooldown
+        engine = AlertEngine(load_rules(args.rules, cooldown), state_path=f"{args.rules}.state.json")
+        # 규칙에만 있는 코인도 조회 대상에 추가 — 규칙이 참조하는 거래소에서만
+        for symbol, needed in engine.symbol_exchanges().items():
+            tracker.add_symbol(symbol, needed)
+        missing = sorted({rule.exchange for rule in engine.rules} - set(tracker.adapters))
+        if missing:
+            print(f"⚠️  규칙의 거래소 {', '.join(missing)} 가 조회 대상이 아닙니다 (--exchanges 에 추가하세요)")
+    
+    if args.backfill:
+        run_backfill(tracker, args)
+        if args.metrics:
+            tracker.display_http_metrics(args.format)
+            tracker.writer.flush()
+        return
+    
+    store = None
+    baseline = None
+    if args.record or args.zscore is not None or args.volume_surge or args.all:
+        from history import DEFAULT_HISTORY_DIR, TickStore
         
-        if args.coin:
-            symbol = args.coin.upper()
-            if symbol in tracker.symbols:
-                print(f"\n🔍 {symbol} 상세 정보:")
-                for exchange in ['upbit', 'bithumb', 'binance']:
-                    if symbol in data.get(exchange, {}):
-                        info = data[exchange][symbol]
-                        print(f"  {exchange}: {info['price']:,.2f} ({info['change_rate']:+.2f}%)")
-            else:
-                print(f"❌ 지원하지 않는 코인: {symbol}")
-                print(f"지원 코인: {', '.join(tracker.symbols.keys())}")
+        history_dir = args.history_dir or DEFAULT_HISTORY_DIR
+        if args.record or args.zscore is not None:
+            store = TickStore(history_dir)
+    
+    if args.volume_surge or args.all or args.record:
+        baseline = VolumeBaseline(args.baseline_path, halflife=args.baseline_halflife * 3600)
+        if len(baseline) == 0 and os.path.isdir(history_dir):
+            seeded = baseline.seed_from_store(TickStore(history_dir))
+            if seeded:
+                print(f"🧮 히스토리 {seeded}틱으로 거래량 베이스라인 초기화")
+    
+    try:
+        while True:
+            run_cycle(tracker, args, store, baseline, engine)
+            if not args.watch:
+                break
+            time.sleep(args.watch)
+            tracker.usd_krw_rate = tracker.get_exchange_rate()
     
     except KeyboardInterrupt:
-        print(f"\n\n{Fore.YELLOW}사용자 중단{Style.RESET_ALL}")
+        print("\n\n사용자 중단")
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         sys.exit(1)
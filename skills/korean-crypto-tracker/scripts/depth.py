@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Executable Premium
+호가 깊이 기반 실거래 김치 프리미엄
+
+최근 체결가 대신 호가창을 따라 내려가며, 지정한 주문 금액을 실제로 체결했을 때의
+거래량 가중 평균가(VWAP)로 김치 프리미엄을 계산합니다. 호가는 거래소별 일괄 요청
+(업비트 다중 마켓 orderbook, 빗썸 ALL_KRW orderbook, 바이낸스 depth 병렬 요청)으로
+받고, 계산은 코인 × 호가 단계 2차원 배열의 누적합으로 한 번에 처리합니다.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from exchanges import Book
+
+# 기본 주문 금액 (KRW)
+DEFAULT_NOTIONALS = [1_000_000, 10_000_000, 100_000_000]
+
+
+def fetch_all_orderbooks(tracker) -> Dict[str, Dict[str, Book]]:
+    """호가를 지원하는 모든 거래소에서 동시에 일괄 조회"""
+    return tracker.scheduler.run('fetch_orderbooks', args_for=lambda exchange: (tracker.symbols_for(exchange),))
+
+
+# ----------------------------------------------------------------------
+# 벡터화 VWAP
+# ----------------------------------------------------------------------
+def stack_side(books: Dict[str, Book], symbols: List[str], side: str) -> Tuple[np.ndarray, np.ndarray]:
+    """코인 × 호가 단계 2차원 배열 (빈 칸은 수량 0)"""
+    depth = max((books[s][side][0].size for s in symbols), default=0)
+    prices = np.zeros((len(symbols), depth))
+    qtys = np.zeros((len(symbols), depth))
+    for i, symbol in enumerate(symbols):
+        p, q = books[symbol][side]
+        prices[i, :p.size] = p
+        qtys[i, :q.size] = q
+    return prices, qtys
+
+
+def vwap_for_notional(prices: np.ndarray, qtys: np.ndarray, notionals: np.ndarray) -> np.ndarray:
+    """주문 금액별 체결 VWAP (주문 금액 × 코인, 호가 부족시 NaN)
+
+    prices/qtys: (코인, 호가 단계), notionals: (주문 금액,) — 호가 통화 기준
+    """
+    notionals = np.asarray(notionals, dtype=float)
+    cum_notional = np.cumsum(prices * qtys, axis=1)
+    cum_qty = np.cumsum(qtys, axis=1)
+    depth = prices.shape[1]
+    if depth == 0:
+        return np.full((notionals.size, prices.shape[0]), np.nan)
+
+    # 누적 금액이 주문 금액에 처음 도달하는 호가 단계
+    level = (cum_notional[None, :, :] < notionals[:, None, None]).sum(axis=2)
+    filled = level < depth
+    level = np.minimum(level, depth - 1)
+
+    rows = np.arange(prices.shape[0])[None, :]
+    prev = level - 1
+    prev_notional = np.where(prev >= 0, cum_notional[rows, np.maximum(prev, 0)], 0.0)
+    prev_qty = np.where(prev >= 0, cum_qty[rows, np.maximum(prev, 0)], 0.0)
+    level_price = prices[rows, level]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        qty = prev_qty + (notionals[:, None] - prev_notional) / level_price
+        vwap = notionals[:, None] / qty
+    return np.where(filled & (level_price > 0), vwap, np.nan)
+
+
+def executable_premiums(books: Dict[str, Dict[str, Book]], usd_krw: float,
+                        notionals_krw: List[float]) -> List[Dict]:
+    """거래소/코인/주문 금액별 실거래 김치 프리미엄
+
+    ask_premium: 국내 매수(ask VWAP) vs 해외 매도(bid VWAP)
+    bid_premium: 국내 매도(bid VWAP) vs 해외 매수(ask VWAP)
+    """
+    notionals_krw = np.asarray(notionals_krw, dtype=float)
+    notionals_usd = notionals_krw / usd_krw
+    global_books = books.get('binance', {})
+
+    results = []
+    for exchange, korean_books in books.items():
+        if exchange == 'binance':
+            continue
+        symbols = sorted(s for s in korean_books if s in global_books)
+        if not symbols:
+            continue
+
+        kr_ask = vwap_for_notional(*stack_side(korean_books, symbols, 'asks'), notionals_krw) / usd_krw
+        kr_bid = vwap_for_notional(*stack_side(korean_books, symbols, 'bids'), notionals_krw) / usd_krw
+        gl_ask = vwap_for_notional(*stack_side(global_books, symbols, 'asks'), notionals_usd)
+        gl_bid = vwap_for_notional(*stack_side(global_books, symbols, 'bids'), notionals_usd)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ask_premium = (kr_ask - gl_bid) / gl_bid * 100
+            bid_premium = (kr_bid - gl_ask) / gl_ask * 100
+
+        for j, symbol in enumerate(symbols):
+            results.append({
+                'exchange': exchange,
+                'symbol': symbol,
+                'sizes': [
+                    {
+                        'notional_krw': float(notionals_krw[i]),
+                        'ask_premium': float(ask_premium[i, j]),
+                        'bid_premium': float(bid_premium[i, j]),
+                    }
+                    for i in range(notionals_krw.size)
+                ],
+            })
+    return results
@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+Exchange Adapters
+거래소 어댑터 + 동시 조회 스케줄러
+
+거래소마다 시세(ticker), 호가(orderbook), 캔들 조회를 같은 인터페이스로 구현하고
+결과를 하나의 레코드 형식으로 정규화합니다. FanOutScheduler 는 모든 어댑터를
+동시에 실행하며, 거래소별 호출 제한과 타임아웃을 적용해 느린 거래소 하나가 전체
+조회를 지연시키지 않도록 합니다. 타임아웃은 HTTP 요청까지 전달되어, 시간이 다 된
+호출은 남은 요청을 보내지 않고 실패로 끝나 작업 스레드를 붙잡지 않습니다.
+"""
+
+import contextlib
+import datetime
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypedDict
+
+from profiling import phase
+from ratelimit import exchange_limiter
+
+# numpy 는 호가/캔들 조회에서만 import (시세만 조회하는 실행은 불러오지 않음)
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Ticker(TypedDict):
+    """정규화된 시세 레코드"""
+    exchange: str
+    symbol: str
+    price: float
+    change_rate: float       # 24시간 변동률 (%)
+    volume_24h: float        # 24시간 거래량 (코인 수량)
+    trade_value_24h: float   # 24시간 거래대금 (호가 통화)
+    high_24h: float
+    low_24h: float
+    timestamp: float         # unix seconds
+
+
+# 한쪽 호가: (가격 배열, 수량 배열) — 최우선 호가부터 정렬
+Side = Tuple['np.ndarray', 'np.ndarray']
+Book = Dict[str, Side]  # {'bids': Side, 'asks': Side}
+
+CANDLE_FIELDS = [
+    ('ts', '<i8'),       # 캔들 시작 시각 (unix seconds, UTC)
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+]
+_candle_dtype = None
+
+
+def candle_dtype() -> 'np.dtype':
+    """캔들 배열 dtype (numpy 는 처음 호출할 때 import)"""
+    global _candle_dtype
+    if _candle_dtype is None:
+        import numpy as np
+        _candle_dtype = np.dtype(CANDLE_FIELDS)
+    return _candle_dtype
+
+
+def __getattr__(name: str):
+    # CANDLE_DTYPE 은 처음 접근할 때 생성 (from exchanges import CANDLE_DTYPE 호환)
+    if name == 'CANDLE_DTYPE':
+        return candle_dtype()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def make_candles(rows: List[Tuple]) -> 'np.ndarray':
+    """(ts, open, high, low, close, volume) 행 → CANDLE_DTYPE 배열"""
+    import numpy as np
+    return np.array(rows, dtype=candle_dtype())
+
+
+def make_side(levels: Iterable[Tuple[float, float]]) -> Side:
+    import numpy as np
+    arr = np.asarray(list(levels), dtype=float)
+    if arr.size == 0:
+        return np.empty(0), np.empty(0)
+    return arr[:, 0], arr[:, 1]
+
+
+def make_ticker(exchange: str, symbol: str, price, change_rate, volume_24h, trade_value_24h,
+                high_24h, low_24h, timestamp) -> Ticker:
+    return {
+        'exchange': exchange,
+        'symbol': symbol,
+        'price': float(price),
+        'change_rate': float(change_rate),
+        'volume_24h': float(volume_24h),
+        'trade_value_24h': float(trade_value_24h),
+        'high_24h': float(high_24h),
+        'low_24h': float(low_24h),
+        'timestamp': float(timestamp),
+    }
+
+
+# 스케줄러가 호출마다 지정하는 마감 시각 (time.monotonic 기준, 스레드별)
+_call_local = threading.local()
+
+
+@contextlib.contextmanager
+def call_deadline(deadline: Optional[float]):
+    """이 스레드에서 실행되는 어댑터 요청의 마감 시각 지정"""
+    previous = getattr(_call_local, 'deadline', None)
+    _call_local.deadline = deadline
+    try:
+        yield
+    finally:
+        _call_local.deadline = previous
+
+
+def current_deadline() -> Optional[float]:
+    return getattr(_call_local, 'deadline', None)
+
+
+class ExchangeAdapter:
+    """거래소 어댑터 기본 클래스
+
+    하위 클래스는 fetch_tickers 를 구현하고, 지원하는 경우 fetch_orderbooks /
+    fetch_candles 를 구현합니다. 모든 HTTP 요청은 _get 을 거쳐 거래소별 호출 제한을 받습니다.
+    """
+
+    name = ''
+    label = ''
+    base_url = ''
+    quote = 'KRW'          # 호가 통화 (KRW / USDT)
+    timeout = 10.0
+    # 캔들 1회 요청 최대 개수 (None 이면 페이지 조회 불가 — 최근 구간만 반환)
+    candle_page_size: Optional[int] = None
+
+    def __init__(self, session, base_url: Optional[str] = None):
+        self.session = session
+        if base_url:
+            self.base_url = base_url.rstrip('/')
+        self.limiter = exchange_limiter(self.name)
+
+    def _request_timeout(self) -> float:
+        """요청 1건의 타임아웃 — 호출 마감 시각까지 남은 시간 이내 (지났으면 TimeoutError)"""
+        deadline = current_deadline()
+        if deadline is None:
+            return self.timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"{self.label} 조회 시간 초과")
+        return min(self.timeout, remaining)
+
+    def _get(self, path: str, params: Optional[Dict] = None):
+        with self.limiter:
+            timeout = self._request_timeout()
+            response = self.session.get(f'{self.base_url}{path}', params=params, timeout=timeout)
+        response.raise_for_status()
+        with phase(f'json_decode:{self.name}'):
+            return response.json()
+
+    def supports(self, method: str) -> bool:
+        return getattr(type(self), method) is not getattr(ExchangeAdapter, method)
+
+    def list_symbols(self) -> Set[str]:
+        """거래 가능한 코인 목록"""
+        return set(self.fetch_tickers(None).keys())
+
+    def fetch_tickers(self, symbols: Optional[List[str]]) -> Dict[str, Ticker]:
+        """시세 조회 (symbols 가 None 이면 전체)"""
+        raise NotImplementedError
+
+    def fetch_orderbooks(self, symbols: List[str]) -> Dict[str, Book]:
+        raise NotImplementedError(f"{self.name}: 호가 조회 미지원")
+
+    def fetch_candles(self, symbol: str, interval: str, start: int, end: int) -> 'np.ndarray':
+        """[start, end) 구간 캔들 1페이지"""
+        raise NotImplementedError(f"{self.name}: 캔들 조회 미지원")
+
+
+# ----------------------------------------------------------------------
+# 업비트
+# ----------------------------------------------------------------------
+class UpbitAdapter(ExchangeAdapter):
+    name = 'upbit'
+    label = '업비트'
+    base_url = 'https://api.upbit.com'
+    candle_page_size = 200
+
+    MARKETS_PER_REQUEST = 100
+    CANDLE_PATHS = {'minute': 'minutes/1', 'hour': 'minutes/60', 'day': 'days'}
+
+    def __init__(self, session, base_url: Optional[str] = None):
+        super().__init__(session, base_url)
+        # KRW 마켓 목록 — 업비트는 존재하지 않는 마켓이 하나라도 섞이면 요청 전체가 실패
+        self.markets: Optional[Set[str]] = None
+
+    def list_symbols(self) -> Set[str]:
+        data = self._get('/v1/market/all')
+        self.markets = {item['market'] for item in data if item['market'].startswith('KRW-')}
+        return {market.split('-')[1] for market in self.markets}
+
+    def _markets(self, symbols: Optional[List[str]]) -> List[str]:
+        if self.markets is None:
+            self.list_symbols()
+        if symbols is None:
+            return sorted(self.markets)
+        return [f'KRW-{symbol}' for symbol in symbols if f'KRW-{symbol}' in self.markets]
+
+    def _batches(self, markets: List[str]) -> List[str]:
+        return [','.join(markets[i:i + self.MARKETS_PER_REQUEST])
+                for i in range(0, len(markets), self.MARKETS_PER_REQUEST)]
+
+    def fetch_tickers(self, symbols: Optional[List[str]]) -> Dict[str, Ticker]:
+        result = {}
+        for batch in self._batches(self._markets(symbols)):
+            for item in self._get('/v1/ticker', {'markets': batch}):
+                symbol = item['market'].split('-')[1]
+                result[symbol] = make_ticker(
+                    self.name, symbol,
+                    price=item['trade_price'],
+                    change_rate=item['signed_change_rate'] * 100,
+                    volume_24h=item['acc_trade_volume_24h'],
+                    trade_value_24h=item['acc_trade_price_24h'],
+                    high_24h=item['high_price'],
+                    low_24h=item['low_price'],
+                    timestamp=item['timestamp'] / 1000,
+                )
+        return result
+
+    def fetch_orderbooks(self, symbols: List[str]) -> Dict[str, Book]:
+        result = {}
+        for batch in self._batches(self._markets(symbols)):
+            for item in self._get('/v1/orderbook', {'markets': batch}):
+                units = item['orderbook_units']
+                result[item['market'].split('-')[1]] = {
+                    'bids': make_side((u['bid_price'], u['bid_size']) for u in units),
+                    'asks': make_side((u['ask_price'], u['ask_size']) for u in units),
+                }
+        return result
+
+    def fetch_candles(self, symbol: str, interval: str, start: int, end: int) -> 'np.ndarray':
+        # to 이전 최대 200개 (to 는 제외)
+        to = datetime.datetime.fromtimestamp(end, datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        data = self._get(f'/v1/candles/{self.CANDLE_PATHS[interval]}',
+                         {'market': f'KRW-{symbol}', 'to': to, 'count': self.candle_page_size})
+        rows = []
+        for item in data:
+            opened = datetime.datetime.fromisoformat(item['candle_date_time_utc']).replace(tzinfo=datetime.timezone.utc)
+            rows.append((
+                int(opened.timestamp()),
+                item['opening_price'],
+                item['high_price'],
+                item['low_price'],
+                item['trade_price'],
+                item['candle_acc_trade_volume'],
+            ))
+        return make_candles(rows)
+
+
+# ----------------------------------------------------------------------
+# 빗썸
+# ----------------------------------------------------------------------
+class BithumbAdapter(ExchangeAdapter):
+    name = 'bithumb'
+    label = '빗썸'
+    base_url = 'https://api.bithumb.com'
+
+    ORDERBOOK_DEPTH = 30
+    CANDLE_INTERVALS = {'minute': '1m', 'hour': '1h', 'day': '24h'}
+
+    def _public(self, path: str, params: Optional[Dict] = None) -> Dict:
+        data = self._get(path, params)
+        if data.get('status') != '0000':
+            raise Exception(f"Bithumb API Error: {data.get('status')}")
+        return data['data']
+
+    def fetch_tickers(self, symbols: Optional[List[str]]) -> Dict[str, Ticker]:
+        data = self._public('/public/ticker/ALL_KRW')
+        wanted = set(symbols) if symbols is not None else None
+        timestamp = float(data['date']) / 1000
+
+        result = {}
+        for symbol, price_data in data.items():
+            # 'date' 키는 전체 응답의 타임스탬프이므로 건너뛰기
+            if symbol == 'date' or not isinstance(price_data, dict):
+                continue
+            if wanted is not None and symbol not in wanted:
+                continue
+            try:
+                result[symbol] = make_ticker(
+                    self.name, symbol,
+                    price=price_data['closing_price'],
+                    change_rate=price_data['fluctate_rate_24H'],
+                    volume_24h=price_data['units_traded_24H'],
+                    trade_value_24h=price_data['acc_trade_value_24H'],
+                    high_24h=price_data['max_price'],
+                    low_24h=price_data['min_price'],
+                    timestamp=timestamp,
+                )
+            except (KeyError, ValueError) as e:
+                print(f"⚠️  빗썸 {symbol} 파싱 오류: {e}")
+        return result
+
+    def fetch_orderbooks(self, symbols: List[str]) -> Dict[str, Book]:
+        # ALL_KRW 1회 요청으로 전체 마켓 호가
+        data = self._public('/public/orderbook/ALL_KRW', {'count': self.ORDERBOOK_DEPTH})
+        wanted = set(symbols)
+        result = {}
+        for symbol, book in data.items():
+            if symbol not in wanted or not isinstance(book, dict) or 'bids' not in book:
+                continue
+            result[symbol] = {
+                'bids': make_side((float(l['price']), float(l['quantity'])) for l in book['bids']),
+                'asks': make_side((float(l['price']), float(l['quantity'])) for l in book['asks']),
+            }
+        return result
+
+    def fetch_candles(self, symbol: str, interval: str, start: int, end: int) -> 'np.ndarray':
+        # 페이지 조회 미지원 — 최근 구간 전체를 반환, [시각(ms), 시가, 종가, 고가, 저가, 거래량]
+        data = self._public(f'/public/candlestick/{symbol}_KRW/{self.CANDLE_INTERVALS[interval]}')
+        rows = [
+            (int(item[0]) // 1000, float(item[1]), float(item[3]), float(item[4]), float(item[2]), float(item[5]))
+            for item in data
+        ]
+        return make_candles(rows)
+
+
+# ----------------------------------------------------------------------
+# 바이낸스
+# ----------------------------------------------------------------------
+class BinanceAdapter(ExchangeAdapter):
+    name = 'binance'
+    label = '바이낸스'
+    base_url = 'https://api.binance.com'
+    quote = 'USDT'
+    candle_page_size = 1000
+
+    # 이 개수 이상이면 심볼별 요청 대신 전체 ticker 1회 요청
+    BULK_THRESHOLD = 10
+    ORDERBOOK_DEPTH = 100
+    ORDERBOOK_WORKERS = 32
+    KLINE_INTERVALS = {'minute': '1m', 'hour': '1h', 'day': '1d'}
+
+    def _ticker(self, symbol: str, data: Dict) -> Ticker:
+        return make_ticker(
+            self.name, symbol,
+            price=data['lastPrice'],
+            change_rate=data['priceChangePercent'],
+            volume_24h=data['volume'],
+            trade_value_24h=data['quoteVolume'],
+            high_24h=data['highPrice'],
+            low_24h=data['lowPrice'],
+            timestamp=data['closeTime'] / 1000,
+        )
+
+    def _symbol_ticker(self, symbol: str) -> Optional[Ticker]:
+        try:
+            data = self._get('/api/v3/ticker/24hr', {'symbol': f'{symbol}USDT'})
+        except TimeoutError:
+            raise
+        except Exception as e:
+            # 바이낸스에 상장되지 않은 코인은 400 — 그 코인만 제외
+            if getattr(getattr(e, 'response', None), 'status_code', None) != 400:
+                print(f"⚠️  바이낸스 {symbol} 시세 조회 실패: {e}")
+            return None
+        return self._ticker(symbol, data)
+
+    def fetch_tickers(self, symbols: Optional[List[str]]) -> Dict[str, Ticker]:
+        if symbols is not None and len(symbols) < self.BULK_THRESHOLD:
+            tickers = {symbol: self._symbol_ticker(symbol) for symbol in symbols}
+            return {symbol: ticker for symbol, ticker in tickers.items() if ticker is not None}
+
+        wanted = {f'{symbol}USDT': symbol for symbol in symbols} if symbols is not None else None
+        result = {}
+        for data in self._get('/api/v3/ticker/24hr'):
+            if wanted is not None:
+                symbol = wanted.get(data['symbol'])
+            elif data['symbol'].endswith('USDT'):
+                symbol = data['symbol'][:-4]
+            else:
+                symbol = None
+            if symbol is not None:
+                result[symbol] = self._ticker(symbol, data)
+        return result
+
+    def _orderbook(self, symbol: str) -> Optional[Book]:
+        try:
+            data = self._get('/api/v3/depth', {'symbol': f'{symbol}USDT', 'limit': self.ORDERBOOK_DEPTH})
+        except TimeoutError:
+            raise
+        except Exception as e:
+            # 바이낸스에 상장되지 않은 코인은 400
+            if getattr(getattr(e, 'response', None), 'status_code', None) != 400:
+                print(f"⚠️  바이낸스 {symbol} 호가 조회 실패: {e}")
+            return None
+        return {
+            'bids': make_side((float(p), float(q)) for p, q in data['bids']),
+            'asks': make_side((float(p), float(q)) for p, q in data['asks']),
+        }
+
+    def fetch_orderbooks(self, symbols: List[str]) -> Dict[str, Book]:
+        # 다중 심볼 depth API 가 없어 심볼별 요청을 병렬 실행 (분당 weight 제한 안에서 버스트)
+        deadline = current_deadline()
+
+        def orderbook(symbol: str) -> Optional[Book]:
+            with call_deadline(deadline):
+                return self._orderbook(symbol)
+
+        with ThreadPoolExecutor(max_workers=self.ORDERBOOK_WORKERS) as pool:
+            books = pool.map(orderbook, symbols)
+            return {symbol: book for symbol, book in zip(symbols, books) if book is not None}
+
+    def fetch_candles(self, symbol: str, interval: str, start: int, end: int) -> 'np.ndarray':
+        data = self._get('/api/v3/klines', {
+            'symbol': f'{symbol}USDT',
+            'interval': self.KLINE_INTERVALS[interval],
+            'startTime': start * 1000,
+            'endTime': end * 1000 - 1,
+            'limit': self.candle_page_size,
+        })
+        rows = [
+            (int(item[0]) // 1000, float(item[1]), float(item[2]), float(item[3]), float(item[4]), float(item[5]))
+            for item in data
+        ]
+        return make_candles(rows)
+
+
+# ----------------------------------------------------------------------
+# 추가 거래소 (시세만 지원)
+# ----------------------------------------------------------------------
+class CoinoneAdapter(ExchangeAdapter):
+    name = 'coinone'
+    label = '코인원'
+    base_url = 'https://api.coinone.co.kr'
+
+    def fetch_tickers(self, symbols: Optional[List[str]]) -> Dict[str, Ticker]:
+        data = self._get('/public/v2/ticker_new/KRW')
+        if data.get('result') != 'success':
+            raise Exception(f"Coinone API Error: {data.get('error_code')}")
+        wanted = set(symbols) if symbols is not None else None
+
+        result = {}
+        for item in data['tickers']:
+            symbol = item['target_currency'].upper()
+            if wanted is not None and symbol not in wanted:
+                continue
+            first = float(item['first'])
+            last = float(item['last'])
+            result[symbol] = make_ticker(
+                self.name, symbol,
+                price=last,
+                change_rate=(last - first) / first * 100 if first else 0.0,
+                volume_24h=item['target_volume'],
+                trade_value_24h=item['quote_volume'],
+                high_24h=item['high'],
+                low_24h=item['low'],
+                timestamp=item['timestamp'] / 1000,
+            )
+        return result
+
+
+class KorbitAdapter(ExchangeAdapter):
+    name = 'korbit'
+    label = '코빗'
+    base_url = 'https://api.korbit.co.kr'
+
+    def fetch_tickers(self, symbols: Optional[List[str]]) -> Dict[str, Ticker]:
+        data = self._get('/v1/ticker/detailed/all')
+        wanted = set(symbols) if symbols is not None else None
+
+        result = {}
+        for pair, item in data.items():
+            base, _, quote = pair.partition('_')
+            symbol = base.upper()
+            if quote != 'krw' or (wanted is not None and symbol not in wanted):
+                continue
+            result[symbol] = make_ticker(
+                self.name, symbol,
+                price=item['last'],
+                change_rate=item['changePercent'],
+                volume_24h=item['volume'],
+                trade_value_24h=float(item['volume']) * float(item['last']),
+                high_24h=item['high'],
+                low_24h=item['low'],
+                timestamp=item['timestamp'] / 1000,
+            )
+        return result
+
+
+class OkxAdapter(ExchangeAdapter):
+    name = 'okx'
+    label = 'OKX'
+    base_url = 'https://www.okx.com'
+    quote = 'USDT'
+
+    def fetch_tickers(self, symbols: Optional[List[str]]) -> Dict[str, Ticker]:
+        data = self._get('/api/v5/market/tickers', {'instType': 'SPOT'})
+        if data.get('code') != '0':
+            raise Exception(f"OKX API Error: {data.get('msg')}")
+        wanted = set(symbols) if symbols is not None else None
+
+        result = {}
+        for item in data['data']:
+            base, _, quote = item['instId'].partition('-')
+            if quote != 'USDT' or (wanted is not None and base not in wanted):
+                continue
+            last = float(item['last'])
+            open_24h = float(item['open24h'])
+            result[base] = make_ticker(
+                self.name, base,
+                price=last,
+                change_rate=(last - open_24h) / open_24h * 100 if open_24h else 0.0,
+                volume_24h=item['vol24h'],
+                trade_value_24h=item['volCcy24h'],
+                high_24h=item['high24h'],
+                low_24h=item['low24h'],
+                timestamp=int(item['ts']) / 1000,
+            )
+        return result
+
+
+ADAPTERS = {
+    adapter.name: adapter
+    for adapter in (UpbitAdapter, BithumbAdapter, BinanceAdapter, CoinoneAdapter, KorbitAdapter, OkxAdapter)
+}
+
+DEFAULT_EXCHANGES = ['upbit', 'bithumb', 'binance']
+
+
+def build_adapters(names: Iterable[str], session,
+                   base_urls: Optional[Dict[str, str]] = None) -> Dict[str, ExchangeAdapter]:
+    """이름 목록으로 어댑터 생성 (알 수 없는 거래소는 ValueError)"""
+    base_urls = base_urls or {}
+    adapters = {}
+    for name in names:
+        if name not in ADAPTERS:
+            raise ValueError(f"지원하지 않는 거래소: {name} (지원: {', '.join(ADAPTERS)})")
+        adapters[name] = ADAPTERS[name](session, base_urls.get(name))
+    return adapters
+
+
+class FanOutScheduler:
+    """모든 어댑터를 동시에 실행하고 거래소별 타임아웃을 적용"""
+
+    def __init__(self, adapters: Dict[str, ExchangeAdapter], workers: Optional[int] = None):
+        self.adapters = adapters
+        self.pool = ThreadPoolExecutor(max_workers=workers or max(4, len(adapters) * 2))
+        # 거래소별 아직 끝나지 않은 호출 — 끝날 때까지 같은 거래소에 새 호출을 보내지 않음
+        self.inflight: Dict[str, Future] = {}
+
+    def run(self, method: str, *args, only: Optional[Iterable[str]] = None,
+            args_for: Optional[Callable[[str], Tuple]] = None, **kwargs) -> Dict[str, Dict]:
+        """어댑터 메서드를 동시에 호출 — {거래소: 결과}, 실패/타임아웃은 빈 dict
+
+        args_for 를 주면 거래소마다 args_for(거래소) 를 위치 인자로 사용합니다.
+        """
+        names = [name for name in (only or self.adapters) if name in self.adapters]
+        names = [name for name in names if self.adapters[name].supports(method)]
+
+        results = {}
+        started = time.monotonic()
+        futures = {}
+        for name in names:
+            previous = self.inflight.get(name)
+            if previous is not None and not previous.done():
+                print(f"⏱️  {self.adapters[name].label} 이전 조회가 아직 끝나지 않음 — 이번 조회에서 제외")
+                results[name] = {}
+                continue
+            deadline = started + self.adapters[name].timeout
+            futures[name] = self.inflight[name] = self.pool.submit(
+                self._call, name, method, args_for(name) if args_for else args, kwargs, deadline
+            )
+
+        for name, future in futures.items():
+            adapter = self.adapters[name]
+            remaining = max(0.0, adapter.timeout - (time.monotonic() - started))
+            try:
+                results[name] = future.result(timeout=remaining)
+            except (FutureTimeoutError, TimeoutError):
+                # 아직 시작 전이면 취소, 실행 중이면 다음 요청 전에 마감 시각에 걸려 끝남
+                future.cancel()
+                print(f"⏱️  {adapter.label} 응답 지연 ({adapter.timeout:g}초 초과) — 이번 조회에서 제외")
+                results[name] = {}
+            except Exception as e:
+                print(f"❌ {adapter.label} API 오류: {e}")
+                results[name] = {}
+        return results
+
+    def _call(self, name: str, method: str, args: Tuple, kwargs: Dict, deadline: Optional[float] = None):
+        with call_deadline(deadline), phase(f'{method}:{name}'):
+            return getattr(self.adapters[name], method)(*args, **kwargs)
+
+    def close(self):
+        self.pool.shutdown(wait=False)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Tick History Store
+틱/김치 프리미엄 히스토리 저장소
+
+조회(틱)마다 거래소별 가격, 환율, 김치 프리미엄을 추가 전용(append-only) 청크 파일에
+기록합니다. 레코드는 고정 길이 바이너리 포맷이라 numpy.memmap 으로 그대로 읽을 수 있고,
+시리즈별 최근 틱의 평균 / 표준편차로 z-score 를 계산해 통계적으로 이례적인 프리미엄 변동을 탐지합니다.
+"""
+
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# 틱 레코드 포맷 (리틀 엔디언 고정 길이, 레코드당 72바이트)
+TICK_DTYPE = np.dtype([
+    ('ts', '<f8'),          # 수집 시각 (unix seconds)
+    ('exchange', 'S8'),     # upbit / bithumb / binance
+    ('symbol', 'S16'),      # BTC, ETH ...
+    ('price', '<f8'),       # 거래소 통화 기준 가격 (KRW 또는 USDT)
+    ('usd_krw', '<f8'),     # 수집 시점 환율
+    ('premium', '<f8'),     # 김치 프리미엄(%) — 해외 거래소 행은 NaN
+    ('volume_24h', '<f8'),  # 24시간 거래량
+])
+
+# 청크당 최대 레코드 수 (약 4.7MB)
+CHUNK_ROWS = 1 << 16
+
+DEFAULT_HISTORY_DIR = os.path.join(os.path.expanduser('~'), '.korean-crypto-tracker', 'history')
+
+SeriesKey = Tuple[str, str]  # (exchange, symbol)
+
+
+class TickStore:
+    """추가 전용 청크 틱 저장소"""
+
+    def __init__(self, root: str = DEFAULT_HISTORY_DIR, chunk_rows: int = CHUNK_ROWS):
+        self.root = root
+        self.chunk_rows = chunk_rows
+        os.makedirs(self.root, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # 청크 관리
+    # ------------------------------------------------------------------
+    def _chunk_path(self, index: int) -> str:
+        return os.path.join(self.root, f'ticks-{index:06d}.bin')
+
+    def chunk_paths(self) -> List[str]:
+        """청크 파일 목록 (오래된 순)"""
+        names = sorted(
+            name for name in os.listdir(self.root)
+            if name.startswith('ticks-') and name.endswith('.bin')
+        )
+        return [os.path.join(self.root, name) for name in names]
+
+    def _rows_in(self, path: str) -> int:
+        return os.path.getsize(path) // TICK_DTYPE.itemsize
+
+    def _open_chunk(self, path: str) -> np.ndarray:
+        rows = self._rows_in(path)
+        if rows == 0:
+            return np.empty(0, dtype=TICK_DTYPE)
+        # 쓰기 도중 중단되어 남은 꼬리 바이트는 shape 지정으로 무시
+        return np.memmap(path, dtype=TICK_DTYPE, mode='r', shape=(rows,))
+
+    def iter_chunks(self, newest_first: bool = False) -> Iterator[np.ndarray]:
+        """청크별 memmap 순회"""
+        paths = self.chunk_paths()
+        if newest_first:
+            paths = paths[::-1]
+        for path in paths:
+            yield self._open_chunk(path)
+
+    def __len__(self) -> int:
+        return sum(self._rows_in(path) for path in self.chunk_paths())
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def append(self, records: np.ndarray) -> int:
+        """TICK_DTYPE 레코드 배열을 청크 끝에 추가"""
+        records = np.asarray(records, dtype=TICK_DTYPE)
+        if records.size == 0:
+            return 0
+
+        paths = self.chunk_paths()
+        index = int(os.path.basename(paths[-1])[6:12]) if paths else 0
+        path = self._chunk_path(index)
+
+        if os.path.exists(path):
+            size = os.path.getsize(path)
+            remainder = size % TICK_DTYPE.itemsize
+            if remainder:
+                # 비정상 종료로 잘린 마지막 레코드 제거
+                os.truncate(path, size - remainder)
+
+        offset = 0
+        while offset < records.size:
+            rows = self._rows_in(path) if os.path.exists(path) else 0
+            if rows >= self.chunk_rows:
+                index += 1
+                path = self._chunk_path(index)
+                rows = 0
+            take = min(self.chunk_rows - rows, records.size - offset)
+            with open(path, 'ab') as f:
+                f.write(records[offset:offset + take].tobytes())
+            offset += take
+
+        return int(records.size)
+
+    def append_snapshot(self, data: Dict, premiums: Dict[SeriesKey, float],
+                        ts: Optional[float] = None) -> int:
+        """get_all_prices() 결과 한 번을 틱으로 기록"""
+        ts = time.time() if ts is None else ts
+        usd_krw = float(data.get('usd_krw') or 0)
+
+        rows = []
+        for exchange, tickers in data.items():
+            if not isinstance(tickers, dict):
+                continue
+            for symbol, info in tickers.items():
+                rows.append((
+                    ts,
+                    exchange.encode(),
+                    symbol.encode(),
+                    float(info.get('price') or 0),
+                    usd_krw,
+                    premiums.get((exchange, symbol), np.nan),
+                    float(info.get('volume_24h') or 0),
+                ))
+
+        return self.append(np.array(rows, dtype=TICK_DTYPE))
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def series_tail(self, keys: Iterable[SeriesKey], count: int,
+                    field: str = 'premium') -> Dict[SeriesKey, np.ndarray]:
+        """시리즈별 최근 count 개 값 (오래된 순)
+
+        최신 청크부터 거꾸로 읽고, 모든 시리즈가 채워지면 바로 멈춥니다.
+        """
+        wanted = {(ex.encode(), sym.encode()): (ex, sym) for ex, sym in keys}
+        collected: Dict[SeriesKey, List[np.ndarray]] = {key: [] for key in wanted.values()}
+        remaining = {key: count for key in wanted.values()}
+
+        for chunk in self.iter_chunks(newest_first=True):
+            if not remaining:
+                break
+            if chunk.size == 0:
+                continue
+            exchanges = chunk['exchange']
+            symbols = chunk['symbol']
+            values = chunk[field]
+            for (ex_b, sym_b), key in wanted.items():
+                need = remaining.get(key)
+                if not need:
+                    continue
+                idx = np.flatnonzero((exchanges == ex_b) & (symbols == sym_b))
+                if idx.size == 0:
+                    continue
+                picked = np.array(values[idx[-need:]])
+                collected[key].append(picked)
+                need -= picked.size
+                if need <= 0:
+                    del remaining[key]
+                else:
+                    remaining[key] = need
+
+        return {
+            key: np.concatenate(parts[::-1]) if parts else np.empty(0)
+            for key, parts in collected.items()
+        }
+
+
+# ----------------------------------------------------------------------
+# 프리미엄 z-score
+# ----------------------------------------------------------------------
+def premium_zscores(store: TickStore, premiums: Dict[SeriesKey, float],
+                    window: int = 60, min_samples: int = 10) -> List[Dict]:
+    """현재 프리미엄을 과거 window 개 틱 분포와 비교한 z-score 목록"""
+    history = store.series_tail(premiums.keys(), window)
+    results = []
+    for key, current in premiums.items():
+        past = history.get(key, np.empty(0))
+        past = past[~np.isnan(past)]
+        if past.size < min_samples:
+            continue
+        mean = float(past.mean())
+        std = float(past.std())
+        zscore = (current - mean) / std if std > 0 else 0.0
+        exchange, symbol = key
+        results.append({
+            'exchange': exchange,
+            'symbol': symbol,
+            'premium': current,
+            'mean': mean,
+            'std': std,
+            'zscore': zscore,
+            'samples': int(past.size),
+        })
+    return results
@@ -20,6 +20,7 @@ packages=(
     "tabulate>=0.8.0"
     "colorama>=0.4.0"
     "python-dateutil>=2.8.0"
+    "numpy>=1.22.0"
 )
 
 for package in "${packages[@]}"; do
@@ -27,6 +28,10 @@ for package in "${packages[@]}"; do
     python3 -m pip install "$package"
 done
 
+# 선택 패키지 (--format ndjson 직렬화 가속, 없으면 표준 json 사용)
+echo "📋 선택 패키지 설치 중..."
+python3 -m pip install "orjson>=3.6.0" || echo "⚠️  orjson 설치 실패 — 표준 json 으로 동작합니다"
+
 echo "✅ 모든 패키지 설치 완료!"
 
 # 설치 확인
@@ -38,6 +43,7 @@ import colorama
 import json
 import datetime
 import argparse
+import numpy
 from dateutil import parser
 print('✅ 모든 패키지 정상 임포트 완료!')
 "
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+HTTP Client
+커넥션 풀 + 재시도 + 요청 구간별 지연 측정 HTTP 클라이언트
+
+거래소/환율 API 호출에 공통으로 쓰는 requests.Session 을 만듭니다.
+
+- 호스트별 keep-alive 커넥션 풀 (pool_block 으로 호스트당 동시 연결 수 제한)
+- 429/5xx/연결 오류 지수 백오프 재시도 (지터 포함, Retry-After 존중)
+- 요청마다 DNS / 연결 / TLS / 첫 바이트(TTFB) / 전체 시간과 수신 바이트 수를
+  엔드포인트별로 집계 (--metrics)
+
+재사용된 keep-alive 커넥션에서는 DNS/연결/TLS 시간이 0 으로 기록됩니다.
+"""
+
+import random
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+USER_AGENT = 'Korean-Crypto-Tracker/1.0'
+
+# 호스트당 최대 동시 연결 수 (바이낸스 호가 병렬 요청 워커 수와 맞춤)
+POOL_MAXSIZE = 32
+# 재시도 대상 HTTP 상태
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+TIMING_FIELDS = ('dns', 'connect', 'tls', 'ttfb', 'total')
+
+# 현재 스레드에서 진행 중인 요청의 구간별 시간
+_current = threading.local()
+
+
+def _timing() -> Optional[Dict[str, float]]:
+    return getattr(_current, 'timing', None)
+
+
+def _add(field: str, seconds: float):
+    timing = _timing()
+    if timing is not None:
+        timing[field] += seconds
+
+
+# ----------------------------------------------------------------------
+# 구간별 시간 측정 커넥션
+# ----------------------------------------------------------------------
+class _TimedConnectionMixin:
+    """DNS 조회 / TCP 연결 / TLS 핸드셰이크 / TTFB 측정"""
+
+    def _new_conn(self):
+        host = self._dns_host
+        started = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            # 오류 메시지/예외 변환은 urllib3 에 맡김
+            infos = None
+        resolved = time.perf_counter()
+        _add('dns', resolved - started)
+
+        if infos:
+            # 이미 조회한 주소로 연결 (SNI/인증서 검증은 self.host 기준이라 영향 없음)
+            self._dns_host = infos[0][4][0]
+        try:
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+            _add('connect', time.perf_counter() - resolved)
+
+    def connect(self):
+        timing = _timing()
+        before = dict(timing) if timing is not None else None
+        started = time.perf_counter()
+        super().connect()
+        if timing is not None and isinstance(self, HTTPSConnection):
+            # connect() 전체에서 DNS/TCP 연결을 뺀 나머지가 TLS 핸드셰이크
+            spent = time.perf_counter() - started
+            socket_time = (timing['dns'] - before['dns']) + (timing['connect'] - before['connect'])
+            timing['tls'] += max(0.0, spent - socket_time)
+
+    def request(self, *args, **kwargs):
+        self._request_started = time.perf_counter()
+        return super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        response = super().getresponse(*args, **kwargs)
+        started = getattr(self, '_request_started', None)
+        if started is not None:
+            _add('ttfb', time.perf_counter() - started)
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+# ----------------------------------------------------------------------
+# 재시도
+# ----------------------------------------------------------------------
+class JitterRetry(Retry):
+    """지수 백오프에 ±jitter 비율의 무작위 지터를 더한 Retry
+
+    여러 스레드가 같은 거래소에서 동시에 429 를 받아도 재시도 시점이 흩어집니다.
+    """
+
+    jitter = 0.5
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+def default_retry(total: int = 3, backoff_factor: float = 0.3) -> Retry:
+    return JitterRetry(
+        total=total,
+        connect=total,
+        read=total,
+        status=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """구간별 시간 측정 커넥션 풀을 쓰는 HTTPAdapter"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+
+# ----------------------------------------------------------------------
+# 지표 집계
+# ----------------------------------------------------------------------
+class HttpMetrics:
+    """엔드포인트(호스트 + 경로)별 요청 지표 (스레드 안전)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples: Dict[str, List[Dict]] = {}
+
+    def record(self, endpoint: str, sample: Dict):
+        with self.lock:
+            self.samples.setdefault(endpoint, []).append(sample)
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+
+    def summary(self) -> List[Dict]:
+        """엔드포인트별 요약 (ms 단위, 전체 시간 합계가 큰 순)"""
+        with self.lock:
+            snapshot = {endpoint: list(samples) for endpoint, samples in self.samples.items()}
+
+        rows = []
+        for endpoint, samples in snapshot.items():
+            totals = sorted(s['total'] for s in samples)
+            row = {
+                'endpoint': endpoint,
+                'requests': len(samples),
+                'errors': sum(1 for s in samples if s['error']),
+                'retries': sum(s['retries'] for s in samples),
+                'new_connections': sum(1 for s in samples if s['connect'] > 0),
+                'bytes': sum(s['bytes'] for s in samples),
+                'p95_ms': totals[min(len(totals) - 1, int(len(totals) * 0.95))] * 1000,
+                'sum_ms': sum(totals) * 1000,
+            }
+            for field in TIMING_FIELDS:
+                row[f'{field}_ms'] = sum(s[field] for s in samples) / len(samples) * 1000
+            rows.append(row)
+        rows.sort(key=lambda row: row['sum_ms'], reverse=True)
+        return rows
+
+
+class InstrumentedSession(requests.Session):
+    """요청마다 구간별 시간/바이트 수를 HttpMetrics 에 기록하는 Session"""
+
+    def __init__(self, metrics: Optional[HttpMetrics] = None):
+        super().__init__()
+        self.metrics = metrics
+
+    def send(self, request, **kwargs):
+        if self.metrics is None:
+            return super().send(request, **kwargs)
+
+        timing = dict.fromkeys(TIMING_FIELDS, 0.0)
+        outer, _current.timing = _timing(), timing
+        started = time.perf_counter()
+        response = None
+        error = None
+        try:
+            response = super().send(request, **kwargs)
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            _current.timing = outer
+            timing['total'] = time.perf_counter() - started
+            parts = urlsplit(request.url)
+            sample = dict(timing)
+            sample['bytes'] = _wire_bytes(response)
+            sample['retries'] = _retries(response)
+            sample['error'] = error is not None or (response is not None and response.status_code >= 400)
+            self.metrics.record(f'{parts.netloc}{parts.path}', sample)
+
+
+def _wire_bytes(response) -> int:
+    """수신 본문 바이트 수 (압축 해제 전 기준, 알 수 없으면 해제 후 길이)"""
+    if response is None:
+        return 0
+    raw = getattr(response, 'raw', None)
+    try:
+        read = raw.tell() if raw is not None else 0
+    except Exception:
+        read = 0
+    return int(read) if read else len(response.content or b'')
+
+
+def _retries(response) -> int:
+    raw = getattr(response, 'raw', None) if response is not None else None
+    retries = getattr(raw, 'retries', None)
+    return len(retries.history) if retries is not None else 0
+
+
+def build_session(metrics: Optional[HttpMetrics] = None,
+                  pool_maxsize: int = POOL_MAXSIZE,
+                  retry: Optional[Retry] = None) -> requests.Session:
+    """거래소 API 공용 Session
+
+    pool_block=True 라 호스트당 동시 연결이 pool_maxsize 를 넘으면 빈 커넥션을 기다립니다.
+    """
+    session = InstrumentedSession(metrics)
+    session.headers.update({'User-Agent': USER_AGENT})
+    adapter = TimedHTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+        max_retries=retry or default_retry(),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Phase Profiler
+단계별 실행 시간/메모리 프로파일러 (--profile)
+
+시작(import), 환율 조회, 거래소별 조회, JSON 디코딩, 분석, 테이블 모듈 import/렌더링 등 단계마다
+호출 횟수, 누적 실행 시간, tracemalloc 기준 메모리 증가량과 최대 사용량을 집계합니다.
+프로파일러가 꺼져 있으면 phase() 는 아무 일도 하지 않는 컨텍스트 매니저입니다.
+
+프로파일러 생성 전에 끝나는 시작 import 는 시간만 기록하고 메모리 수치는 null 입니다.
+
+단계는 중첩될 수 있고(예: fetch_tickers:upbit 안의 json_decode:upbit), 시간은 하위 단계를
+포함한 값입니다. 거래소 조회 단계는 작업 스레드에서 동시에 실행되므로 메모리 수치는
+프로세스 전체 기준입니다.
+"""
+
+import contextlib
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+
+class _Frame:
+    __slots__ = ('start_memory', 'peak')
+
+    def __init__(self, start_memory: int):
+        self.start_memory = start_memory
+        self.peak = start_memory
+
+
+class PhaseProfiler:
+    """단계별 시간/메모리 집계기 (스레드 안전)"""
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.lock = threading.Lock()
+        self.phases: Dict[str, Dict] = {}
+        self.order: List[str] = []
+        # 최대 메모리는 메인 스레드 단계만 추적 (tracemalloc 최대값이 프로세스 전역이라)
+        self.stack: List[_Frame] = []
+        self.main_thread = threading.main_thread()
+        self.started = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def record(self, name: str, seconds: float, net_bytes: Optional[int] = None,
+               peak_bytes: Optional[int] = None):
+        """외부에서 잰 단계 시간 기록 (예: 프로파일러 생성 전의 import 시간 — 메모리는 None)"""
+        with self.lock:
+            entry = self.phases.get(name)
+            if entry is None:
+                entry = self.phases[name] = {'calls': 0, 'seconds': 0.0, 'net_bytes': None, 'peak_bytes': None}
+                self.order.append(name)
+            entry['calls'] += 1
+            entry['seconds'] += seconds
+            if net_bytes is not None:
+                entry['net_bytes'] = (entry['net_bytes'] or 0) + net_bytes
+            if peak_bytes is not None:
+                entry['peak_bytes'] = max(entry['peak_bytes'] or 0, peak_bytes)
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        on_main = threading.current_thread() is self.main_thread
+        frame = None
+        start_memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+        if tracing and on_main:
+            current, peak = tracemalloc.get_traced_memory()
+            if self.stack:
+                self.stack[-1].peak = max(self.stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            frame = _Frame(current)
+            self.stack.append(frame)
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            net_bytes = None
+            peak_bytes = None
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                net_bytes = current - start_memory
+                if frame is not None:
+                    frame.peak = max(frame.peak, peak)
+                    self.stack.pop()
+                    if self.stack:
+                        self.stack[-1].peak = max(self.stack[-1].peak, frame.peak)
+                    peak_bytes = frame.peak - frame.start_memory
+            self.record(name, seconds, net_bytes, peak_bytes)
+
+    def report(self) -> Dict:
+        """단계별 요약 (처음 실행된 순서)"""
+        with self.lock:
+            phases = [
+                {
+                    'phase': name,
+                    'calls': self.phases[name]['calls'],
+                    'wall_ms': round(self.phases[name]['seconds'] * 1000, 3),
+                    'net_kb': (round(self.phases[name]['net_bytes'] / 1024, 1)
+                               if self.phases[name]['net_bytes'] is not None else None),
+                    'peak_kb': (round(self.phases[name]['peak_bytes'] / 1024, 1)
+                                if self.phases[name]['peak_bytes'] is not None else None),
+                }
+                for name in self.order
+            ]
+        report = {
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 3),
+            'phases': phases,
+        }
+        if self.trace_memory and tracemalloc.is_tracing():
+            current, _ = tracemalloc.get_traced_memory()
+            report['traced_kb'] = round(current / 1024, 1)
+        return report
+
+
+_active: Optional[PhaseProfiler] = None
+
+
+def enable(trace_memory: bool = True) -> PhaseProfiler:
+    """전역 프로파일러 시작"""
+    global _active
+    _active = PhaseProfiler(trace_memory)
+    return _active
+
+
+def active() -> Optional[PhaseProfiler]:
+    return _active
+
+
+def phase(name: str):
+    """전역 프로파일러 단계 (꺼져 있으면 no-op)"""
+    if _active is None:
+        return contextlib.nullcontext()
+    return _active.phase(name)
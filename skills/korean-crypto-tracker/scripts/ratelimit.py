@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter
+거래소별 호출 제한 (토큰 버킷)
+
+여러 스레드가 같은 거래소에 동시에 요청해도 초당 호출 수가 제한을 넘지 않도록 합니다.
+"""
+
+import threading
+import time
+from typing import Optional
+
+# 거래소별 초당 허용 요청 수 (공식 제한보다 약간 낮게 설정)
+#   업비트: 시세 조회 초당 10회 / 빗썸: 초당 20회 / 바이낸스: 분당 weight 6000
+EXCHANGE_RATE_LIMITS = {
+    'upbit': 8.0,
+    'bithumb': 15.0,
+    'binance': 10.0,
+    'coinone': 5.0,
+    'korbit': 5.0,
+    'okx': 10.0,
+}
+
+# 거래소별 순간 허용량 — 바이낸스는 분 단위 weight 제한이라 짧은 버스트를 허용
+EXCHANGE_BURSTS = {
+    'upbit': 8,
+    'bithumb': 15,
+    'binance': 200,
+    'coinone': 5,
+    'korbit': 5,
+    'okx': 10,
+}
+
+
+class RateLimiter:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def exchange_limiter(exchange: str) -> RateLimiter:
+    """거래소 기본 제한이 적용된 RateLimiter"""
+    return RateLimiter(EXCHANGE_RATE_LIMITS[exchange], EXCHANGE_BURSTS.get(exchange))
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Replay Server
+녹화된 API 응답 재생 서버 (오프라인 테스트/벤치마크용)
+
+fixtures/ 의 업비트/빗썸/바이낸스/환율 응답을 실제 API 와 같은 경로로 제공합니다.
+거래소별 경로 앞에 /upbit, /bithumb, /binance, /fx 가 붙으므로 crypto.py 에
+--base-url http://127.0.0.1:8765 를 주면 모든 요청이 이 서버로 향합니다.
+
+- 지연 주입: 요청마다 latency ± jitter 초 대기
+- 오류 주입: error_rate 확률로 error_status 응답 (기본 503 — 재시도 경로 확인용)
+- 유니버스 확장: coins 를 지정하면 녹화된 코인을 본뜬 합성 코인(S0001 ...)을 추가해
+  8개부터 수백 개 코인까지 같은 형식으로 응답
+- 녹화: record 명령으로 실제 API 응답을 fixtures/ 에 새로 저장
+
+사용법:
+    python replay.py serve --port 8765 --latency 0.05 --jitter 0.02 --error-rate 0.05
+    python replay.py serve --coins 500
+    python replay.py record
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# fixture 파일 ↔ 실제 API (record 명령에서 사용)
+RECORDINGS = {
+    'fx_latest_usd.json': 'https://api.exchangerate-api.com/v4/latest/USD',
+    'upbit_market_all.json': 'https://api.upbit.com/v1/market/all',
+    'upbit_ticker.json': 'https://api.upbit.com/v1/ticker?markets={upbit_markets}',
+    'upbit_orderbook.json': 'https://api.upbit.com/v1/orderbook?markets={upbit_markets}',
+    'bithumb_ticker_all_krw.json': 'https://api.bithumb.com/public/ticker/ALL_KRW',
+    'bithumb_orderbook_all_krw.json': 'https://api.bithumb.com/public/orderbook/ALL_KRW?count=15',
+    'binance_ticker_24hr.json': 'https://api.binance.com/api/v3/ticker/24hr',
+}
+
+RECORD_SYMBOLS = ['BTC', 'ETH', 'XRP', 'ADA', 'DOT', 'LINK', 'SOL', 'DOGE']
+
+
+def load_fixture(name: str, fixtures_dir: str = FIXTURES_DIR):
+    with open(os.path.join(fixtures_dir, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ReplayData:
+    """fixture 기반 응답 생성기 (합성 코인 포함)"""
+
+    def __init__(self, fixtures_dir: str = FIXTURES_DIR, coins: Optional[int] = None):
+        self.fx = load_fixture('fx_latest_usd.json', fixtures_dir)
+        self.upbit_markets = load_fixture('upbit_market_all.json', fixtures_dir)
+        self.upbit_tickers = {t['market'].split('-')[1]: t for t in load_fixture('upbit_ticker.json', fixtures_dir)}
+        self.upbit_books = {b['market'].split('-')[1]: b for b in load_fixture('upbit_orderbook.json', fixtures_dir)}
+        bithumb = load_fixture('bithumb_ticker_all_krw.json', fixtures_dir)['data']
+        self.bithumb_tickers = {k: v for k, v in bithumb.items() if isinstance(v, dict)}
+        books = load_fixture('bithumb_orderbook_all_krw.json', fixtures_dir)['data']
+        self.bithumb_books = {k: v for k, v in books.items() if isinstance(v, dict)}
+        self.binance_tickers = {t['symbol']: t for t in load_fixture('binance_ticker_24hr.json', fixtures_dir)}
+        self.binance_depth = load_fixture('binance_depth.json', fixtures_dir)
+
+        # 시세가 녹화된 KRW 마켓만 (market/all 에만 있는 마켓은 응답을 만들 수 없음)
+        self.upbit_markets = [m for m in self.upbit_markets
+                              if m['market'].startswith('KRW-') and m['market'][4:] in self.upbit_tickers]
+        self.symbols: List[str] = [m['market'][4:] for m in self.upbit_markets]
+        if coins is not None and coins > len(self.symbols):
+            self._synthesize(coins)
+
+    def _synthesize(self, coins: int):
+        """녹화된 코인을 돌려 쓰며 가격만 바꾼 합성 코인 추가"""
+        templates = [
+            symbol for symbol in self.symbols
+            if symbol in self.upbit_books and symbol in self.bithumb_tickers and symbol in self.bithumb_books
+            and f'{symbol}USDT' in self.binance_tickers and f'{symbol}USDT' in self.binance_depth
+        ]
+        rng = random.Random(coins)
+        for i in range(len(self.symbols), coins):
+            template = templates[i % len(templates)]
+            symbol = f'S{i:04d}'
+            scale = rng.uniform(0.5, 1.5)
+            self.symbols.append(symbol)
+            self.upbit_markets.append({'market': f'KRW-{symbol}', 'korean_name': symbol, 'english_name': symbol})
+            self.upbit_tickers[symbol] = _scale_fields(
+                dict(self.upbit_tickers[template], market=f'KRW-{symbol}'), scale, _UPBIT_PRICE_FIELDS)
+            book = copy.deepcopy(self.upbit_books[template])
+            book['market'] = f'KRW-{symbol}'
+            for unit in book['orderbook_units']:
+                _scale_fields(unit, scale, ('ask_price', 'bid_price'))
+            self.upbit_books[symbol] = book
+            self.bithumb_tickers[symbol] = _scale_fields(
+                dict(self.bithumb_tickers[template]), scale, _BITHUMB_PRICE_FIELDS)
+            book = copy.deepcopy(self.bithumb_books[template])
+            book['order_currency'] = symbol
+            for level in book['bids'] + book['asks']:
+                _scale_fields(level, scale, ('price',))
+            self.bithumb_books[symbol] = book
+            self.binance_tickers[f'{symbol}USDT'] = _scale_fields(
+                dict(self.binance_tickers[f'{template}USDT'], symbol=f'{symbol}USDT'), scale, _BINANCE_PRICE_FIELDS)
+            depth = copy.deepcopy(self.binance_depth[f'{template}USDT'])
+            for level in depth['bids'] + depth['asks']:
+                level[0] = _format_like(level[0], float(level[0]) * scale)
+            self.binance_depth[f'{symbol}USDT'] = depth
+
+    # ------------------------------------------------------------------
+    # 경로별 응답 — (상태 코드, JSON 본문)
+    # ------------------------------------------------------------------
+    def respond(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, object]:
+        now_ms = int(time.time() * 1000)
+        prefix, _, rest = path.lstrip('/').partition('/')
+        rest = '/' + rest
+        handler = getattr(self, f'_{prefix}', None)
+        if handler is None:
+            return 404, {'error': f'unknown prefix: {prefix}'}
+        return handler(rest, query, now_ms)
+
+    def _fx(self, path, query, now_ms):
+        if path == '/v4/latest/USD':
+            return 200, dict(self.fx, time_last_updated=now_ms // 1000)
+        return 404, {'result': 'error'}
+
+    def _upbit(self, path, query, now_ms):
+        if path == '/v1/market/all':
+            return 200, self.upbit_markets
+        if path in ('/v1/ticker', '/v1/orderbook'):
+            source = self.upbit_tickers if path == '/v1/ticker' else self.upbit_books
+            markets = query.get('markets', [''])[0].split(',')
+            symbols = [m.split('-', 1)[-1] for m in markets]
+            # 실제 API 처럼 존재하지 않는 마켓이 하나라도 있으면 요청 전체가 404
+            if not all(m.startswith('KRW-') and s in source for m, s in zip(markets, symbols)):
+                return 404, {'error': {'name': 404, 'message': 'Code not found'}}
+            return 200, [dict(source[s], timestamp=now_ms) for s in symbols]
+        return 404, {'error': {'name': 404, 'message': 'Not found'}}
+
+    def _bithumb(self, path, query, now_ms):
+        if path == '/public/ticker/ALL_KRW':
+            data = dict(self.bithumb_tickers, date=str(now_ms))
+            return 200, {'status': '0000', 'data': data}
+        if path == '/public/orderbook/ALL_KRW':
+            count = int(query.get('count', ['30'])[0])
+            data = {'timestamp': str(now_ms), 'payment_currency': 'KRW'}
+            for symbol, book in self.bithumb_books.items():
+                data[symbol] = dict(book, bids=book['bids'][:count], asks=book['asks'][:count])
+            return 200, {'status': '0000', 'data': data}
+        return 404, {'status': '5500', 'message': 'Invalid Parameter'}
+
+    def _binance(self, path, query, now_ms):
+        if path == '/api/v3/ticker/24hr':
+            if 'symbol' in query:
+                ticker = self.binance_tickers.get(query['symbol'][0])
+                if ticker is None:
+                    return 400, {'code': -1121, 'msg': 'Invalid symbol.'}
+                return 200, dict(ticker, closeTime=now_ms)
+            return 200, [dict(t, closeTime=now_ms) for t in self.binance_tickers.values()]
+        if path == '/api/v3/depth':
+            depth = self.binance_depth.get(query.get('symbol', [''])[0])
+            if depth is None:
+                return 400, {'code': -1121, 'msg': 'Invalid symbol.'}
+            limit = int(query.get('limit', ['100'])[0])
+            return 200, dict(depth, bids=depth['bids'][:limit], asks=depth['asks'][:limit])
+        return 404, {'code': -1, 'msg': 'Not found'}
+
+
+_UPBIT_PRICE_FIELDS = ('opening_price', 'high_price', 'low_price', 'trade_price', 'prev_closing_price',
+                       'change_price', 'signed_change_price', 'highest_52_week_price', 'lowest_52_week_price')
+_BITHUMB_PRICE_FIELDS = ('opening_price', 'closing_price', 'min_price', 'max_price', 'prev_closing_price', 'fluctate_24H')
+_BINANCE_PRICE_FIELDS = ('priceChange', 'weightedAvgPrice', 'prevClosePrice', 'lastPrice', 'bidPrice', 'askPrice',
+                         'openPrice', 'highPrice', 'lowPrice')
+
+
+def _format_like(original, value: float):
+    """원래 값의 형식(숫자 / 문자열)을 유지"""
+    return f'{value:.8f}' if isinstance(original, str) else value
+
+
+def _scale_fields(record: Dict, scale: float, fields) -> Dict:
+    for field in fields:
+        if field in record:
+            record[field] = _format_like(record[field], float(record[field]) * scale)
+    return record
+
+
+class ReplayServer:
+    """지연/오류 주입 재생 HTTP 서버 (백그라운드 스레드)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503,
+                 coins: Optional[int] = None, fixtures_dir: str = FIXTURES_DIR, seed: Optional[int] = None):
+        self.data = ReplayData(fixtures_dir, coins)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # 헤더/본문을 따로 보내므로 Nagle 지연(지연 ACK 대기)이 측정에 섞이지 않게
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.handle(self)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def base_urls(self, names) -> Dict[str, str]:
+        """거래소/환율별 base URL ({'upbit': 'http://.../upbit', ...})"""
+        return {name: f'{self.url}/{name}' for name in names}
+
+    def handle(self, request: BaseHTTPRequestHandler):
+        with self.rng_lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+            fail = self.rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        if delay:
+            time.sleep(delay)
+
+        if fail:
+            status, payload = self.error_status, {'error': 'injected'}
+        else:
+            parts = urlsplit(request.path)
+            status, payload = self.data.respond(parts.path, parse_qs(parts.query))
+
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json; charset=utf-8')
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def start(self) -> 'ReplayServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def record(fixtures_dir: str = FIXTURES_DIR):
+    """실제 API 응답을 fixtures/ 에 저장 (네트워크 필요)"""
+    from net import build_session
+
+    session = build_session()
+    os.makedirs(fixtures_dir, exist_ok=True)
+    upbit_markets = ','.join(f'KRW-{symbol}' for symbol in RECORD_SYMBOLS)
+
+    def save(name: str, payload):
+        with open(os.path.join(fixtures_dir, name), 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, indent=1)
+        print(f"💾 {name}")
+
+    for name, url in RECORDINGS.items():
+        response = session.get(url.format(upbit_markets=upbit_markets), timeout=10)
+        response.raise_for_status()
+        payload = response.json()
+        if name == 'upbit_market_all.json':
+            # 시세/호가를 녹화하는 마켓만 (나머지는 재생할 응답이 없음)
+            payload = [m for m in payload if m['market'] in upbit_markets.split(',')]
+        elif name == 'binance_ticker_24hr.json':
+            payload = [t for t in payload if t['symbol'][:-4] in RECORD_SYMBOLS and t['symbol'].endswith('USDT')]
+        save(name, payload)
+
+    depth = {}
+    for symbol in RECORD_SYMBOLS:
+        response = session.get('https://api.binance.com/api/v3/depth',
+                               params={'symbol': f'{symbol}USDT', 'limit': 20}, timeout=10)
+        response.raise_for_status()
+        depth[f'{symbol}USDT'] = response.json()
+    save('binance_depth.json', depth)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='녹화된 거래소 API 응답 재생 서버')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help='재생 서버 실행')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--latency', type=float, default=0.0, help='요청당 지연 (초)')
+    serve.add_argument('--jitter', type=float, default=0.0, help='지연 변동폭 (± 초)')
+    serve.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 확률 (0~1)')
+    serve.add_argument('--error-status', type=int, default=503, help='오류 응답 상태 코드')
+    serve.add_argument('--coins', type=int, help='합성 코인을 포함한 KRW 마켓 수')
+    serve.add_argument('--fixtures', default=FIXTURES_DIR, help='fixture 디렉터리')
+
+    rec = sub.add_parser('record', help='실제 API 응답을 fixture 로 저장')
+    rec.add_argument('--fixtures', default=FIXTURES_DIR, help='fixture 디렉터리')
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record(args.fixtures)
+        return
+
+    server = ReplayServer(args.host, args.port, args.latency, args.jitter,
+                          args.error_rate, args.error_status, args.coins, args.fixtures)
+    print(f"🎞️  재생 서버: {server.url} (코인 {len(server.data.symbols)}개)")
+    print(f"   python crypto.py --all --base-url {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
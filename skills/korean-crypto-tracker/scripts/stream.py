@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Event Stream
+분석 결과 스트리밍 출력 (NDJSON / JSON)
+
+시세 스냅샷, 김치 프리미엄, 시장 요약, 알림 등 분석 결과를 이벤트 하나당 JSON 한 줄로
+계산 즉시 출력합니다. 각 줄은 {"type": ..., "ts": ..., ...} 형식이며 바로 flush 되므로
+다른 프로그램(봇 등)이 파이프로 연속 소비할 수 있습니다.
+
+문서 모드(--format json)에서는 조회 1회의 이벤트를 모아 {이벤트 종류: 결과} 형식의
+들여쓰기 JSON 문서 하나로 출력합니다.
+
+orjson 이 설치되어 있으면 orjson 으로, 없으면 표준 json 으로 직렬화합니다.
+NaN/Infinity 는 두 경우 모두 null 로 출력합니다.
+"""
+
+import json
+import math
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+def _clean(value):
+    """표준 json 용 NaN/Infinity → None (orjson 과 같은 출력)"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _clean(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clean(item) for item in value]
+    return value
+
+
+def _default(value):
+    """numpy 스칼라/배열 → 파이썬 값 (orjson OPT_SERIALIZE_NUMPY 와 같은 출력)"""
+    tolist = getattr(value, 'tolist', None)
+    if tolist is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return _clean(tolist())
+
+
+def dumps(obj, pretty: bool = False) -> bytes:
+    """UTF-8 JSON 바이트 (pretty 가 아니면 공백 없는 한 줄)"""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        text = json.dumps(_clean(obj), ensure_ascii=False, indent=2, default=_default)
+    else:
+        text = json.dumps(_clean(obj), ensure_ascii=False, separators=(',', ':'), default=_default)
+    return text.encode('utf-8')
+
+
+class EventWriter:
+    """이벤트 출력기 — 기본은 이벤트마다 한 줄(ndjson), document 면 flush() 때 JSON 문서 하나
+
+    out 을 지정하지 않으면 출력 시점의 sys.stdout 에 씁니다.
+    """
+
+    def __init__(self, out: Optional[TextIO] = None, document: bool = False):
+        self.out = out
+        self.lock = threading.Lock()
+        self.document: Optional[Dict] = {} if document else None
+
+    def emit(self, event_type: str, payload: Dict, ts: Optional[float] = None):
+        if self.document is not None:
+            self.document[event_type] = payload
+            return
+        event = {'type': event_type, 'ts': time.time() if ts is None else ts}
+        event.update(payload)
+        self._write(dumps(event))
+
+    def emit_many(self, event_type: str, payloads: List[Dict], ts_key: Optional[str] = None):
+        """건별 이벤트 (알림 등) — ndjson 은 건마다 한 줄, 문서에는 목록으로"""
+        if self.document is not None:
+            self.document[event_type] = list(payloads)
+            return
+        for payload in payloads:
+            self.emit(event_type, payload, ts=payload.get(ts_key) if ts_key else None)
+
+    def flush(self):
+        """문서 모드에서 모은 이벤트를 JSON 문서 하나로 출력
+
+        시세만 있으면 기존 --format json 시세 형식(거래소별 시세 + usd_krw) 그대로 출력합니다.
+        """
+        if not self.document:
+            return
+        document, self.document = self.document, {}
+        if list(document) == ['prices']:
+            document = document['prices']
+        self._write(dumps(document, pretty=True))
+
+    def _write(self, line: bytes):
+        out = self.out or sys.stdout
+        with self.lock:
+            buffer = getattr(out, 'buffer', None)
+            if buffer is not None:
+                out.flush()
+                buffer.write(line + b'\n')
+                buffer.flush()
+            else:
+                out.write(line.decode('utf-8') + '\n')
+                out.flush()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+알림 규칙 엔진 단위 테스트 (경계 교차 탐색, 히스테리시스, 쿨다운)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from alerts import AlertEngine, _SortedRules, parse_rule  # noqa: E402
+
+
+def fired(engine, value, ts, exchange='upbit', symbol='BTC', metric='price'):
+    return [alert['rule'] for alert in engine.update(exchange, symbol, metric, value, ts)]
+
+
+class TestParseRule:
+    """규칙 파싱"""
+
+    def test_defaults(self):
+        rule = parse_rule('ETH < ₩4,000,000')
+        assert (rule.exchange, rule.symbol, rule.metric) == ('upbit', 'ETH', 'price')
+        assert not rule.above
+        assert rule.threshold == 4_000_000
+        assert rule.hysteresis == pytest.approx(4_000_000 * 0.005)
+
+    def test_percent_means_premium(self):
+        rule = parse_rule('XRP bithumb < -1% hysteresis=0.5 cooldown=600')
+        assert (rule.exchange, rule.metric, rule.threshold) == ('bithumb', 'premium', -1.0)
+        assert (rule.hysteresis, rule.cooldown) == (0.5, 600.0)
+
+    def test_unknown_option_rejected(self):
+        with pytest.raises(ValueError):
+            parse_rule('BTC > 100 cooldwn=5')
+
+    def test_binance_premium_rejected(self):
+        with pytest.raises(ValueError):
+            parse_rule('SOL binance premium > 3%')
+
+    def test_registered_adapters_accepted(self):
+        assert parse_rule('BTC coinone premium > 2%').exchange == 'coinone'
+        assert parse_rule('ETH korbit < 4000000').exchange == 'korbit'
+        assert parse_rule('SOL OKX price > $250').exchange == 'okx'
+        with pytest.raises(ValueError):
+            parse_rule('SOL okx premium > 3%')
+
+
+class TestSortedRules:
+    """이진 탐색 구간 경계"""
+
+    def setup_method(self):
+        self.rules = [parse_rule(f'BTC > {level}') for level in (10, 20, 30)]
+        self.index = _SortedRules([(rule.threshold, rule) for rule in self.rules])
+
+    def test_rising_includes_low_excludes_high(self):
+        assert self.index.between(10, 30, rising=True) == self.rules[:2]
+
+    def test_falling_excludes_low_includes_high(self):
+        assert self.index.between(10, 30, rising=False) == self.rules[1:]
+
+
+class TestAlertEngine:
+    """증분 평가"""
+
+    def test_only_crossed_thresholds_fire(self):
+        engine = AlertEngine([parse_rule(f'BTC > {level} hysteresis=1') for level in range(10, 101, 10)])
+        assert fired(engine, 25, 1000) == ['BTC > 10 hysteresis=1', 'BTC > 20 hysteresis=1']
+        assert fired(engine, 55, 2000) == [f'BTC > {level} hysteresis=1' for level in (30, 40, 50)]
+        assert fired(engine, 56, 3000) == []
+
+    def test_hysteresis_rearms_only_past_band(self):
+        engine = AlertEngine([parse_rule('BTC > 100 hysteresis=5 cooldown=0')])
+        assert fired(engine, 99, 0) == []
+        assert len(fired(engine, 101, 1)) == 1
+        # 재무장 경계(95)를 넘지 않고 다시 올라오면 발동하지 않음
+        fired(engine, 97, 2)
+        assert fired(engine, 101, 3) == []
+        fired(engine, 94, 4)
+        assert len(fired(engine, 101, 5)) == 1
+
+    def test_cooldown_suppresses_without_disarming(self):
+        rule = parse_rule('BTC > 100 hysteresis=1 cooldown=60')
+        engine = AlertEngine([rule])
+        fired(engine, 99, 0)
+        assert len(fired(engine, 101, 100)) == 1
+        fired(engine, 98, 110)
+        assert fired(engine, 101, 120) == []
+        assert rule.armed
+        fired(engine, 98, 130)
+        assert len(fired(engine, 101, 170)) == 1
+
+    def test_sustained_breach_fires_after_cooldown(self):
+        engine = AlertEngine([parse_rule('BTC > 100 hysteresis=1 cooldown=60')])
+        fired(engine, 99, 0)
+        assert len(fired(engine, 101, 100)) == 1
+        fired(engine, 98, 110)
+        # 쿨다운 중 교차 — 값이 계속 임계값 위에 있으면 쿨다운 후 첫 평가에서 발동
+        assert fired(engine, 101, 120) == []
+        assert fired(engine, 102, 130) == []
+        assert fired(engine, 103, 160) == ['BTC > 100 hysteresis=1 cooldown=60']
+        assert fired(engine, 104, 300) == []
+
+    def test_pending_dropped_when_condition_clears(self):
+        engine = AlertEngine([parse_rule('BTC > 100 hysteresis=1 cooldown=60')])
+        fired(engine, 99, 0)
+        fired(engine, 101, 100)
+        fired(engine, 98, 110)
+        fired(engine, 101, 120)
+        # 쿨다운 후 값이 임계값 아래면 발동하지 않음
+        assert fired(engine, 100, 170) == []
+        assert fired(engine, 100, 180) == []
+
+    def test_same_key_different_options_keep_separate_state(self, tmp_path):
+        state_path = str(tmp_path / 'rules.state.json')
+        texts = ['BTC > 100 hysteresis=1 cooldown=0', 'BTC > 100 hysteresis=1 cooldown=600']
+        engine = AlertEngine([parse_rule(text) for text in texts], state_path=state_path)
+        assert engine.rules[0].key != engine.rules[1].key
+        fired(engine, 99, 1000)
+        assert fired(engine, 101, 1010) == texts
+        fired(engine, 98, 1020)
+        assert fired(engine, 101, 1030) == texts[:1]
+        engine.save_state()
+
+        restored = AlertEngine([parse_rule(text) for text in texts], state_path=state_path)
+        assert [rule.last_fired for rule in restored.rules] == [1030, 1010]
+
+    def test_below_rule(self):
+        engine = AlertEngine([parse_rule('BTC upbit premium < -1% hysteresis=0.5 cooldown=0')])
+        assert fired(engine, 0.0, 0, metric='premium') == []
+        assert len(fired(engine, -1.5, 1, metric='premium')) == 1
+        fired(engine, -0.7, 2, metric='premium')
+        assert fired(engine, -1.2, 3, metric='premium') == []
+
+    def test_symbol_exchanges_include_binance_for_premium(self):
+        engine = AlertEngine([parse_rule('ZZZ bithumb price > 1'), parse_rule('QQQ upbit premium > 3%')])
+        assert engine.symbol_exchanges() == {'ZZZ': {'bithumb'}, 'QQQ': {'upbit', 'binance'}}
+
+    def test_state_round_trip(self, tmp_path):
+        state_path = str(tmp_path / 'rules.state.json')
+        engine = AlertEngine([parse_rule('BTC > 100 cooldown=60')], state_path=state_path)
+        fired(engine, 99, 0)
+        fired(engine, 101, 100)
+        engine.save_state()
+
+        restored = AlertEngine([parse_rule('BTC > 100 cooldown=60')], state_path=state_path)
+        assert not restored.rules[0].armed
+        assert restored.rules[0].last_fired == 100
+        assert fired(restored, 102, 200) == []
+
+    def test_pending_restored_from_state(self, tmp_path):
+        state_path = str(tmp_path / 'rules.state.json')
+        text = 'BTC > 100 hysteresis=1 cooldown=60'
+        engine = AlertEngine([parse_rule(text)], state_path=state_path)
+        fired(engine, 99, 0)
+        fired(engine, 101, 100)
+        fired(engine, 98, 110)
+        fired(engine, 101, 120)
+        engine.save_state()
+
+        restored = AlertEngine([parse_rule(text)], state_path=state_path)
+        assert fired(restored, 101, 170) == [text]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+캔들 백필 캐시 / 히스토리 시딩 단위 테스트
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from backfill import CandleCache, backfill, merge_ranges, seed_history, subtract_ranges  # noqa: E402
+from baseline import VolumeBaseline  # noqa: E402
+from exchanges import CANDLE_DTYPE  # noqa: E402
+from history import TickStore  # noqa: E402
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+BASE = 1_700_000_000 // DAY * DAY  # UTC 자정
+
+
+class FakeTracker:
+    usd_krw_rate = 1000.0
+
+    def __init__(self, *symbols, adapters=None):
+        self.symbols = {symbol: {} for symbol in symbols}
+        self.adapters = adapters or {}
+
+    def symbols_for(self, exchange):
+        return list(self.symbols)
+
+
+class FakeAdapter:
+    """캔들 조회 어댑터 — listed 코인만 상장, 페이지 조회 불가면 최근 recent 개만 반환"""
+
+    def __init__(self, name, listed, page_size=None, recent=None):
+        self.name = self.label = name
+        self.listed = set(listed)
+        self.candle_page_size = page_size
+        self.recent = recent
+        self.calls = []
+
+    def supports(self, method):
+        return True
+
+    def list_symbols(self):
+        return self.listed
+
+    def fetch_candles(self, symbol, interval, start, end):
+        self.calls.append((symbol, start, end))
+        ts = np.arange(start, end, HOUR)
+        if self.recent is not None:
+            ts = ts[len(ts) - self.recent:]
+        return candles(ts)
+
+
+def candles(ts, close=1.0, volume=1.0):
+    rows = np.zeros(len(ts), dtype=CANDLE_DTYPE)
+    rows['ts'] = ts
+    rows['close'] = close
+    rows['volume'] = volume
+    return rows
+
+
+def seeded_rows(tmp_path, interval, cache):
+    store = TickStore(str(tmp_path / 'history'))
+    seed_history(FakeTracker('BTC'), cache, interval, store)
+    return np.concatenate(list(store.iter_chunks()))
+
+
+class TestRanges:
+    """수집 구간 계산"""
+
+    def test_merge_touching_and_overlapping(self):
+        assert merge_ranges([(5, 10), (0, 5), (8, 12), (20, 20)]) == [(0, 12)]
+
+    def test_subtract(self):
+        assert subtract_ranges(0, 100, [(10, 20), (15, 30), (90, 120)]) == [(0, 10), (30, 90)]
+
+
+class TestSeedHistory:
+    """캔들 → 틱 히스토리/베이스라인 시딩"""
+
+    def test_only_full_24h_windows_are_seeded(self, tmp_path):
+        cache = CandleCache(str(tmp_path / 'candles'))
+        ts = np.arange(BASE, BASE + 48 * HOUR, HOUR)
+        cache.store('upbit', 'hour', 'BTC', candles(ts), [(BASE, BASE + 48 * HOUR)])
+
+        rows = seeded_rows(tmp_path, 'hour', cache)
+        assert rows.size == 25
+        assert (rows['volume_24h'] == 24).all()
+        assert rows['ts'][0] == BASE + 24 * HOUR
+
+    def test_window_is_cut_by_time_not_count(self, tmp_path):
+        # 거래 없는 시간은 캔들이 없음 — 24개 대신 실제 24시간 안의 캔들만 합산
+        cache = CandleCache(str(tmp_path / 'candles'))
+        ts = np.array([t for t in range(BASE, BASE + 48 * HOUR, HOUR) if (t - BASE) // HOUR % 2 == 0])
+        cache.store('upbit', 'hour', 'BTC', candles(ts), [])
+
+        rows = seeded_rows(tmp_path, 'hour', cache)
+        assert (rows['volume_24h'] == 12).all()
+
+    def test_baseline_sees_no_partial_sums(self, tmp_path):
+        cache = CandleCache(str(tmp_path / 'candles'))
+        ts = np.arange(BASE, BASE + 72 * HOUR, HOUR)
+        cache.store('upbit', 'hour', 'BTC', candles(ts, volume=10.0), [])
+
+        baseline = VolumeBaseline(str(tmp_path / 'baseline.json'))
+        seed_history(FakeTracker('BTC'), cache, 'hour', TickStore(str(tmp_path / 'history')), baseline)
+        mean, var, samples, _ = baseline.state['upbit:BTC']
+        assert mean == pytest.approx(240.0)
+        assert var == pytest.approx(0.0)
+
+    def test_day_candles_join_by_exchange_date(self, tmp_path):
+        cache = CandleCache(str(tmp_path / 'candles'))
+        days = BASE + np.arange(5) * DAY
+        cache.store('binance', 'day', 'BTC', candles(days, close=1.0), [])
+        # 빗썸 일봉은 KST 자정(UTC 15시) 시작
+        cache.store('bithumb', 'day', 'BTC', candles(days - 9 * HOUR, close=1100.0), [])
+        cache.store('upbit', 'day', 'BTC', candles(days, close=1200.0), [])
+
+        rows = seeded_rows(tmp_path, 'day', cache)
+        premium = {ex: rows['premium'][rows['exchange'] == ex.encode()] for ex in ('bithumb', 'upbit')}
+        assert premium['bithumb'] == pytest.approx([10.0] * 5)
+        assert premium['upbit'] == pytest.approx([20.0] * 5)
+
+
+class TestBackfill:
+    """캔들 요청 계획과 수집 구간 기록"""
+
+    def test_unpaged_exchange_covers_only_returned_candles(self, tmp_path):
+        cache = CandleCache(str(tmp_path / 'candles'))
+        bithumb = FakeAdapter('bithumb', {'BTC'}, page_size=None, recent=10)
+        tracker = FakeTracker('BTC', adapters={'bithumb': bithumb})
+        start, end = BASE, BASE + 48 * HOUR
+
+        assert backfill(tracker, 'hour', start, end, cache=cache) == {'bithumb': 10}
+        assert cache.coverage('bithumb', 'hour', 'BTC') == [(end - 10 * HOUR, end)]
+        # 오래된 구간은 다음 실행에서 다시 요청
+        assert cache.missing('bithumb', 'hour', 'BTC', start, end) == [(start, end - 10 * HOUR)]
+
+    def test_unpaged_empty_response_records_nothing(self, tmp_path):
+        cache = CandleCache(str(tmp_path / 'candles'))
+        bithumb = FakeAdapter('bithumb', {'BTC'}, page_size=None, recent=0)
+        backfill(FakeTracker('BTC', adapters={'bithumb': bithumb}), 'hour', BASE, BASE + DAY, cache=cache)
+        assert cache.coverage('bithumb', 'hour', 'BTC') == []
+
+    def test_paged_exchange_covers_requested_pages(self, tmp_path):
+        cache = CandleCache(str(tmp_path / 'candles'))
+        binance = FakeAdapter('binance', {'BTC'}, page_size=10)
+        backfill(FakeTracker('BTC', adapters={'binance': binance}), 'hour', BASE, BASE + DAY, cache=cache)
+        assert len(binance.calls) == 3
+        assert cache.coverage('binance', 'hour', 'BTC') == [(BASE, BASE + DAY)]
+
+    def test_unlisted_symbols_are_not_requested(self, tmp_path):
+        cache = CandleCache(str(tmp_path / 'candles'))
+        binance = FakeAdapter('binance', {'BTC'}, page_size=1000)
+        backfill(FakeTracker('BTC', 'NOTLISTED', adapters={'binance': binance}), 'hour',
+                 BASE, BASE + DAY, cache=cache)
+        assert {symbol for symbol, _, _ in binance.calls} == {'BTC'}
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+거래량 베이스라인 단위 테스트 (EWMA 감쇠, 급등 판정, 저장/복원)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from baseline import VolumeBaseline  # noqa: E402
+
+HOUR = 3600
+
+
+class TestObserve:
+    """EWMA 갱신"""
+
+    def test_first_observation_only_seeds(self):
+        baseline = VolumeBaseline(path=None)
+        assert baseline.observe('upbit', 'BTC', 100.0, ts=0) is None
+        assert baseline.state['upbit:BTC'] == [100.0, 0.0, 1, 0]
+
+    def test_one_halflife_moves_halfway(self):
+        baseline = VolumeBaseline(path=None, halflife=HOUR)
+        baseline.observe('upbit', 'BTC', 100.0, ts=0)
+        stats = baseline.observe('upbit', 'BTC', 300.0, ts=HOUR)
+        assert stats['baseline'] == 100.0
+        assert stats['ratio'] == pytest.approx(3.0)
+        mean, var, samples, last_ts = baseline.state['upbit:BTC']
+        assert mean == pytest.approx(200.0)
+        assert var == pytest.approx(0.5 * (0 + 200.0 * 100.0))
+        assert (samples, last_ts) == (2, HOUR)
+
+    def test_decay_depends_on_elapsed_time(self):
+        short, long_ = VolumeBaseline(path=None, halflife=HOUR), VolumeBaseline(path=None, halflife=HOUR)
+        for baseline, gap in ((short, HOUR / 10), (long_, 4 * HOUR)):
+            baseline.observe('upbit', 'BTC', 100.0, ts=0)
+            baseline.observe('upbit', 'BTC', 200.0, ts=gap)
+        assert short.state['upbit:BTC'][0] == pytest.approx(100.0 + 100.0 * (1 - 0.5 ** 0.1))
+        assert long_.state['upbit:BTC'][0] == pytest.approx(100.0 + 100.0 * (1 - 0.5 ** 4))
+
+    def test_same_tick_is_not_counted_twice(self):
+        baseline = VolumeBaseline(path=None)
+        baseline.observe('upbit', 'BTC', 100.0, ts=10)
+        assert baseline.observe('upbit', 'BTC', 500.0, ts=10) is None
+        assert baseline.state['upbit:BTC'][2] == 1
+
+
+class TestSurges:
+    """급등 판정"""
+
+    def test_requires_min_samples_and_ratio(self):
+        baseline = VolumeBaseline(path=None, min_samples=3)
+        observations = [
+            {'exchange': 'upbit', 'symbol': 'BTC', 'samples': 2, 'ratio': 10.0},
+            {'exchange': 'upbit', 'symbol': 'ETH', 'samples': 3, 'ratio': 1.5},
+            {'exchange': 'upbit', 'symbol': 'XRP', 'samples': 3, 'ratio': 2.5},
+        ]
+        assert [item['symbol'] for item in baseline.surges(observations, 2.0)] == ['XRP']
+
+    def test_snapshot_uses_ticker_timestamps(self):
+        baseline = VolumeBaseline(path=None)
+        data = {'upbit': {'BTC': {'volume_24h': 100.0, 'timestamp': 1.0}}, 'bithumb': {}}
+        assert baseline.observe_snapshot(data) == []
+        data['upbit']['BTC'] = {'volume_24h': 400.0, 'timestamp': 2.0}
+        (stats,) = baseline.observe_snapshot(data)
+        assert stats['ratio'] == pytest.approx(4.0)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / 'baseline.json')
+    baseline = VolumeBaseline(path=path)
+    baseline.observe('bithumb', 'ETH', 50.0, ts=0)
+    baseline.observe('bithumb', 'ETH', 70.0, ts=HOUR)
+    baseline.save()
+    assert VolumeBaseline(path=path).state == baseline.state
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+KoreanCryptoTracker 테스트 (원화 마켓 거래소별 테이블/시장 요약, 재생 서버 대상 조회 1회 json/ndjson 이벤트)
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import crypto  # noqa: E402
+from crypto import KoreanCryptoTracker  # noqa: E402
+from exchanges import ADAPTERS  # noqa: E402
+from replay import ReplayServer  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def replay_server():
+    with ReplayServer() as server:
+        yield server
+
+
+def ticker(exchange, price, change_rate):
+    return {'exchange': exchange, 'price': price, 'change_rate': change_rate,
+            'volume_24h': 10.0, 'trade_value_24h': 1e9}
+
+
+@pytest.fixture
+def tracker(replay_server):
+    return KoreanCryptoTracker(exchanges=['upbit', 'coinone', 'korbit', 'binance'],
+                               base_urls=replay_server.base_urls(list(ADAPTERS) + ['fx']))
+
+
+@pytest.fixture
+def data(tracker):
+    rate = tracker.usd_krw_rate
+    return {
+        'upbit': {'BTC': ticker('upbit', 101 * rate, 1.0), 'ETH': ticker('upbit', 2 * rate, -2.0)},
+        'coinone': {'BTC': ticker('coinone', 103 * rate, 5.0)},
+        'korbit': {},
+        'binance': {'BTC': {'price': 100.0}, 'ETH': {'price': 2.0}},
+        'usd_krw': rate,
+    }
+
+
+class TestKrwExchangeColumns:
+    """업비트/빗썸 고정이 아니라 활성 원화 거래소별 컬럼"""
+
+    def test_kimchi_premium_table(self, tracker, data, capsys):
+        tracker.display_kimchi_premium(data)
+        out = capsys.readouterr().out
+        for label in ('업비트', '코인원', '코빗'):
+            assert f'{label} 프리미엄' in out
+        assert '빗썸' not in out
+
+    def test_prices_table(self, tracker, data, capsys):
+        tracker.display_prices(data)
+        out = capsys.readouterr().out
+        assert '업비트 (Upbit)' in out and '코인원 (Coinone)' in out
+        assert '코빗 (Korbit)' not in out  # 시세가 없는 거래소는 생략
+
+    def test_market_summary_report(self, tracker, data):
+        report = tracker.market_summary_report(data)
+        assert report['counts'] == {'upbit': {'up': 1, 'down': 1}, 'coinone': {'up': 1, 'down': 0},
+                                    'korbit': {'up': 0, 'down': 0}}
+        assert report['top_gainers'][0] == {'symbol': 'BTC', 'exchange': 'coinone', 'change_rate': 5.0}
+        assert report['avg_premium'] == pytest.approx(0.5)
+        assert report['avg_premiums'] == {'upbit': pytest.approx(0.5), 'coinone': pytest.approx(3.0)}
+
+
+RULES = 'BTC upbit price > ₩1\nETH upbit premium > -100%\n'
+FULL_CYCLE = ['--kimchi-premium', '--record', '--zscore', '0', '--depth']
+
+
+class TestRunCycle:
+    """crypto.py 실행 1회 (--base-url 재생 서버) → stdout 이벤트
+
+    --zscore 는 틱 10개부터 계산하므로 먼저 --record 로 10회 기록한다.
+    --zscore 0 이면 z-score 를 계산한 시리즈가 전부 이상 변동으로 나온다.
+    """
+
+    @pytest.fixture
+    def run_tracker(self, replay_server, tmp_path, monkeypatch, capsys):
+        rules = tmp_path / 'rules.txt'
+        rules.write_text(RULES, encoding='utf-8')
+
+        def run(fmt, *flags):
+            argv = ['crypto.py', '--base-url', replay_server.url, '--format', fmt, '--rules', str(rules),
+                    '--history-dir', str(tmp_path / 'history'), '--baseline-path', str(tmp_path / 'baseline.json'),
+                    *flags]
+            monkeypatch.setattr(sys, 'argv', argv)
+            crypto.main()
+            return capsys.readouterr()
+
+        for _ in range(10):
+            run('ndjson', '--record')
+        return run
+
+    def test_ndjson(self, run_tracker):
+        out, err = run_tracker('ndjson', *FULL_CYCLE)
+        events = [json.loads(line) for line in out.splitlines()]
+        by_type = {}
+        for event in events:
+            by_type.setdefault(event['type'], []).append(event)
+        assert set(by_type) == {'kimchi_premium', 'executable_premium', 'premium_anomaly'}
+        assert all(isinstance(event['ts'], float) for event in events)
+        # 진행 메시지는 stderr 로만
+        assert '💾 히스토리 기록' in err
+
+        premium = by_type['kimchi_premium'][0]
+        assert {row['symbol'] for row in premium['rows']} >= {'BTC', 'ETH'}
+        assert by_type['executable_premium'][0]['orderbooks'] > 0
+        anomalies = by_type['premium_anomaly']
+        assert len(anomalies) == sum(len(row['premiums']) for row in premium['rows'])
+        assert {(a['samples'], a['threshold'], a['window']) for a in anomalies} == {(10, 0.0, 60)}
+        # 알림은 --record 기록 중 첫 조회에서 이미 발동 → 재무장 전까지 다시 알리지 않음
+        assert 'alert' not in by_type
+
+    def test_json_document(self, run_tracker, tmp_path):
+        (tmp_path / 'rules.txt.state.json').unlink()
+        out, _ = run_tracker('json', *FULL_CYCLE)
+        document = json.loads(out)
+        assert set(document) == {'kimchi_premium', 'alert', 'executable_premium', 'premium_anomaly'}
+        assert sorted(alert['rule'] for alert in document['alert']) == sorted(RULES.splitlines())
+        assert len(document['premium_anomaly']) == len(document['kimchi_premium']['rows']) * 2
+
+        out, _ = run_tracker('json', *FULL_CYCLE)
+        assert json.loads(out)['alert'] == []
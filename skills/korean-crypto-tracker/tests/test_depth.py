@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+호가 깊이 VWAP / 실거래 김치 프리미엄 단위 테스트
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from depth import executable_premiums, stack_side, vwap_for_notional  # noqa: E402
+from exchanges import make_side  # noqa: E402
+
+
+def book(asks, bids):
+    return {'asks': make_side(asks), 'bids': make_side(bids)}
+
+
+class TestVwapForNotional:
+    """주문 금액별 체결 VWAP"""
+
+    def setup_method(self):
+        # 코인 2개: 두 번째는 호가 1단계뿐
+        self.prices = np.array([[100.0, 110.0], [50.0, 0.0]])
+        self.qtys = np.array([[1.0, 1.0], [2.0, 0.0]])
+
+    def test_within_first_level(self):
+        vwap = vwap_for_notional(self.prices, self.qtys, [50])
+        assert vwap[0, 0] == pytest.approx(100.0)
+        assert vwap[0, 1] == pytest.approx(50.0)
+
+    def test_walks_into_second_level(self):
+        vwap = vwap_for_notional(self.prices, self.qtys, [150])
+        # 100 어치 @100 (1개) + 50 어치 @110
+        assert vwap[0, 0] == pytest.approx(150 / (1 + 50 / 110))
+
+    def test_insufficient_depth_is_nan(self):
+        vwap = vwap_for_notional(self.prices, self.qtys, [150, 300])
+        assert math.isnan(vwap[0, 1])  # 두 번째 코인은 100 어치뿐
+        assert math.isnan(vwap[1, 0])
+
+    def test_matches_level_by_level_walk(self):
+        rng = np.random.default_rng(1)
+        prices = np.sort(rng.uniform(90, 110, size=(3, 20)), axis=1)
+        qtys = rng.uniform(0.1, 2.0, size=(3, 20))
+        notionals = [10.0, 500.0, 1500.0]
+        vwap = vwap_for_notional(prices, qtys, notionals)
+        for j in range(3):
+            for i, notional in enumerate(notionals):
+                remaining, qty = notional, 0.0
+                for price, size in zip(prices[j], qtys[j]):
+                    take = min(remaining, price * size)
+                    qty += take / price
+                    remaining -= take
+                    if remaining <= 0:
+                        break
+                expected = notional / qty if remaining <= 1e-9 else float('nan')
+                assert vwap[i, j] == pytest.approx(expected, nan_ok=True)
+
+    def test_empty_book(self):
+        vwap = vwap_for_notional(np.zeros((2, 0)), np.zeros((2, 0)), [100])
+        assert vwap.shape == (1, 2)
+        assert np.isnan(vwap).all()
+
+
+class TestExecutablePremiums:
+    """국내/해외 호가 조합"""
+
+    def test_stack_side_pads_with_zero_qty(self):
+        books = {'A': book([(1, 1), (2, 1)], []), 'B': book([(5, 1)], [])}
+        prices, qtys = stack_side(books, ['A', 'B'], 'asks')
+        assert prices.shape == (2, 2)
+        assert qtys[1, 1] == 0
+
+    def test_premium_sign(self):
+        usd_krw = 1000.0
+        books = {
+            # 국내: 매수 110 USD 상당, 매도 105 USD 상당
+            'upbit': {'BTC': book([(110_000, 10)], [(105_000, 10)])},
+            'binance': {'BTC': book([(101, 10)], [(100, 10)])},
+        }
+        [result] = executable_premiums(books, usd_krw, [100_000])
+        size = result['sizes'][0]
+        assert size['ask_premium'] == pytest.approx((110 - 100) / 100 * 100)
+        assert size['bid_premium'] == pytest.approx((105 - 101) / 101 * 100)
+
+    def test_symbols_missing_abroad_are_skipped(self):
+        books = {
+            'upbit': {'BTC': book([(1, 1)], [(1, 1)]), 'ZZZ': book([(1, 1)], [(1, 1)])},
+            'binance': {'BTC': book([(1, 1)], [(1, 1)])},
+        }
+        assert [r['symbol'] for r in executable_premiums(books, 1.0, [0.5])] == ['BTC']
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+거래소 어댑터 / 동시 조회 스케줄러 단위 테스트 (타임아웃 전달, 진행 중 호출 제외, numpy 지연 import)
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from exchanges import ExchangeAdapter, FanOutScheduler, call_deadline  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class SlowSession:
+    """요청마다 delay 초(요청 타임아웃 이내) 대기 후 응답"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.timeouts = []
+
+    def get(self, url, params=None, timeout=None):
+        self.timeouts.append(timeout)
+        time.sleep(min(self.delay, timeout))
+        return FakeResponse({'price': 1.0})
+
+
+class PagedAdapter(ExchangeAdapter):
+    """시세 1회 조회에 요청 pages 건"""
+
+    name = 'upbit'
+    label = 'paged'
+    base_url = 'http://example.invalid'
+
+    def __init__(self, session, pages=10, timeout=0.3):
+        super().__init__(session)
+        self.pages = pages
+        self.timeout = timeout
+
+    def fetch_tickers(self, symbols):
+        for _ in range(self.pages):
+            self._get('/ticker')
+        return {'BTC': {'price': 1.0}}
+
+
+class BlockingAdapter(ExchangeAdapter):
+    """release 될 때까지 HTTP 요청 없이 멈춰 있는 호출"""
+
+    name = 'bithumb'
+    label = 'blocking'
+    timeout = 0.1
+
+    def __init__(self):
+        super().__init__(session=None)
+        self.release = threading.Event()
+        self.calls = 0
+
+    def fetch_tickers(self, symbols):
+        self.calls += 1
+        self.release.wait(5)
+        return {}
+
+
+class TestRequestTimeout:
+    """마감 시각 → 요청 타임아웃"""
+
+    def test_no_deadline_uses_adapter_timeout(self):
+        adapter = PagedAdapter(SlowSession(0), timeout=7)
+        assert adapter._request_timeout() == 7
+
+    def test_capped_by_remaining_time(self):
+        adapter = PagedAdapter(SlowSession(0), timeout=7)
+        with call_deadline(time.monotonic() + 1):
+            assert 0 < adapter._request_timeout() <= 1
+
+    def test_expired_deadline_raises(self):
+        adapter = PagedAdapter(SlowSession(0))
+        with call_deadline(time.monotonic() - 1):
+            with pytest.raises(TimeoutError):
+                adapter._get('/ticker')
+
+
+class TestFanOutScheduler:
+    """동시 조회"""
+
+    def test_timed_out_call_stops_issuing_requests(self):
+        session = SlowSession(0.1)
+        adapter = PagedAdapter(session, pages=20, timeout=0.25)
+        scheduler = FanOutScheduler({'upbit': adapter})
+        try:
+            started = time.monotonic()
+            assert scheduler.run('fetch_tickers', None) == {'upbit': {}}
+            scheduler.inflight['upbit'].exception(timeout=1)
+            assert time.monotonic() - started < 1
+            assert len(session.timeouts) < 20
+            assert all(timeout <= 0.25 for timeout in session.timeouts)
+        finally:
+            scheduler.close()
+
+    def test_fast_adapter_unaffected_by_slow_one(self):
+        fast = PagedAdapter(SlowSession(0), pages=1)
+        slow = BlockingAdapter()
+        scheduler = FanOutScheduler({'upbit': fast, 'bithumb': slow})
+        try:
+            results = scheduler.run('fetch_tickers', None)
+            assert results == {'upbit': {'BTC': {'price': 1.0}}, 'bithumb': {}}
+        finally:
+            slow.release.set()
+            scheduler.close()
+
+    def test_call_still_running_is_not_resubmitted(self):
+        slow = BlockingAdapter()
+        scheduler = FanOutScheduler({'bithumb': slow}, workers=1)
+        try:
+            for _ in range(3):
+                assert scheduler.run('fetch_tickers', None) == {'bithumb': {}}
+            assert slow.calls == 1
+            slow.release.set()
+            scheduler.inflight['bithumb'].result(timeout=1)
+            slow.release.clear()
+            scheduler.run('fetch_tickers', None)
+            assert slow.calls == 2
+        finally:
+            slow.release.set()
+            scheduler.close()
+
+
+def test_numpy_is_imported_only_for_books_and_candles():
+    scripts = os.path.join(os.path.dirname(__file__), '..', 'scripts')
+    code = (
+        "import sys\n"
+        "import crypto\n"
+        "assert 'numpy' not in sys.modules\n"
+        "from exchanges import CANDLE_DTYPE, make_candles\n"
+        "assert make_candles([(0, 1, 2, 0.5, 1.5, 10)]).dtype == CANDLE_DTYPE\n"
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=scripts, check=True)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+틱 히스토리 저장소 단위 테스트 (청크 추가, 시리즈 꼬리 조회, z-score)
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from history import TICK_DTYPE, TickStore, premium_zscores  # noqa: E402
+
+
+def ticks(exchange, symbol, premiums, start=0):
+    return np.array([
+        (start + i, exchange.encode(), symbol.encode(), 100.0 + i, 1300.0, premium, 1.0)
+        for i, premium in enumerate(premiums)
+    ], dtype=TICK_DTYPE)
+
+
+class TestAppend:
+    """청크 파일 기록"""
+
+    def test_rolls_over_to_new_chunk(self, tmp_path):
+        store = TickStore(str(tmp_path), chunk_rows=4)
+        assert store.append(ticks('upbit', 'BTC', range(10))) == 10
+        sizes = [os.path.getsize(path) // TICK_DTYPE.itemsize for path in store.chunk_paths()]
+        assert sizes == [4, 4, 2]
+        assert len(store) == 10
+
+    def test_truncated_tail_is_dropped(self, tmp_path):
+        store = TickStore(str(tmp_path))
+        store.append(ticks('upbit', 'BTC', [1.0, 2.0]))
+        with open(store.chunk_paths()[-1], 'ab') as f:
+            f.write(b'\0' * 10)  # 기록 도중 중단된 레코드
+        store.append(ticks('upbit', 'BTC', [3.0], start=2))
+        assert len(store) == 3
+        tail = store.series_tail([('upbit', 'BTC')], 10)[('upbit', 'BTC')]
+        assert tail.tolist() == [1.0, 2.0, 3.0]
+
+    def test_snapshot_foreign_rows_have_nan_premium(self, tmp_path):
+        store = TickStore(str(tmp_path))
+        data = {
+            'usd_krw': 1300.0,
+            'upbit': {'BTC': {'price': 1.3e8, 'volume_24h': 10}},
+            'binance': {'BTC': {'price': 1e5, 'volume_24h': 20}},
+        }
+        assert store.append_snapshot(data, {('upbit', 'BTC'): 2.5}, ts=1.0) == 2
+        tails = store.series_tail([('upbit', 'BTC'), ('binance', 'BTC')], 1)
+        assert tails[('upbit', 'BTC')].tolist() == [2.5]
+        assert np.isnan(tails[('binance', 'BTC')][0])
+
+
+class TestSeriesTail:
+    """시리즈별 최근 값"""
+
+    def test_spans_chunks_oldest_first(self, tmp_path):
+        store = TickStore(str(tmp_path), chunk_rows=3)
+        rows = np.concatenate([ticks('upbit', 'BTC', [float(i)], start=i) for i in range(7)]
+                              + [ticks('bithumb', 'BTC', [99.0], start=7)])
+        store.append(rows)
+        tail = store.series_tail([('upbit', 'BTC')], 5)[('upbit', 'BTC')]
+        assert tail.tolist() == [2.0, 3.0, 4.0, 5.0, 6.0]
+
+    def test_other_field_and_missing_series(self, tmp_path):
+        store = TickStore(str(tmp_path))
+        store.append(ticks('upbit', 'ETH', [0.0, 0.0]))
+        tails = store.series_tail([('upbit', 'ETH'), ('upbit', 'XRP')], 5, field='price')
+        assert tails[('upbit', 'ETH')].tolist() == [100.0, 101.0]
+        assert tails[('upbit', 'XRP')].size == 0
+
+
+class TestZscores:
+    """프리미엄 z-score"""
+
+    def test_zscore_against_window(self, tmp_path):
+        store = TickStore(str(tmp_path))
+        store.append(ticks('upbit', 'BTC', [1.0, 3.0] * 10))
+        (result,) = premium_zscores(store, {('upbit', 'BTC'): 5.0}, window=20)
+        assert result['mean'] == pytest.approx(2.0)
+        assert result['std'] == pytest.approx(1.0)
+        assert result['zscore'] == pytest.approx(3.0)
+        assert result['samples'] == 20
+
+    def test_too_few_samples_skipped(self, tmp_path):
+        store = TickStore(str(tmp_path))
+        store.append(ticks('upbit', 'BTC', [1.0] * 5))
+        assert premium_zscores(store, {('upbit', 'BTC'): 2.0}) == []
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+HTTP 클라이언트 단위 테스트 (지터 백오프, 재시도, 요청 지표)
+"""
+
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from urllib3.util.retry import RequestHistory
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from net import HttpMetrics, JitterRetry, build_session, default_retry  # noqa: E402
+
+
+def retry_after(attempts, backoff_factor=1.0):
+    history = tuple(RequestHistory('GET', '/', None, 503, None) for _ in range(attempts))
+    return JitterRetry(total=10, backoff_factor=backoff_factor, history=history)
+
+
+class TestJitterRetry:
+    """지수 백오프 + 지터"""
+
+    def test_no_backoff_before_consecutive_errors(self):
+        assert retry_after(0).get_backoff_time() == 0
+        assert retry_after(1).get_backoff_time() == 0
+
+    def test_jitter_stays_within_band(self, monkeypatch):
+        retry = retry_after(3)
+        base = super(JitterRetry, retry).get_backoff_time()
+        assert base == pytest.approx(4.0)
+        monkeypatch.setattr('net.random.uniform', lambda low, high: low)
+        assert retry.get_backoff_time() == pytest.approx(base * (1 - JitterRetry.jitter))
+        monkeypatch.setattr('net.random.uniform', lambda low, high: high)
+        assert retry.get_backoff_time() == pytest.approx(base * (1 + JitterRetry.jitter))
+
+    def test_samples_are_spread(self):
+        retry = retry_after(3)
+        samples = {round(retry.get_backoff_time(), 6) for _ in range(20)}
+        assert len(samples) > 1
+        assert all(2.0 <= sample <= 6.0 for sample in samples)
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """처음 failures 번은 503, 이후 200"""
+
+    protocol_version = 'HTTP/1.1'
+    failures = 0
+    requests = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests += 1
+        status = 503 if cls.requests <= cls.failures else 200
+        body = json.dumps({'ok': status == 200}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    handler = type('Handler', (FlakyHandler,), {'failures': 2, 'requests': 0})
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{httpd.server_address[1]}', handler
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+class TestSession:
+    """재시도 + 지표"""
+
+    def test_retries_5xx_and_records_metrics(self, server):
+        url, handler = server
+        metrics = HttpMetrics()
+        session = build_session(metrics, retry=default_retry(backoff_factor=0))
+        response = session.get(f'{url}/v1/ticker', timeout=5)
+        assert response.status_code == 200
+        assert handler.requests == 3
+
+        (row,) = metrics.summary()
+        assert row['endpoint'].endswith('/v1/ticker')
+        assert (row['requests'], row['retries'], row['errors']) == (1, 2, 0)
+
+    def test_keep_alive_reuses_connection(self, server):
+        url, handler = server
+        handler.failures = 0
+        metrics = HttpMetrics()
+        session = build_session(metrics)
+        for _ in range(3):
+            session.get(f'{url}/v1/ticker', timeout=5).content
+        (row,) = metrics.summary()
+        assert row['requests'] == 3
+        assert row['new_connections'] == 1
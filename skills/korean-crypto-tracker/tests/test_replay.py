@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+재생 서버 단위 테스트 (녹화 fixture 정합성, 합성 코인, 경로별 응답)
+"""
+
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import replay  # noqa: E402
+from replay import RECORD_SYMBOLS, ReplayData  # noqa: E402
+
+EXTRA_MARKETS = [
+    {'market': 'KRW-NOTREC', 'korean_name': 'x', 'english_name': 'x'},
+    {'market': 'BTC-ETH', 'korean_name': 'y', 'english_name': 'y'},
+]
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path):
+    """실제 market/all 처럼 시세가 녹화되지 않은 마켓이 섞인 fixture"""
+    target = tmp_path / 'fixtures'
+    shutil.copytree(replay.FIXTURES_DIR, target)
+    path = target / 'upbit_market_all.json'
+    markets = json.loads(path.read_text(encoding='utf-8'))
+    path.write_text(json.dumps(markets + EXTRA_MARKETS), encoding='utf-8')
+    return str(target)
+
+
+def tickers(data, symbols):
+    return data.respond('/upbit/v1/ticker', {'markets': [','.join(f'KRW-{s}' for s in symbols)]})
+
+
+class TestReplayData:
+    """fixture → 응답"""
+
+    def test_symbols_only_from_recorded_tickers(self, fixtures_dir):
+        data = ReplayData(fixtures_dir)
+        assert sorted(data.symbols) == sorted(RECORD_SYMBOLS)
+        status, body = data.respond('/upbit/v1/market/all', {})
+        assert status == 200
+        assert {m['market'] for m in body} == {f'KRW-{s}' for s in RECORD_SYMBOLS}
+
+    def test_synthetic_universe_answers_every_market(self, fixtures_dir):
+        data = ReplayData(fixtures_dir, coins=40)
+        assert len(data.symbols) == 40
+        status, body = tickers(data, data.symbols)
+        assert status == 200
+        assert len(body) == 40
+        status, _ = data.respond('/binance/api/v3/depth', {'symbol': [f'{data.symbols[-1]}USDT']})
+        assert status == 200
+
+    def test_unknown_market_fails_whole_batch(self, fixtures_dir):
+        status, _ = tickers(ReplayData(fixtures_dir), ['BTC', 'NOTREC'])
+        assert status == 404
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """녹화 대상 URL → 저장된 fixture (market/all 에는 추가 마켓)"""
+
+    def get(self, url, params=None, timeout=None):
+        if url.endswith('/v1/market/all'):
+            return FakeResponse(replay.load_fixture('upbit_market_all.json') + EXTRA_MARKETS)
+        if '/api/v3/depth' in url:
+            return FakeResponse(replay.load_fixture('binance_depth.json')[params['symbol']])
+        for name, template in replay.RECORDINGS.items():
+            if url.split('?')[0] == template.split('?')[0]:
+                return FakeResponse(replay.load_fixture(name))
+        raise AssertionError(url)
+
+
+def test_record_keeps_only_recorded_markets(tmp_path, monkeypatch, capsys):
+    import net
+
+    monkeypatch.setattr(net, 'build_session', lambda: FakeSession())
+    replay.record(str(tmp_path))
+    markets = json.loads((tmp_path / 'upbit_market_all.json').read_text(encoding='utf-8'))
+    assert {m['market'] for m in markets} == {f'KRW-{s}' for s in RECORD_SYMBOLS}
+    assert sorted(ReplayData(str(tmp_path), coins=20).symbols[:len(RECORD_SYMBOLS)]) == sorted(RECORD_SYMBOLS)
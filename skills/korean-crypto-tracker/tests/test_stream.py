@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+이벤트 스트림 단위 테스트 (ndjson 한 줄 출력, JSON 문서 모드, NaN/numpy 직렬화)
+"""
+
+import io
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import stream  # noqa: E402
+from stream import EventWriter, dumps  # noqa: E402
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    """orjson 유무와 관계없이 같은 출력"""
+    if request.param == 'orjson':
+        if stream.orjson is None:
+            pytest.skip('orjson 미설치')
+    else:
+        monkeypatch.setattr(stream, 'orjson', None)
+    return request.param
+
+
+class TestDumps:
+    """직렬화"""
+
+    def test_nan_and_numpy_values(self, backend):
+        value = {'premium': float('nan'), 'volume': np.float64(1.5), 'series': np.array([1.0, np.inf])}
+        assert json.loads(dumps(value)) == {'premium': None, 'volume': 1.5, 'series': [1.0, None]}
+
+    def test_compact_unless_pretty(self, backend):
+        assert b'\n' not in dumps({'a': [1, 2], 'b': '한글'})
+        assert json.loads(dumps({'a': [1, 2]}, pretty=True)) == {'a': [1, 2]}
+        assert b'\n' in dumps({'a': [1, 2]}, pretty=True)
+
+
+class TestEventWriter:
+    """ndjson / JSON 문서"""
+
+    def test_ndjson_writes_one_line_per_event(self):
+        out = io.StringIO()
+        writer = EventWriter(out)
+        writer.emit('premium', {'symbol': 'BTC', 'premium': 2.5}, ts=10.0)
+        writer.emit_many('alert', [{'rule': 'a', 'ts': 11.0}, {'rule': 'b', 'ts': 12.0}], ts_key='ts')
+        writer.flush()
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert lines == [
+            {'type': 'premium', 'ts': 10.0, 'symbol': 'BTC', 'premium': 2.5},
+            {'type': 'alert', 'ts': 11.0, 'rule': 'a'},
+            {'type': 'alert', 'ts': 12.0, 'rule': 'b'},
+        ]
+
+    def test_document_collects_until_flush(self):
+        out = io.StringIO()
+        writer = EventWriter(out, document=True)
+        writer.emit('premium', {'BTC': 2.5})
+        writer.emit_many('alert', [{'rule': 'a'}])
+        assert out.getvalue() == ''
+        writer.flush()
+        assert json.loads(out.getvalue()) == {'premium': {'BTC': 2.5}, 'alert': [{'rule': 'a'}]}
+
+    def test_document_prices_only_keeps_legacy_shape(self):
+        out = io.StringIO()
+        writer = EventWriter(out, document=True)
+        writer.emit('prices', {'upbit': {'BTC': 1.0}, 'usd_krw': 1400.0})
+        writer.flush()
+        writer.flush()
+        assert json.loads(out.getvalue()) == {'upbit': {'BTC': 1.0}, 'usd_krw': 1400.0}